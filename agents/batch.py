@@ -0,0 +1,152 @@
+"""
+Parallel execution of many curation requests
+"""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+import logging
+import math
+import statistics
+import time
+
+from schemas.state_schemas import BatchReport, BatchResult
+
+logger = logging.getLogger(__name__)
+
+BatchRequest = Union[str, Dict[str, Any]]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values (0.0 for an empty list)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def execute_request(agent, index: int, request: BatchRequest, quota: Optional[Dict[str, Any]] = None) -> BatchResult:
+    """
+    Run one batch request on an agent, capturing its outcome and latency
+
+    Args:
+        agent: NewsGathererAgent that executes the request
+        index: Position of the request in the batch
+        request: User request, as a string or a dict with user_request and
+            optionally top_articles and edition
+        quota: The batch's own token bucket per provider, applied on top of the shared ones
+    """
+    from clients import rate_limit
+
+    if isinstance(request, str):
+        request = {"user_request": request}
+
+    start = time.perf_counter()
+    try:
+        # Batch runs yield provider quota to interactive requests
+        with rate_limit.priority(rate_limit.BATCH), rate_limit.scoped_quota(quota):
+            state = agent.run(request["user_request"], top_articles=request.get("top_articles"),
+                              edition=request.get("edition"))
+        error = state.get("error")
+    except Exception as e:
+        logger.error(f"Batch request #{index} failed: {str(e)}")
+        state, error = None, str(e)
+
+    return {
+        "index": index,
+        "user_request": request["user_request"],
+        "state": state,
+        "error": error,
+        "latency_seconds": time.perf_counter() - start
+    }
+
+
+class BatchRun:
+    """
+    Iterable over the results of a batch, yielded as each workflow finishes
+
+    Requests are submitted lazily so at most max_concurrency workflows are
+    in flight; call report() once iteration is done for latency percentiles
+    and throughput.
+    """
+
+    def __init__(
+            self,
+            agent,
+            requests: Iterable[BatchRequest],
+            max_concurrency: int,
+            rate_limit: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            agent: NewsGathererAgent that executes each request
+            requests: User requests, as strings or dicts with user_request and
+                optionally top_articles and edition
+            max_concurrency: Maximum workflows running at the same time
+            rate_limit: Requests per minute per provider for this batch alone,
+                enforced on top of the process-wide quotas
+        """
+        self.agent = agent
+        self.requests = requests
+        self.max_concurrency = max_concurrency
+        self.quota = None
+        if rate_limit:
+            from clients.rate_limit import PROVIDERS, TokenBucket
+
+            unknown = set(rate_limit) - set(PROVIDERS)
+            if unknown:
+                raise ValueError(f"Unknown provider(s): {', '.join(sorted(unknown))}")
+            self.quota = {provider: TokenBucket.per_minute(requests_per_minute)
+                          for provider, requests_per_minute in rate_limit.items() if requests_per_minute}
+        self.results: List[BatchResult] = []
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def _execute(self, index: int, request: BatchRequest) -> BatchResult:
+        return execute_request(self.agent, index, request, self.quota)
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        self._started = time.perf_counter()
+        pending = iter(enumerate(self.requests))
+        in_flight: set = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="batch") as pool:
+            def submit_next() -> bool:
+                item = next(pending, None)
+                if item is None:
+                    return False
+                in_flight.add(pool.submit(self._execute, *item))
+                return True
+
+            while len(in_flight) < self.max_concurrency and submit_next():
+                pass
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.discard(future)
+                    result = future.result()
+                    self.results.append(result)
+                    submit_next()
+                    yield result
+
+        self._finished = time.perf_counter()
+
+    def report(self) -> BatchReport:
+        """Throughput and latency summary of the results seen so far"""
+        latencies = [r["latency_seconds"] for r in self.results]
+        failed = sum(1 for r in self.results if r["error"] or r["state"] is None)
+        end = self._finished or time.perf_counter()
+        wall = end - self._started if self._started else 0.0
+
+        return {
+            "total": len(self.results),
+            "completed": len(self.results) - failed,
+            "failed": failed,
+            "wall_seconds": wall,
+            "throughput_per_second": len(self.results) / wall if wall else 0.0,
+            "latency_mean": statistics.mean(latencies) if latencies else 0.0,
+            "latency_p50": percentile(latencies, 50),
+            "latency_p95": percentile(latencies, 95),
+            "latency_p99": percentile(latencies, 99),
+            "latency_max": max(latencies, default=0.0)
+        }
@@ -0,0 +1,161 @@
+"""
+Compaction of the conversation sent to the LLM on every agent step
+"""
+from typing import Any, Dict, List, Optional
+import json
+import logging
+
+from tools.dedup import article_id
+from tools.payload import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Characters kept of a superseded tool result that is not a fetch payload (e.g. an error)
+SUPERSEDED_TEXT_CHARS = 300
+
+
+def message_tokens(message: Any) -> int:
+    """Estimated prompt tokens of one message, including the arguments of its tool calls"""
+    content = message.content if isinstance(message.content, str) else json.dumps(message.content)
+    tokens = estimate_tokens(content) + 4
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        tokens += estimate_tokens(json.dumps(tool_call.get("args", {}))) + 8
+    return tokens
+
+
+def _load(content: Any) -> Optional[Dict[str, Any]]:
+    if not isinstance(content, str):
+        return None
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _article_rows(payload: Dict[str, Any]) -> List[Any]:
+    """Articles of a fetch payload as a list, whether encoded as objects or TSV rows"""
+    articles = payload.get("articles") or []
+    if isinstance(articles, str):
+        return [row for row in articles.split("\n") if row]
+    return list(articles)
+
+
+def _set_article_rows(payload: Dict[str, Any], rows: List[Any]) -> None:
+    payload["articles"] = "\n".join(rows) if isinstance(payload.get("articles"), str) else rows
+
+
+def _dumps(payload: Dict[str, Any]) -> str:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+class ConversationCompactor:
+    """
+    Keeps the conversation inside a token budget before each agent step
+
+    Tool results of earlier rounds are superseded by the latest round: they
+    are reduced to a summary with article ids and titles, so the agent still
+    knows what it already saw. The latest round stays in full; if the
+    conversation is still over budget, its lowest-ranked articles are
+    dropped (payloads are ordered best first by the rank node).
+    """
+
+    def __init__(self, token_budget: int = 0):
+        """
+        Args:
+            token_budget: Prompt tokens allowed per agent step (0 = only supersede old rounds)
+        """
+        self.token_budget = token_budget
+
+    @staticmethod
+    def summarize(content: Any) -> str:
+        """Compact stand-in for a superseded tool result"""
+        payload = _load(content)
+        if payload is None:
+            text = content if isinstance(content, str) else json.dumps(content)
+            return text[:SUPERSEDED_TEXT_CHARS]
+        if payload.get("superseded") or payload.get("status") != "success":
+            return content
+
+        articles = []
+        columns = payload.get("columns")
+        for row in _article_rows(payload):
+            if isinstance(row, str):
+                # TSV row: recover title and link by column
+                cells = dict(zip(columns or [], row.split("\t")))
+            else:
+                cells = row
+            # Keep the id the agent was shown: it is the key of fetched_articles,
+            # and recomputing it fails when PAYLOAD_FIELDS leaves out the link
+            articles.append({"id": cells.get("id") or article_id(cells), "title": cells.get("title")})
+
+        return _dumps({
+            "status": "success",
+            "superseded": True,
+            "count": len(articles),
+            "query_params": payload.get("query_params"),
+            "articles": articles,
+        })
+
+    def _trim(self, message: Any, max_tokens: int) -> bool:
+        """Drop trailing articles of a fetch result until it fits max_tokens; False if it cannot"""
+        payload = _load(message.content)
+        if payload is None or payload.get("status") != "success":
+            return False
+
+        rows = _article_rows(payload)
+        omitted = payload.get("omitted", 0)
+        while rows and message_tokens(message) > max_tokens:
+            rows.pop()
+            omitted += 1
+            _set_article_rows(payload, rows)
+            payload["count"] = len(rows)
+            payload["omitted"] = omitted
+            message.content = _dumps(payload)
+        return message_tokens(message) <= max_tokens
+
+    def compact(self, messages: List[Any], fixed_tokens: int = 0) -> Dict[str, Any]:
+        """
+        Compact messages in place
+
+        Args:
+            messages: Conversation (LangChain messages) as kept in the workflow state
+            fixed_tokens: Tokens sent with every step outside messages (the system prompt)
+
+        Returns:
+            Token counts before and after, and how many results were superseded or trimmed
+        """
+        from langchain_core.messages import ToolMessage
+
+        before = fixed_tokens + sum(message_tokens(m) for m in messages)
+
+        # Tool results after the last agent message are the latest round
+        latest_start = len(messages)
+        while latest_start > 0 and isinstance(messages[latest_start - 1], ToolMessage):
+            latest_start -= 1
+
+        superseded = 0
+        for message in messages[:latest_start]:
+            if isinstance(message, ToolMessage):
+                summary = self.summarize(message.content)
+                if summary != message.content:
+                    message.content = summary
+                    superseded += 1
+
+        trimmed = 0
+        total = fixed_tokens + sum(message_tokens(m) for m in messages)
+        latest = messages[latest_start:]
+        if self.token_budget and total > self.token_budget and latest:
+            # Share what the rest of the conversation leaves between the latest results
+            others = total - sum(message_tokens(m) for m in latest)
+            share = max(0, self.token_budget - others) // len(latest)
+            for message in latest:
+                if message_tokens(message) > share:
+                    self._trim(message, share)
+                    trimmed += 1
+            total = fixed_tokens + sum(message_tokens(m) for m in messages)
+            if total > self.token_budget:
+                logger.warning(f"Conversation still needs ~{total} tokens after compaction "
+                               f"(budget {self.token_budget})")
+
+        return {"tokens_before": before, "tokens_after": total, "superseded": superseded, "trimmed": trimmed}
@@ -1,32 +1,76 @@
-from langgraph.graph import StateGraph, END
-from langgraph.prebuilt import ToolNode
-from langchain_groq import ChatGroq
-from langchain_core.messages import HumanMessage, SystemMessage, AIMessage
 from datetime import datetime
-import os
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List,
+                    Optional, Tuple, Union)
+import json
 import logging
+import time
+import uuid
 from pathlib import Path
 
-from config.settings import settings
-from prompts.news_gatherer_prompts import NewsGathererPrompts
-from tools.news_tools import NewsTools
-from schemas.state_schemas import NewsGathererState
+from agents.batch import BatchRun
+from agents.compaction import ConversationCompactor, message_tokens
+from clients import tracing
+from tools.payload import PayloadProjector
+from tools.ranking import ArticleRanker
+from schemas.state_schemas import Edition, NewsGathererState, StreamEvent
 
+# LangGraph, LangChain and the provider SDKs are imported where they are first
+# used, so importing this module stays cheap for CLIs and short-lived workers
+if TYPE_CHECKING:
+    from langchain_core.messages import AIMessage, ToolMessage
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+    from langgraph.graph import StateGraph
+    from langgraph.types import StateSnapshot
+
+    from clients.llm import LLMClientRegistry
 
-# logging
-logging.basicConfig(
-    level=settings.LOG_LEVEL,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Node boundaries, LLM tokens, tool events and the evolving state
+STREAM_MODES = ["tasks", "messages", "custom", "values"]
+
 
 class NewsGathererAgent:
-    def __init__(self):
-        """Initialize the agent with configuration"""
-        self.settings = settings
-        self.prompts = NewsGathererPrompts()
-        self.tools = [NewsTools.fetch_news]
+    def __init__(
+            self,
+            llm_clients: Optional["LLMClientRegistry"] = None,
+            checkpointer: Optional["BaseCheckpointSaver"] = None
+    ):
+        """
+        Initialize the agent with configuration
+
+        Args:
+            llm_clients: Registry of LLM clients to use (default: the process-wide registry)
+            checkpointer: Store for per-step checkpoints (default: the process-wide
+                SQLite store if CHECKPOINT_ENABLED, else none)
+        """
+        from agents.tool_node import ParallelToolNode
+        from clients.llm import llm_registry
+        from config.settings import configure_logging, get_settings
+        from prompts.news_gatherer_prompts import get_prompts
+        from tools.news_tools import NewsTools
+
+        configure_logging()
+        self.settings = get_settings()
+        self.prompts = get_prompts()
+        self.tools = [NewsTools.fetch_news, NewsTools.fetch_news_multi]
+        # The LLM may also end the run with its selection, which the graph reads instead of executing
+        self.llm_tools = self.tools + [NewsTools.select_articles]
+        self.llm_clients = llm_clients or llm_registry
+        self.ranker = ArticleRanker(recency_half_life_hours=self.settings.RANK_RECENCY_HALF_LIFE_HOURS)
+        self.projector = PayloadProjector.from_settings()
+        self.compactor = ConversationCompactor(token_budget=self.settings.CONTEXT_TOKEN_BUDGET)
+        self.tool_node = ParallelToolNode(
+            self.tools,
+            max_workers=self.settings.TOOL_MAX_WORKERS,
+            timeout=self.settings.TOOL_TIMEOUT_SECONDS
+        )
+        if checkpointer is None and self.settings.CHECKPOINT_ENABLED:
+            from clients.checkpoint import get_checkpointer
+
+            checkpointer = get_checkpointer()
+        self.checkpointer = checkpointer
         self.graph = self._build_graph()
         
 
@@ -35,36 +79,75 @@ class NewsGathererAgent:
         logger.info(f"NewsGathererAgent initialized")
         logger.info(f"Prompt version: {metadata.get('version')}")
 
+    def _prepare_messages(self, state: NewsGathererState) -> list:
+        """Prepend the system prompt to the conversation so far"""
+        from langchain_core.messages import SystemMessage
+
+        # The agent only sees the pre-ranked shortlist
+        max_articles = self.settings.MAX_ARTICLES_PER_FETCH
+        if self.settings.RANKING_ENABLED:
+            max_articles = min(max_articles, self.settings.RANK_TOP_K)
+
+        # Load system prompt from YAML
+        system_prompt = self.prompts.get_system_prompt(
+            max_articles=max_articles,
+            top_articles=state["top_articles_count"]
+        )
+        return [SystemMessage(content=system_prompt)] + state["messages"]
+
+    def _record_response(self, state: NewsGathererState, response: "AIMessage") -> None:
+        """Track tool calls and append the LLM response to the conversation"""
+        from agents.selection import SELECT_TOOL
+
+        # tool_calls_count counts news lookups; the final select_articles call is not one
+        tool_calls = [call for call in getattr(response, "tool_calls", None) or [] if call["name"] != SELECT_TOOL]
+        if tool_calls:
+            state["tool_calls_count"] += len(tool_calls)
+            logger.info(f"Agent made {len(tool_calls)} tool call(s)")
+
+        # **CRITICAL: Add the response to messages**
+        state["messages"].append(response)
+
+    @staticmethod
+    def _record_usage(attributes: Dict[str, Any], response: "AIMessage") -> None:
+        """Token counts of an LLM response as span attributes"""
+        usage = getattr(response, "usage_metadata", None) or {}
+        attributes["prompt_tokens"] = usage.get("input_tokens")
+        attributes["completion_tokens"] = usage.get("output_tokens")
+        attributes["tool_calls"] = len(getattr(response, "tool_calls", None) or [])
+
     def _create_agent_node(self, state: NewsGathererState) -> NewsGathererState:
         """Main agent node that processes requests and analyzes results"""
         try:
-            llm = ChatGroq(
-                model=self.settings.LLM_MODEL,
-                api_key=os.getenv("GROQ_API_KEY"),
-                temperature=self.settings.LLM_TEMPERATURE,
-                max_tokens=self.settings.LLM_MAX_TOKENS
-            )
-            # Bind tools
-            llm_with_tools = llm.bind_tools(self.tools)
-
-            # Load system prompt from YAML
-            system_prompt = self.prompts.get_system_prompt(
-                max_articles=self.settings.MAX_ARTICLES_PER_FETCH,
-                top_articles=state["top_articles_count"]
-            )
-            messages = [SystemMessage(content=system_prompt)] + state["messages"]
+            # Shared client with tools already bound
+            llm_with_tools = self.llm_clients.get_llm_with_tools(self.llm_tools)
+            messages = self._prepare_messages(state)
 
             # Get LLM response
             logger.info("Invoking LLM for agent decision")
-            response = llm_with_tools.invoke(messages)
+            with tracing.span("llm.chat", kind="llm", model=self.settings.LLM_MODEL, cache_hit=False) as attrs:
+                response = llm_with_tools.invoke(messages)
+                self._record_usage(attrs, response)
+            self._record_response(state, response)
 
-            # Track tool calls
-            if hasattr(response, "tool_calls") and response.tool_calls:
-                state["tool_calls_count"] += len(response.tool_calls)
-                logger.info(f"Agent made {len(response.tool_calls)} tool call(s)")
-            
-            # **CRITICAL: Add the response to messages**
-            state["messages"].append(response)
+        except Exception as e:
+            logger.error(f"Error in agent node: {str(e)}")
+            state["status"] = "error"
+            state["error"] = str(e)
+
+        return state
+
+    async def _acreate_agent_node(self, state: NewsGathererState) -> NewsGathererState:
+        """Async agent node used by arun(), sharing the event loop's HTTP pool"""
+        try:
+            llm_with_tools = self.llm_clients.get_llm_with_tools(self.llm_tools)
+            messages = self._prepare_messages(state)
+
+            logger.info("Invoking LLM for agent decision (async)")
+            with tracing.span("llm.chat", kind="llm", model=self.settings.LLM_MODEL, cache_hit=False) as attrs:
+                response = await llm_with_tools.ainvoke(messages)
+                self._record_usage(attrs, response)
+            self._record_response(state, response)
 
         except Exception as e:
             logger.error(f"Error in agent node: {str(e)}")
@@ -77,29 +160,41 @@ class NewsGathererAgent:
         """
         Determine next step in workflow.
         
-        Important: tool_calls_count has already been incremented in _create_agent_node
-        before this function is called.
+        Important: the agent's response has already been appended to messages in
+        _create_agent_node before this function is called.
         """
+        from langchain_core.messages import AIMessage
+
+        from agents.selection import selection_call
 
         last_message = state["messages"][-1]
 
+        # The selection is the agent's final answer
+        if selection_call(last_message) is not None:
+            logger.info("✅ Workflow complete - agent submitted its selection")
+            return "end"
+
         # Check if agent wants to make tool calls
         has_tool_calls = hasattr(last_message, "tool_calls") and last_message.tool_calls
         
         if has_tool_calls:
-            # The count was already incremented, so if it's > 1, we're on attempt #2 or higher
-            # Allow first call (count=1) and one retry (count=2), but block beyond that
-            if state["tool_calls_count"] > 2:
+            # Tool calls of one message run in parallel, so the limit applies to tool steps:
+            # allow the first step and one retry, but block beyond that
+            tool_steps = sum(
+                1 for msg in state["messages"]
+                if isinstance(msg, AIMessage) and msg.tool_calls
+            )
+            if tool_steps > 2:
                 logger.warning(
-                    f"⚠️  Maximum tool calls exceeded (attempted {state['tool_calls_count']}, max 2). "
+                    f"⚠️  Maximum tool steps exceeded (attempted {tool_steps}, max 2). "
                     f"Forcing completion without executing tools."
                 )
                 return "end"
             
-            if state["tool_calls_count"] == 2:
-                logger.info(f"🔄 Executing retry attempt (call #{state['tool_calls_count']})")
+            if tool_steps == 2:
+                logger.info(f"🔄 Executing retry attempt (step #{tool_steps}, {len(last_message.tool_calls)} call(s))")
             else:
-                logger.info(f"🔧 Executing tool call #{state['tool_calls_count']}")
+                logger.info(f"🔧 Executing {len(last_message.tool_calls)} tool call(s)")
             
             return "tools"
 
@@ -107,10 +202,116 @@ class NewsGathererAgent:
         logger.info("✅ Workflow complete - agent finished analysis")
         return "end"
 
+    @staticmethod
+    def _latest_tool_messages(state: NewsGathererState) -> List["ToolMessage"]:
+        """Tool results produced since the last agent step"""
+        from langchain_core.messages import ToolMessage
+
+        messages = []
+        for msg in reversed(state["messages"]):
+            if not isinstance(msg, ToolMessage):
+                break
+            messages.append(msg)
+        return list(reversed(messages))
+
+    def _rank_results(self, state: NewsGathererState) -> NewsGathererState:
+        """Shortlist fetched articles locally and compact the tool results before the agent reads them"""
+        for message in self._latest_tool_messages(state):
+            try:
+                payload = json.loads(message.content)
+                if payload.get("status") != "success":
+                    continue
+
+                params = payload.get("query_params", {})
+                candidates = payload.get("articles", [])
+
+                # Incremental editions only pass on articles earlier runs have not covered
+                previously_seen = 0
+                if state.get("edition"):
+                    fresh = self._unseen(state["edition"], candidates)
+                    previously_seen = len(candidates) - len(fresh)
+                    candidates = fresh
+
+                articles = candidates
+
+                if self.settings.RANKING_ENABLED:
+                    # fetch_news_multi reports one parameter set per query variant
+                    variants = params if isinstance(params, list) else [params]
+                    query = " ".join([state["user_request"]] + [v.get("q", "") for v in variants])
+                    articles = self.ranker.rank(candidates, query, self.settings.RANK_TOP_K)
+                    logger.info(f"Pre-ranked {len(candidates)} articles, passing top {len(articles)} to the agent")
+
+                message.content = self.projector.render(articles, params, candidates=len(candidates),
+                                                        previously_seen=previously_seen)
+
+                # Keep what the agent was shown, so its selection can refer to articles by id;
+                # articles past the payload's token budget were not
+                shown = articles[:json.loads(message.content)["count"]]
+                fetched = state.setdefault("fetched_articles", {})
+                for article in shown:
+                    fetched[article["id"]] = article
+
+            except Exception as e:
+                # Leave the raw tool result in place rather than failing the run
+                logger.error(f"Error ranking tool results: {str(e)}")
+
+        return state
+
+    @staticmethod
+    def _unseen(edition: Edition, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Articles the edition has not covered yet, counting the rest as skipped"""
+        from tools.seen_index import get_seen_index
+
+        fresh = get_seen_index().unseen(edition["name"], articles)
+        skipped = len(articles) - len(fresh)
+        if skipped:
+            edition["skipped"] += skipped
+            tracing.annotate(previously_seen=skipped)
+            logger.info(f"📰 Skipped {skipped} of {len(articles)} articles covered by earlier editions")
+        return fresh
+
+    def _run_tools(self, state: NewsGathererState) -> NewsGathererState:
+        """Execute the agent's tool calls, within the edition's time window if the run has one"""
+        from tools.news_tools import published_since
+
+        with published_since((state.get("edition") or {}).get("since")):
+            return self.tool_node.invoke(state)
+
+    async def _arun_tools(self, state: NewsGathererState) -> NewsGathererState:
+        """Async variant of _run_tools"""
+        from tools.news_tools import published_since
+
+        with published_since((state.get("edition") or {}).get("since")):
+            return await self.tool_node.ainvoke(state)
+
+    def _compact_history(self, state: NewsGathererState) -> NewsGathererState:
+        """Summarize superseded tool results and fit the next agent step into the token budget"""
+        if not self.settings.COMPACTION_ENABLED:
+            return state
+
+        try:
+            system_tokens = message_tokens(self._prepare_messages(state)[0])
+            stats = self.compactor.compact(state["messages"], fixed_tokens=system_tokens)
+            tracing.annotate(**stats)
+            if stats["superseded"] or stats["trimmed"]:
+                logger.info(f"🗜️  Compacted conversation: ~{stats['tokens_before']} -> ~{stats['tokens_after']} tokens "
+                            f"({stats['superseded']} superseded, {stats['trimmed']} trimmed)")
+        except Exception as e:
+            # An uncompacted conversation is still a valid one
+            logger.error(f"Error compacting conversation: {str(e)}")
+
+        return state
+
     def _extract_results(self, state: NewsGathererState) -> NewsGathererState:
-        """Extract final results from agent's analysis"""
+        """Link the agent's selection to the fetched articles, or accept its prose answer if it found nothing"""
+        from langchain_core.messages import AIMessage
+
+        from agents.selection import link_selection, selection_call
 
         try:
+            last_ai = next((msg for msg in reversed(state["messages"]) if isinstance(msg, AIMessage)), None)
+            selection = selection_call(last_ai)
+
             # Find the final AI message (after tool use)
             final_message = None
             for msg in reversed(state["messages"]):
@@ -122,9 +323,19 @@ class NewsGathererAgent:
                             final_message = msg
                             break
 
-            if final_message:
+            if selection is not None:
+                state["final_articles"] = link_selection(
+                    selection["args"],
+                    state.get("fetched_articles") or {},
+                    limit=state["top_articles_count"]
+                )
                 state["status"] = "completed"
-                logger.info("✅ Results extracted successfully! Newsletter curation complete.")
+                logger.info(f"✅ Results extracted successfully! {len(state['final_articles'])} article(s) selected.")
+            elif final_message:
+                # No selection: the agent reported that nothing worth curating was found
+                state["final_articles"] = []
+                state["status"] = "completed"
+                logger.info("✅ Agent finished without a selection")
             else:
                 state["status"] = "incomplete"
                 logger.warning("⚠️  No final message found - agent may not have completed analysis")
@@ -136,16 +347,80 @@ class NewsGathererAgent:
             state["status"] = "error"
             state["error"] = str(e)
 
+        if state["status"] == "completed" and state.get("edition"):
+            self._finish_edition(state)
+
         return state
 
-    def _build_graph(self) -> StateGraph:
+    def _start_edition(self, name: str) -> Edition:
+        """Open a run of a recurring edition, fetching only what was published since its last run"""
+        from tools.seen_index import get_seen_index
+
+        since = get_seen_index().last_run(name)
+        if since is not None:
+            since -= self.settings.EDITION_WINDOW_OVERLAP_MINUTES * 60
+            logger.info(f"📰 Edition {name!r}: fetching articles published since "
+                        f"{datetime.fromtimestamp(since).isoformat(timespec='minutes')}")
+        else:
+            logger.info(f"📰 Edition {name!r}: first run, fetching without a time window")
+        return {"name": name, "since": since, "started_at": time.time(), "skipped": 0}
+
+    @staticmethod
+    def _finish_edition(state: NewsGathererState) -> None:
+        """
+        Remember the articles the run selected, so later editions skip them
+
+        Only the selection counts as covered: articles the agent was not shown
+        (cut by the payload budget or by compaction) or passed over stay
+        eligible for the next edition instead of being lost.
+        """
+        from tools.seen_index import get_seen_index
+
+        edition = state["edition"]
+        try:
+            articles = state.get("final_articles") or []
+            get_seen_index().record(edition["name"], edition["started_at"], articles)
+            logger.info(f"📰 Edition {edition['name']!r}: recorded {len(articles)} covered article(s)")
+        except Exception as e:
+            # The curated result stands; the next run just sees a wider window
+            logger.error(f"Error recording edition {edition['name']!r}: {str(e)}")
+
+    @staticmethod
+    def _traced_node(
+            name: str,
+            func: Callable[[NewsGathererState], NewsGathererState],
+            afunc: Optional[Callable[[NewsGathererState], Awaitable[NewsGathererState]]] = None
+    ) -> "RunnableLambda":
+        """
+        Graph node that records a node.<name> span, with the LLM, tool and HTTP
+        spans opened inside it as children, into state["spans"]
+        """
+        from langchain_core.runnables import RunnableLambda
+
+        def traced(state: NewsGathererState) -> NewsGathererState:
+            with tracing.trace(state.setdefault("spans", []), state.setdefault("trace_id", tracing.new_trace_id())):
+                with tracing.span(f"node.{name}", kind="node"):
+                    return func(state)
+
+        async def atraced(state: NewsGathererState) -> NewsGathererState:
+            with tracing.trace(state.setdefault("spans", []), state.setdefault("trace_id", tracing.new_trace_id())):
+                with tracing.span(f"node.{name}", kind="node"):
+                    return await afunc(state)
+
+        return RunnableLambda(traced, afunc=atraced if afunc else None, name=name)
+
+    def _build_graph(self) -> "StateGraph":
         """ Build the Langgraph workflow"""
+        from langgraph.graph import StateGraph, END
+
         workflow = StateGraph(NewsGathererState)
 
         # Add nodes
-        workflow.add_node("agent", self._create_agent_node)
-        workflow.add_node("tools", ToolNode(self.tools))
-        workflow.add_node("extract_results", self._extract_results)
+        workflow.add_node("agent", self._traced_node("agent", self._create_agent_node, self._acreate_agent_node))
+        workflow.add_node("tools", self._traced_node("tools", self._run_tools, self._arun_tools))
+        workflow.add_node("rank", self._traced_node("rank", self._rank_results))
+        workflow.add_node("compact", self._traced_node("compact", self._compact_history))
+        workflow.add_node("extract_results", self._traced_node("extract_results", self._extract_results))
         
         # Set entry point
         workflow.set_entry_point("agent")
@@ -160,28 +435,23 @@ class NewsGathererAgent:
             }
         )
         
-        # Add edge from tools back to agent (only once!)
-        workflow.add_edge("tools", "agent")
+        # Shortlist tool results and compact the history, then back to agent (only once!)
+        workflow.add_edge("tools", "rank")
+        workflow.add_edge("rank", "compact")
+        workflow.add_edge("compact", "agent")
         
         # Add final edge
         workflow.add_edge("extract_results", END)
         
         # Compile
         logger.info("LangGraph workflow compiled")
-        return workflow.compile()
+        return workflow.compile(checkpointer=self.checkpointer)
     
-    def run(self, user_request: str, top_articles: int = None) -> NewsGathererState:
-        """
-        Execute the news gathering workflow
-        
-        Args:
-            user_request: Natural language description of news to fetch
-            top_articles: Number of articles to select (default: from settings)
-        
-        Returns:
-            Final state with agent's analysis and selections
-        """
-        
+    def _initial_state(self, user_request: str, top_articles: Optional[int],
+                       thread_id: Optional[str] = None, edition: Optional[str] = None) -> NewsGathererState:
+        """Build the starting state for a workflow run"""
+        from langchain_core.messages import HumanMessage
+
         if top_articles is None:
             top_articles = self.settings.TOP_ARTICLES_TO_SELECT
         
@@ -192,26 +462,259 @@ class NewsGathererAgent:
         )
         
         # Initialize state
-        initial_state = {
+        return {
             "messages": [HumanMessage(content=user_prompt)],
             "user_request": user_request,
             "top_articles_count": top_articles,
+            "fetched_articles": {},
             "final_articles": None,
             "status": "initialized",
             "timestamp": datetime.now().isoformat(),
             "tool_calls_count": 0,
-            "error": None
+            "tool_timings": [],
+            "error": None,
+            "trace_id": tracing.new_trace_id(),
+            "spans": [],
+            "thread_id": thread_id,
+            "edition": self._start_edition(edition) if edition else None
         }
+
+    def _thread_config(self, thread_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Graph config of a checkpointed run, under a new thread if none is given"""
+        if self.checkpointer is None:
+            if thread_id:
+                logger.warning(f"Checkpointing is disabled, run {thread_id} cannot be resumed")
+            return None
+        return {"configurable": {"thread_id": thread_id or uuid.uuid4().hex}}
+
+    @staticmethod
+    def _run_options(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Store every checkpoint before the next step starts: nodes update the state in place"""
+        return {"durability": "sync"} if config else {}
+
+    def _graph_input(
+            self,
+            user_request: str,
+            top_articles: Optional[int],
+            config: Optional[Dict[str, Any]],
+            snapshot: Optional["StateSnapshot"],
+            edition: Optional[str] = None
+    ) -> Tuple[Optional[NewsGathererState], NewsGathererState]:
+        """
+        Input to run the graph with, and the state the run starts from
+
+        A thread already holding a run of the same request continues it: with
+        None as input LangGraph resumes after the last completed node, or just
+        returns the final state if the run had finished.
+        """
+        thread_id = config["configurable"]["thread_id"] if config else None
+        if snapshot is not None and snapshot.values and snapshot.values.get("user_request") == user_request:
+            if snapshot.next:
+                logger.info(f"♻️  Resuming run {thread_id} at: {', '.join(snapshot.next)}")
+            else:
+                logger.info(f"♻️  Run {thread_id} already finished, returning its final state")
+            return None, snapshot.values
+
+        state = self._initial_state(user_request, top_articles, thread_id, edition)
+        return state, state
+
+    def run(self, user_request: str, top_articles: int = None, thread_id: Optional[str] = None,
+            edition: Optional[str] = None) -> NewsGathererState:
+        """
+        Execute the news gathering workflow
+        
+        Args:
+            user_request: Natural language description of news to fetch
+            top_articles: Number of articles to select (default: from settings)
+            thread_id: Checkpoint thread of the run; passing the thread of an
+                interrupted run resumes it after its last completed node
+            edition: Name of the recurring edition this run belongs to, e.g.
+                "hourly-ai". Its runs only fetch articles published since the
+                previous one and skip articles an earlier run already covered.
+        
+        Returns:
+            Final state with agent's analysis and selections
+        """
+        config = self._thread_config(thread_id)
+        snapshot = self.graph.get_state(config) if config else None
+        initial_state, _ = self._graph_input(user_request, top_articles, config, snapshot, edition)
         
         logger.info(f"Starting workflow for request: {user_request[:100]}...")
         
         # Execute workflow
-        final_state = self.graph.invoke(initial_state)
+        final_state = self.graph.invoke(initial_state, config, **self._run_options(config))
         
         logger.info(f"Workflow completed with status: {final_state['status']}")
         
         return final_state
 
+    async def arun(self, user_request: str, top_articles: int = None,
+                   thread_id: Optional[str] = None, edition: Optional[str] = None) -> NewsGathererState:
+        """
+        Execute the news gathering workflow without blocking the event loop
+
+        LLM calls and news fetches go through the running loop's shared HTTP
+        pool, so many workflows can be awaited concurrently on one loop.
+
+        Args:
+            user_request: Natural language description of news to fetch
+            top_articles: Number of articles to select (default: from settings)
+            thread_id: Checkpoint thread of the run (see run)
+            edition: Recurring edition the run belongs to (see run)
+
+        Returns:
+            Final state with agent's analysis and selections
+        """
+        config = self._thread_config(thread_id)
+        snapshot = await self.graph.aget_state(config) if config else None
+        initial_state, _ = self._graph_input(user_request, top_articles, config, snapshot, edition)
+
+        logger.info(f"Starting async workflow for request: {user_request[:100]}...")
+
+        final_state = await self.graph.ainvoke(initial_state, config, **self._run_options(config))
+
+        logger.info(f"Workflow completed with status: {final_state['status']}")
+
+        return final_state
+
+
+    def _stream_events(self, mode: str, chunk: Any, run: Dict[str, Any]) -> List[StreamEvent]:
+        """Translate one LangGraph stream chunk into stream() events"""
+        from langchain_core.messages import AIMessage, AIMessageChunk
+
+        from agents.selection import SelectionStream, selection_call
+
+        if mode == "custom":
+            # tool_start / tool_end from the tool node
+            return [chunk]
+
+        if mode == "values":
+            run["state"] = chunk
+            return []
+
+        if mode == "messages":
+            message, metadata = chunk
+            if not isinstance(message, AIMessageChunk):
+                return []
+            node = metadata.get("langgraph_node")
+            if message.tool_call_chunks and run.get("selection") is not None:
+                # Selected articles, each as soon as its part of the call is complete
+                return [{"type": "article", "node": node, "article": article}
+                        for article in run["selection"].feed(message.tool_call_chunks)]
+            if message.content:
+                run["tokens"] += 1
+                return [{"type": "token", "node": node, "content": message.content}]
+            return []
+
+        # tasks: a node was entered or has finished
+        if "result" not in chunk:
+            run["tokens"] = 0
+            if chunk["name"] == "agent":
+                state = run["state"]
+                run["selection"] = SelectionStream(state.get("fetched_articles") or {}, state.get("top_articles_count"))
+            return [{"type": "node", "node": chunk["name"]}]
+
+        result = chunk.get("result") or {}
+        if chunk["name"] != "agent" or not isinstance(result, dict) or not result.get("messages"):
+            return []
+        message = result["messages"][-1]
+
+        # The rest of the selection, or all of it if the response was not streamed (cache hit)
+        selection = selection_call(message)
+        if selection is not None and run.get("selection") is not None:
+            return [{"type": "article", "node": "agent", "article": article}
+                    for article in run["selection"].finish(selection["args"])]
+
+        # A cached response arrives without tokens; hand it over in one piece
+        if not run["tokens"] and isinstance(message, AIMessage) and not message.tool_calls and message.content:
+            return [{"type": "token", "node": "agent", "content": message.content}]
+        return []
+
+    def stream(self, user_request: str, top_articles: int = None,
+               thread_id: Optional[str] = None, edition: Optional[str] = None) -> Iterator[StreamEvent]:
+        """
+        Execute the news gathering workflow, yielding progress as it happens
+
+        Example:
+            for event in agent.stream("AI news"):
+                if event["type"] == "token":
+                    print(event["content"], end="", flush=True)
+
+        Args:
+            user_request: Natural language description of news to fetch
+            top_articles: Number of articles to select (default: from settings)
+            thread_id: Checkpoint thread of the run (see run)
+            edition: Recurring edition the run belongs to (see run)
+
+        Yields:
+            StreamEvent dicts: "node" when a graph node is entered, "tool_start" /
+            "tool_end" around every tool call, "token" for each piece of LLM text as
+            it is generated, "article" for each selected article as soon as the agent
+            has generated it, and finally "done" with the final state
+        """
+        config = self._thread_config(thread_id)
+        snapshot = self.graph.get_state(config) if config else None
+        initial_state, state = self._graph_input(user_request, top_articles, config, snapshot, edition)
+        run = {"tokens": 0, "state": state}
+
+        logger.info(f"Starting streamed workflow for request: {user_request[:100]}...")
+
+        for mode, chunk in self.graph.stream(initial_state, config, stream_mode=STREAM_MODES,
+                                            **self._run_options(config)):
+            yield from self._stream_events(mode, chunk, run)
+
+        logger.info(f"Workflow completed with status: {run['state']['status']}")
+        yield {"type": "done", "state": run["state"]}
+
+    async def astream(self, user_request: str, top_articles: int = None,
+                      thread_id: Optional[str] = None, edition: Optional[str] = None) -> AsyncIterator[StreamEvent]:
+        """Async variant of stream() on the running event loop (see arun)"""
+        config = self._thread_config(thread_id)
+        snapshot = await self.graph.aget_state(config) if config else None
+        initial_state, state = self._graph_input(user_request, top_articles, config, snapshot, edition)
+        run = {"tokens": 0, "state": state}
+
+        logger.info(f"Starting streamed async workflow for request: {user_request[:100]}...")
+
+        async for mode, chunk in self.graph.astream(initial_state, config, stream_mode=STREAM_MODES,
+                                                    **self._run_options(config)):
+            for event in self._stream_events(mode, chunk, run):
+                yield event
+
+        logger.info(f"Workflow completed with status: {run['state']['status']}")
+        yield {"type": "done", "state": run["state"]}
+
+    def run_batch(
+            self,
+            requests: Iterable[Union[str, Dict[str, Any]]],
+            max_concurrency: Optional[int] = None,
+            rate_limit: Optional[Dict[str, float]] = None
+    ) -> BatchRun:
+        """
+        Execute many news gathering workflows in parallel
+
+        Example:
+            batch = agent.run_batch(["AI news", "Climate policy"], max_concurrency=8)
+            for result in batch:
+                print_results(result["state"])
+            print(batch.report())
+
+        Args:
+            requests: User requests, as strings or dicts with user_request and
+                optionally top_articles and edition
+            max_concurrency: Workflows in flight at once (default: from settings)
+            rate_limit: Requests per minute per provider for this batch alone, e.g.
+                {"groq": 30, "newsdata": 30}, on top of the process-wide quotas
+
+        Returns:
+            BatchRun yielding results as each workflow finishes
+        """
+        return BatchRun(
+            self,
+            requests,
+            max_concurrency=max_concurrency or self.settings.BATCH_MAX_CONCURRENCY,
+            rate_limit=rate_limit
+        )
 
     def visualize_graph(self, output_path: str = "workflow_graph.png", auto_open: bool = False) -> None:
         """
@@ -0,0 +1,148 @@
+"""
+The agent's final select_articles call, parsed and linked to the fetched articles
+"""
+from typing import Any, Dict, List, Optional, Set
+import logging
+
+from pydantic import ValidationError
+
+from schemas.output_schemas import ArticleSelection, SelectedArticle
+from schemas.state_schemas import FinalArticle
+
+logger = logging.getLogger(__name__)
+
+SELECT_TOOL = "select_articles"
+
+
+def selection_call(message: Any) -> Optional[Dict[str, Any]]:
+    """The select_articles tool call of an AI message, if it made one"""
+    for tool_call in getattr(message, "tool_calls", None) or []:
+        if tool_call["name"] == SELECT_TOOL:
+            return tool_call
+    return None
+
+
+class SelectionLinker:
+    """
+    Turns selected ids into final articles, one item at a time
+
+    Items are linked in the order the agent ranked them; ids that were never
+    fetched and repeated ids are dropped, and linking stops at the requested
+    number of articles.
+    """
+
+    def __init__(self, fetched: Dict[str, Dict[str, Any]], limit: Optional[int] = None):
+        """
+        Args:
+            fetched: Articles shown to the agent, by id
+            limit: Articles to keep at most (None keeps all)
+        """
+        self.fetched = fetched
+        self.limit = limit
+        self.linked: List[FinalArticle] = []
+        self._seen: Set[str] = set()
+
+    def link(self, item: Any) -> Optional[FinalArticle]:
+        """The final article for one selection item, or None if it is dropped"""
+        try:
+            selected = SelectedArticle.model_validate(item)
+        except ValidationError as e:
+            logger.warning(f"Ignoring malformed selection item {item!r}: {e.error_count()} error(s)")
+            return None
+
+        if selected.id in self._seen or (self.limit is not None and len(self.linked) >= self.limit):
+            return None
+        self._seen.add(selected.id)
+
+        article = self.fetched.get(selected.id)
+        if article is None:
+            logger.warning(f"Agent selected unknown article id {selected.id}")
+            return None
+
+        final: FinalArticle = {"rank": len(self.linked) + 1, "reason": selected.reason, **article}
+        self.linked.append(final)
+        return final
+
+
+def link_selection(
+        args: Dict[str, Any],
+        fetched: Dict[str, Dict[str, Any]],
+        limit: Optional[int] = None
+) -> List[FinalArticle]:
+    """
+    Final articles of a complete select_articles call
+
+    A call that does not match ArticleSelection is not discarded: every
+    item of its articles list that validates on its own is still linked, as
+    the streamed path does.
+    """
+    try:
+        items = ArticleSelection.model_validate(args).articles
+    except ValidationError as e:
+        logger.warning(f"Malformed {SELECT_TOOL} call ({e.error_count()} error(s)), linking its valid items")
+        items = args.get("articles") if isinstance(args, dict) else None
+        if not isinstance(items, list):
+            items = []
+
+    linker = SelectionLinker(fetched, limit)
+    for item in items:
+        linker.link(item)
+    return linker.linked
+
+
+class SelectionStream:
+    """
+    Incremental parser of a streamed select_articles call
+
+    Tool call arguments arrive as JSON fragments. After every fragment the
+    buffer is parsed as partial JSON; an item of the articles list counts as
+    complete once the next one has started, so each selected article is
+    linked and handed out while the rest of the selection is still being
+    generated.
+    """
+
+    def __init__(self, fetched: Dict[str, Dict[str, Any]], limit: Optional[int] = None):
+        self.linker = SelectionLinker(fetched, limit)
+        self.args = ""
+        self.started = False
+        self.index: Optional[int] = None
+        self.consumed = 0
+
+    def feed(self, tool_call_chunks: List[Dict[str, Any]]) -> List[FinalArticle]:
+        """Final articles completed by these tool call chunks"""
+        from langchain_core.utils.json import parse_partial_json
+
+        for chunk in tool_call_chunks:
+            # Only the first chunk of a call carries its name; later ones share its index
+            if chunk.get("name") == SELECT_TOOL:
+                self.started = True
+                self.index = chunk.get("index")
+            elif not self.started or chunk.get("name") or chunk.get("index") != self.index:
+                continue
+            self.args += chunk.get("args") or ""
+
+        if not self.args:
+            return []
+        try:
+            partial = parse_partial_json(self.args)
+        except ValueError:
+            return []
+        items = partial.get("articles") if isinstance(partial, dict) else None
+        if not isinstance(items, list):
+            return []
+        # The last item may still be streaming
+        return self._consume(items[:-1])
+
+    def finish(self, args: Dict[str, Any]) -> List[FinalArticle]:
+        """Final articles of the complete call not handed out yet"""
+        items = args.get("articles")
+        return self._consume(items if isinstance(items, list) else [])
+
+    def _consume(self, items: List[Any]) -> List[FinalArticle]:
+        linked = []
+        for item in items[self.consumed:]:
+            final = self.linker.link(item)
+            if final is not None:
+                linked.append(final)
+        self.consumed = max(self.consumed, len(items))
+        return linked
@@ -0,0 +1,241 @@
+"""
+Graph node that executes every tool call of an agent message concurrently
+"""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.config import get_stream_writer
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import asyncio
+import contextvars
+import json
+import logging
+import time
+
+from clients import tracing
+from schemas.state_schemas import NewsGathererState, StreamEvent, ToolTiming
+
+logger = logging.getLogger(__name__)
+
+
+def _error_content(tool_name: str, error: str, error_type: str) -> str:
+    """Tool result in the same shape fetch_news reports its own failures"""
+    return json.dumps({
+        "status": "error",
+        "error": error,
+        "error_type": error_type,
+        "tool": tool_name
+    })
+
+
+def _stream_writer() -> Callable[[Any], None]:
+    """The graph's custom stream writer, or a no-op outside a graph run"""
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
+def _tool_event(
+        kind: str,
+        tool_call: Dict[str, Any],
+        status: Optional[str] = None,
+        seconds: Optional[float] = None
+) -> StreamEvent:
+    """tool_start / tool_end event for NewsGathererAgent.stream()"""
+    event: StreamEvent = {"type": kind, "tool": tool_call["name"], "tool_call_id": tool_call["id"]}
+    if kind == "tool_start":
+        event["args"] = tool_call["args"]
+    else:
+        event["status"] = status
+        event["seconds"] = seconds
+    return event
+
+
+class ParallelToolNode:
+    """
+    Runs all tool calls of the latest AIMessage at once
+
+    Unlike langgraph's ToolNode, results are appended to the conversation in
+    place (NewsGathererState has no message reducer) in the order the calls
+    were made, and every call's wall time is recorded under tool_timings. A
+    step therefore takes as long as its slowest call rather than the sum of
+    all of them.
+    """
+
+    def __init__(self, tools: Sequence[BaseTool], max_workers: int = 4, timeout: Optional[float] = None):
+        """
+        Args:
+            tools: Tools the agent may call
+            max_workers: Tool calls of one message executed in parallel
+            timeout: Seconds a call may take once it starts running (None waits indefinitely)
+        """
+        self.tools = {tool.name: tool for tool in tools}
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    @staticmethod
+    def _tool_calls(state: NewsGathererState) -> List[Dict[str, Any]]:
+        last_message = state["messages"][-1]
+        if not isinstance(last_message, AIMessage):
+            return []
+        return list(last_message.tool_calls or [])
+
+    def _unknown_tool(self, tool_call: Dict[str, Any]) -> str:
+        return _error_content(
+            tool_call["name"],
+            f"Unknown tool {tool_call['name']!r} (available: {', '.join(self.tools)})",
+            "ValueError"
+        )
+
+    def _record(
+            self,
+            state: NewsGathererState,
+            tool_calls: List[Dict[str, Any]],
+            results: List[tuple],
+            started: float
+    ) -> NewsGathererState:
+        """Append results in call order and log the step's timing"""
+        timings: List[ToolTiming] = []
+        for tool_call, (content, status, seconds) in zip(tool_calls, results):
+            state["messages"].append(ToolMessage(
+                content=content,
+                name=tool_call["name"],
+                tool_call_id=tool_call["id"],
+                status="error" if status != "success" else "success"
+            ))
+            timings.append({
+                "tool": tool_call["name"],
+                "tool_call_id": tool_call["id"],
+                "status": status,
+                "seconds": seconds
+            })
+
+        state.setdefault("tool_timings", []).extend(timings)
+
+        wall = time.perf_counter() - started
+        if len(timings) > 1:
+            logger.info(
+                f"Ran {len(timings)} tool calls in {wall:.2f}s "
+                f"(slowest {max(t['seconds'] for t in timings):.2f}s, sum {sum(t['seconds'] for t in timings):.2f}s)"
+            )
+        return state
+
+    def _next_deadline(self, pending: set, futures: Dict[Any, int], call_started: Dict[int, float]) -> Optional[float]:
+        """Seconds until the earliest running call times out, polling while some are still queued"""
+        if self.timeout is None:
+            return None
+        now = time.perf_counter()
+        running = [call_started[futures[f]] + self.timeout - now for f in pending if futures[f] in call_started]
+        remaining = max(0.0, min(running)) if running else self.timeout
+        if len(running) < len(pending):
+            remaining = min(remaining, 0.05)
+        return remaining
+
+    def invoke(self, state: NewsGathererState) -> NewsGathererState:
+        """Execute the pending tool calls on the worker pool"""
+        tool_calls = self._tool_calls(state)
+        emit = _stream_writer()
+        started = time.perf_counter()
+
+        # When each call left the queue: with more calls than workers, a call's
+        # timeout starts when it does, not with the step
+        call_started: Dict[int, float] = {}
+
+        def run(i: int, tool_call: Dict[str, Any]) -> tuple:
+            call_started[i] = time.perf_counter()
+            with tracing.span(f"tool.{tool_call['name']}", kind="tool", tool_call_id=tool_call["id"]) as attrs:
+                try:
+                    content = self.tools[tool_call["name"]].invoke(tool_call["args"])
+                    status = "success"
+                except Exception as e:
+                    logger.error(f"Tool {tool_call['name']} failed: {str(e)}")
+                    content = _error_content(tool_call["name"], str(e), type(e).__name__)
+                    status = "error"
+                attrs["status"] = status
+            return str(content), status, time.perf_counter() - call_started[i]
+
+        # A pool per step: concurrent runs of the agent do not queue behind each
+        # other's calls, and a timed-out call only keeps its own thread busy
+        runnable = sum(1 for tool_call in tool_calls if tool_call["name"] in self.tools)
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, runnable)),
+                                      thread_name_prefix="tool-call")
+        results: List[Optional[tuple]] = [None] * len(tool_calls)
+        futures = {}
+        for i, tool_call in enumerate(tool_calls):
+            emit(_tool_event("tool_start", tool_call))
+            if tool_call["name"] in self.tools:
+                # Each call gets its own copy of the context so its spans nest under this node
+                futures[executor.submit(contextvars.copy_context().run, run, i, tool_call)] = i
+            else:
+                results[i] = (self._unknown_tool(tool_call), "error", 0.0)
+                emit(_tool_event("tool_end", tool_call, "error", 0.0))
+
+        # Report each call as it finishes; results keep the call order
+        pending = set(futures)
+        try:
+            while pending:
+                wait(pending, timeout=self._next_deadline(pending, futures, call_started), return_when=FIRST_COMPLETED)
+                now = time.perf_counter()
+                for future in list(pending):
+                    i = futures[future]
+                    if future.done():
+                        results[i] = future.result()
+                    elif self.timeout is not None and i in call_started and now - call_started[i] >= self.timeout:
+                        # The worker finishes in the background; the agent moves on without it
+                        tool_call = tool_calls[i]
+                        logger.warning(f"Tool {tool_call['name']} timed out after {self.timeout}s")
+                        message = f"{tool_call['name']} timed out after {self.timeout} seconds"
+                        results[i] = (_error_content(tool_call["name"], message, "TimeoutError"), "timeout", self.timeout)
+                    else:
+                        continue
+                    pending.discard(future)
+                    emit(_tool_event("tool_end", tool_calls[i], results[i][1], results[i][2]))
+        finally:
+            # Calls still queued when the step is abandoned never start; timed-out
+            # ones finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return self._record(state, tool_calls, results, started)
+
+    async def ainvoke(self, state: NewsGathererState) -> NewsGathererState:
+        """Execute the pending tool calls concurrently on the event loop"""
+        tool_calls = self._tool_calls(state)
+        emit = _stream_writer()
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run(tool_call: Dict[str, Any]) -> tuple:
+            with tracing.span(f"tool.{tool_call['name']}", kind="tool", tool_call_id=tool_call["id"]) as attrs:
+                # As in invoke(), a call's timeout starts once it has a slot
+                async with semaphore:
+                    content, status, seconds = await execute(tool_call)
+                attrs["status"] = status
+            emit(_tool_event("tool_end", tool_call, status, seconds))
+            return content, status, seconds
+
+        async def execute(tool_call: Dict[str, Any]) -> tuple:
+            if tool_call["name"] not in self.tools:
+                return self._unknown_tool(tool_call), "error", 0.0
+
+            call_started = time.perf_counter()
+            try:
+                content = await asyncio.wait_for(
+                    self.tools[tool_call["name"]].ainvoke(tool_call["args"]), timeout=self.timeout
+                )
+                status = "success"
+            except asyncio.TimeoutError:
+                logger.warning(f"Tool {tool_call['name']} timed out after {self.timeout}s")
+                message = f"{tool_call['name']} timed out after {self.timeout} seconds"
+                content = _error_content(tool_call["name"], message, "TimeoutError")
+                status = "timeout"
+            except Exception as e:
+                logger.error(f"Tool {tool_call['name']} failed: {str(e)}")
+                content = _error_content(tool_call["name"], str(e), type(e).__name__)
+                status = "error"
+            return str(content), status, time.perf_counter() - call_started
+
+        for tool_call in tool_calls:
+            emit(_tool_event("tool_start", tool_call))
+        results = await asyncio.gather(*(run(tool_call) for tool_call in tool_calls))
+        return self._record(state, tool_calls, list(results), started)
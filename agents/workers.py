@@ -0,0 +1,292 @@
+"""
+Pre-fork pool of worker processes for curation runs
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import importlib
+import itertools
+import logging
+import multiprocessing
+import os
+import pickle
+import queue
+import threading
+import time
+
+from agents.batch import BatchRequest, BatchRun, execute_request
+from schemas.state_schemas import BatchResult
+
+logger = logging.getLogger(__name__)
+
+# Imported by the parent before it forks, so every worker starts with them loaded
+PRELOAD_MODULES = (
+    "httpx",
+    "langchain_core.messages",
+    "langchain_groq",
+    "langgraph.graph",
+    "agents.news_gatherer",
+    "agents.selection",
+    "agents.tool_node",
+    "clients.llm",
+    "tools.news_tools",
+)
+
+
+def _preload() -> None:
+    """Import the workflow's dependencies and load settings and prompts, without opening clients or threads"""
+    from config.settings import get_settings
+    from prompts.news_gatherer_prompts import get_prompts
+
+    for name in PRELOAD_MODULES:
+        importlib.import_module(name)
+    get_settings()
+    get_prompts()
+
+
+def _worker_main(tasks: Any, results: Any, abandoned: Any, threads: int, quotas: Dict[str, Optional[float]]) -> None:
+    """
+    Entry point of a worker process
+
+    Applies the worker's share of the provider quotas, builds one agent (and
+    with it the process's HTTP pools and cache connections) and runs tasks on
+    `threads` threads until each of them receives the None sentinel. Tasks
+    of batches up to `abandoned` are dropped without running.
+    """
+    from agents.news_gatherer import NewsGathererAgent
+    from clients import rate_limit
+
+    for provider, requests_per_minute in quotas.items():
+        rate_limit.set_rate_limit(provider, requests_per_minute)
+
+    agent = NewsGathererAgent()
+
+    def serve() -> None:
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            batch, index, request = task
+            if batch <= abandoned.value:
+                continue
+            result = execute_request(agent, index, request)
+            try:
+                payload = pickle.dumps(result)
+            except Exception as e:
+                logger.error(f"Result of request #{index} cannot be sent to the parent: {str(e)}")
+                payload = pickle.dumps({**result, "state": None, "error": f"Unpicklable result: {str(e)}"})
+            results.put((batch, payload))
+
+    with ThreadPoolExecutor(max_workers=threads, thread_name_prefix="worker") as pool:
+        for _ in range(threads):
+            pool.submit(serve)
+
+
+class WorkerPool:
+    """
+    Spreads curation runs over pre-forked worker processes
+
+    One process is limited by the GIL: JSON handling, prompt building and
+    LangGraph's own overhead all compete for the same core. The pool's
+    parent imports the workflow's dependencies once and then forks, so
+    workers share those pages copy-on-write and start without import cost;
+    each builds its own agent, HTTP pools and SQLite connections after the
+    fork.
+
+    Workers share the news and LLM caches (and the checkpoint store and
+    seen-article index) through their SQLite files: an entry cached by one
+    worker is a hit for every other, read through a memory map of the OS
+    page cache (CACHE_MMAP_MB) rather than held once per process. Only the
+    small in-memory LRU tiers are per worker.
+
+    Provider rate limits are enforced per process, so each worker gets an
+    equal share of GROQ_REQUESTS_PER_MINUTE and NEWSDATA_REQUESTS_PER_MINUTE
+    and the pool as a whole stays within the quotas. The split is static: a
+    worker cannot use quota its idle neighbours leave over.
+
+    Create the pool before the parent builds any agent or client, and run
+    one batch at a time:
+
+        with WorkerPool(workers=4) as pool:
+            batch = pool.run_batch(["AI news", "Climate policy"])
+            for result in batch:
+                print(result["state"]["final_articles"])
+            print(batch.report())
+    """
+
+    def __init__(self, workers: Optional[int] = None, threads: Optional[int] = None):
+        """
+        Args:
+            workers: Worker processes (default: WORKER_PROCESSES, or one per CPU core)
+            threads: Runs each worker executes concurrently (default: WORKER_THREADS)
+        """
+        from config.settings import settings
+
+        self.workers = workers or settings.WORKER_PROCESSES or os.cpu_count() or 1
+        self.threads = threads or settings.WORKER_THREADS
+        self._processes: List[multiprocessing.Process] = []
+        self._tasks: Any = None
+        self._results: Any = None
+        self._abandoned: Any = None
+        self._batch_ids = itertools.count(1)
+        self._batch_lock = threading.Lock()
+
+    def start(self) -> "WorkerPool":
+        """Fork the worker processes"""
+        from config.settings import settings
+
+        if self._processes:
+            return self
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            _preload()
+        else:
+            # Without fork each worker imports everything itself
+            logger.warning("fork is not available, worker processes are spawned and start cold")
+            context = multiprocessing.get_context("spawn")
+
+        for name, enabled, path in (("News", settings.NEWS_CACHE_ENABLED, settings.NEWS_CACHE_PATH),
+                                    ("LLM", settings.LLM_CACHE_ENABLED, settings.LLM_CACHE_PATH)):
+            if enabled and not path:
+                logger.warning(f"{name} cache has no disk tier, so each worker keeps its own")
+
+        self._tasks, self._results = context.Queue(), context.Queue()
+        self._abandoned = context.Value("q", 0)
+        quotas = self._worker_quotas()
+        for i in range(self.workers):
+            process = context.Process(
+                target=_worker_main,
+                args=(self._tasks, self._results, self._abandoned, self.threads, quotas),
+                name=f"news-worker-{i}",
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+        logger.info(f"Worker pool started: {self.workers} process(es) x {self.threads} thread(s)")
+        return self
+
+    def _worker_quotas(self) -> Dict[str, Optional[float]]:
+        """Each worker's share of the provider quotas, which every process would otherwise apply in full"""
+        from clients.rate_limit import PROVIDERS
+        from config.settings import settings
+
+        quotas = {}
+        for provider in PROVIDERS:
+            requests_per_minute = getattr(settings, f"{provider.upper()}_REQUESTS_PER_MINUTE")
+            quotas[provider] = requests_per_minute / self.workers if requests_per_minute else None
+        return quotas
+
+    def run_batch(self, requests: Iterable[BatchRequest]) -> "ProcessBatchRun":
+        """
+        Execute many news gathering workflows across the worker processes
+
+        Args:
+            requests: User requests, as strings or dicts with user_request and
+                optionally top_articles and edition
+
+        Returns:
+            BatchRun yielding results as each workflow finishes
+        """
+        self.start()
+        return ProcessBatchRun(self, requests)
+
+    def _submit(self, batch: int, index: int, request: BatchRequest) -> None:
+        self._tasks.put((batch, index, request))
+
+    def _next_result(self, batch: int) -> BatchResult:
+        """The batch's next finished run, raising if a worker died"""
+        while True:
+            try:
+                result_batch, payload = self._results.get(timeout=1.0)
+                if result_batch == batch:
+                    return pickle.loads(payload)
+                # Still in flight when an earlier batch was abandoned
+                logger.debug(f"Discarding a result of abandoned batch {result_batch}")
+            except queue.Empty:
+                dead = [p for p in self._processes if not p.is_alive()]
+                if dead:
+                    raise RuntimeError(f"Worker {dead[0].name} exited with code {dead[0].exitcode}")
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Let the workers finish their current runs and stop them"""
+        if not self._processes:
+            return
+        for _ in range(self.workers * self.threads):
+            self._tasks.put(None)
+
+        deadline = time.monotonic() + timeout
+        for process in self._processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Worker {process.name} did not stop in time, terminating it")
+                process.terminate()
+                process.join()
+
+        for q in (self._tasks, self._results):
+            q.close()
+            q.join_thread()
+        self._processes = []
+        logger.info("Worker pool stopped")
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ProcessBatchRun(BatchRun):
+    """
+    BatchRun executed on a WorkerPool
+
+    Every worker thread gets one request at a time, so the batch is spread
+    over whichever workers free up first; report() works as for BatchRun.
+    Only one batch runs on a pool at a time, and stopping iteration early
+    abandons the rest of the batch.
+    """
+
+    def __init__(self, pool: WorkerPool, requests: Iterable[BatchRequest]):
+        """
+        Args:
+            pool: Started worker pool
+            requests: User requests, as strings or dicts
+        """
+        super().__init__(None, requests, max_concurrency=pool.workers * pool.threads)
+        self.pool = pool
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        if not self.pool._batch_lock.acquire(blocking=False):
+            raise RuntimeError("Another batch is running on this worker pool")
+
+        batch = next(self.pool._batch_ids)
+        in_flight = 0
+        try:
+            self._started = time.perf_counter()
+            pending = iter(enumerate(self.requests))
+
+            def submit_next() -> bool:
+                item = next(pending, None)
+                if item is None:
+                    return False
+                self.pool._submit(batch, *item)
+                return True
+
+            while in_flight < self.max_concurrency and submit_next():
+                in_flight += 1
+
+            while in_flight:
+                result = self.pool._next_result(batch)
+                in_flight -= 1
+                self.results.append(result)
+                if submit_next():
+                    in_flight += 1
+                yield result
+
+            self._finished = time.perf_counter()
+        finally:
+            # Iteration stopped early (break, an error in the loop body, or the
+            # generator being closed): workers skip its queued runs, and results
+            # of the running ones are discarded by the next batch
+            if in_flight:
+                self.pool._abandoned.value = batch
+            self.pool._batch_lock.release()
@@ -0,0 +1,107 @@
+"""
+Cold-start cost of importing the package and building the first agent, checked against budgets
+
+Every target runs in a fresh interpreter under `python -X importtime`, so
+nothing is shared between samples. The slowest top-level packages of the
+last sample show what a regression pulled in.
+
+Usage:
+    python -m benchmarks.bench_import --runs 5
+    python -m benchmarks.bench_import --budget import_agent=100 --budget first_agent=1500
+"""
+from pathlib import Path
+from typing import Dict, List, Tuple
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# name -> (statement, default budget in ms of wall time)
+TARGETS: Dict[str, Tuple[str, float]] = {
+    "import_settings": ("import config.settings", 400),
+    "import_agent": ("import agents.news_gatherer", 150),
+    "import_service": ("import service.app", 450),
+    "first_agent": ("from agents.news_gatherer import NewsGathererAgent; NewsGathererAgent()", 2000),
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def _sample(statement: str) -> Tuple[float, str]:
+    """Wall time of one fresh interpreter running statement, and its -X importtime report"""
+    env = dict(os.environ, NEWSDATA_API_KEY=os.environ.get("NEWSDATA_API_KEY", "stub-key"), LOG_LEVEL="WARNING")
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    elapsed = time.perf_counter() - started
+    if completed.returncode != 0:
+        raise RuntimeError(f"{statement!r} failed:\n{completed.stderr[-2000:]}")
+    return elapsed, completed.stderr
+
+
+def _heaviest_packages(report: str, limit: int) -> List[Tuple[str, float]]:
+    """Self import time per top-level package, slowest first"""
+    totals: Dict[str, float] = {}
+    for line in report.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            package = match.group(4).split(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(match.group(1)) / 1000
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def _baseline_ms(runs: int) -> float:
+    """Median start-up of a bare interpreter, for scale"""
+    return statistics.median(_sample("pass")[0] for _ in range(runs)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--targets", default=",".join(TARGETS), help=f"Comma-separated subset of {', '.join(TARGETS)}")
+    parser.add_argument("--budget", action="append", default=[], metavar="TARGET=MS",
+                        help="Override a target's wall-time budget (repeatable)")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest packages listed per target")
+    args = parser.parse_args()
+
+    budgets = {name: budget for name, (_, budget) in TARGETS.items()}
+    for override in args.budget:
+        name, _, value = override.partition("=")
+        if name not in TARGETS:
+            parser.error(f"Unknown target in --budget: {name}")
+        budgets[name] = float(value)
+
+    print(f"\nInterpreter start-up: {_baseline_ms(args.runs):.0f} ms (median of {args.runs})")
+    print(f"\n{'target':<18}{'median ms':>11}{'min ms':>9}{'budget ms':>11}  result")
+
+    failures, reports = [], {}
+    for name in [t.strip() for t in args.targets.split(",") if t.strip()]:
+        statement, _ = TARGETS[name]
+        samples = []
+        for _ in range(args.runs):
+            elapsed, reports[name] = _sample(statement)
+            samples.append(elapsed * 1000)
+        median = statistics.median(samples)
+        ok = median <= budgets[name]
+        if not ok:
+            failures.append(name)
+        print(f"{name:<18}{median:>11.0f}{min(samples):>9.0f}{budgets[name]:>11.0f}  {'ok' if ok else 'OVER BUDGET'}")
+
+    for name, report in reports.items():
+        heaviest = ", ".join(f"{package} {ms:.0f}" for package, ms in _heaviest_packages(report, args.top))
+        print(f"\n{name}: heaviest packages (self ms): {heaviest}")
+
+    if failures:
+        print(f"\nOver budget: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
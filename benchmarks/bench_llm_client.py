@@ -0,0 +1,97 @@
+"""
+Latency saved per run() by reusing one ChatGroq client instead of rebuilding it every agent step
+
+Usage:
+    python -m benchmarks.bench_llm_client --runs 50 --latency 0.005
+"""
+from unittest import mock
+import argparse
+import os
+import statistics
+import time
+
+from benchmarks.stubs import GroqStub
+
+FIXTURE_RESPONSE = {
+    "status": "success",
+    "totalResults": 1,
+    "results": [{
+        "title": "Stub article",
+        "description": "Stub description",
+        "content": "Stub content",
+        "link": "https://example.com/stub",
+        "source_id": "stub",
+        "source_name": "Stub",
+        "pubDate": "2024-11-13 10:00:00",
+    }],
+}
+
+
+def _make_fresh_registry():
+    """Registry that reproduces the old behaviour: new client and binding on every step"""
+    from langchain_groq import ChatGroq
+    from clients.llm import LLMClientRegistry
+    from config.settings import settings
+
+    class FreshClientRegistry(LLMClientRegistry):
+        def get_llm_with_tools(self, tools, **llm_kwargs):
+            llm = ChatGroq(
+                model=settings.LLM_MODEL,
+                api_key=os.getenv("GROQ_API_KEY"),
+                temperature=settings.LLM_TEMPERATURE,
+                max_tokens=settings.LLM_MAX_TOKENS
+            )
+            return llm.bind_tools(list(tools))
+
+    return FreshClientRegistry()
+
+
+def _time_runs(agent, runs: int) -> list:
+    timings = []
+    for i in range(runs):
+        start = time.perf_counter()
+        state = agent.run(f"Latest AI news #{i}", top_articles=1)
+        timings.append(time.perf_counter() - start)
+        assert state["status"] == "completed", state.get("error")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub response latency in seconds")
+    args = parser.parse_args()
+
+    with GroqStub(latency=args.latency) as stub:
+        os.environ["GROQ_API_BASE"] = stub.base_url
+        os.environ.setdefault("GROQ_API_KEY", "stub-key")
+        # Measure client reuse, not response replay
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+
+        from agents.news_gatherer import NewsGathererAgent
+        from clients.llm import LLMClientRegistry
+        from clients.newsdata import NewsDataClient
+
+        with mock.patch.object(NewsDataClient, "news_api", return_value=FIXTURE_RESPONSE):
+            results = {}
+            for label, registry in (("per-step client", _make_fresh_registry()),
+                                    ("shared client", LLMClientRegistry())):
+                agent = NewsGathererAgent(llm_clients=registry)
+                _time_runs(agent, 2)  # warm up imports and the stub
+                connections_before = stub.connections
+                timings = _time_runs(agent, args.runs)
+                results[label] = (timings, stub.connections - connections_before)
+
+    print(f"\n{'mode':<18}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'connections':>13}")
+    for label, (timings, connections) in results.items():
+        timings_ms = sorted(t * 1000 for t in timings)
+        p95 = timings_ms[int(0.95 * (len(timings_ms) - 1))]
+        print(f"{label:<18}{statistics.mean(timings_ms):>10.2f}{statistics.median(timings_ms):>10.2f}"
+              f"{p95:>10.2f}{connections:>13}")
+
+    saved = statistics.mean(results["per-step client"][0]) - statistics.mean(results["shared client"][0])
+    print(f"\nLatency saved per run(): {saved * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
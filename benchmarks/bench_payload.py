@@ -0,0 +1,52 @@
+"""
+Prompt tokens of the fetch_news payload before and after projection
+
+Usage:
+    python -m benchmarks.bench_payload --fixture benchmarks/fixtures/newsdata_latest.json --articles 10
+"""
+from pathlib import Path
+import argparse
+import json
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fixture", default=str(FIXTURES / "newsdata_latest.json"))
+    parser.add_argument("--articles", type=int, default=10, help="Articles per fetch (MAX_ARTICLES_PER_FETCH)")
+    args = parser.parse_args()
+
+    from tools.news_tools import _structure_articles
+    from tools.payload import PayloadProjector, estimate_tokens
+
+    response = json.loads(Path(args.fixture).read_text(encoding="utf-8"))
+    articles = _structure_articles(response)[:args.articles]
+    params = {"q": "artificial intelligence", "language": "en"}
+
+    default_fields = ["title", "description", "content", "link", "source_name", "pub_date", "category"]
+    variants = {
+        "baseline (all fields, indented)": PayloadProjector(),
+        "all fields, compact": PayloadProjector(fmt="compact"),
+        "whitelist, compact": PayloadProjector(fields=default_fields, fmt="compact"),
+        "whitelist, content 800 chars": PayloadProjector(
+            fields=default_fields, content_max_chars=800, fmt="compact"),
+        "whitelist, 3 sentences, tsv": PayloadProjector(
+            fields=default_fields, content_max_sentences=3, fmt="tsv"),
+        "settings default": PayloadProjector.from_settings(),
+        "token budget 1500": PayloadProjector(
+            fields=default_fields, content_max_chars=800, fmt="compact", token_budget=1500),
+    }
+
+    baseline_tokens = None
+    print(f"\n{'variant':<34}{'articles':>10}{'chars':>10}{'tokens':>10}{'saved':>9}")
+    for label, projector in variants.items():
+        payload = projector.render(articles, params)
+        tokens = estimate_tokens(payload)
+        baseline_tokens = baseline_tokens or tokens
+        kept = json.loads(payload)["count"]
+        print(f"{label:<34}{kept:>10}{len(payload):>10}{tokens:>10}{1 - tokens / baseline_tokens:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Workflow outcomes against providers that fail transiently, with and without transport retries
+
+Both stubs answer a share of requests with an error status. Without retries
+a failed NewsData page costs the agent an extra LLM round trip (or the run),
+and a failed LLM call fails the run; with retries the shared HTTP transport
+absorbs them.
+
+Usage:
+    python -m benchmarks.bench_retry --runs 40 --failure-rate 0.2 --status 503
+"""
+import argparse
+import os
+import time
+
+from benchmarks.stubs import GroqStub, NewsDataStub
+
+
+def _run(agent, runs: int, groq: GroqStub, news: NewsDataStub) -> dict:
+    llm_before = groq.requests - groq.failures
+    news_before = news.requests - news.failures
+    completed = 0
+    start = time.perf_counter()
+    for i in range(runs):
+        state = agent.run(f"Latest news on artificial intelligence, angle {i}")
+        completed += state["status"] == "completed" and not state.get("error")
+    wall = time.perf_counter() - start
+    llm_calls = groq.requests - groq.failures - llm_before
+    return {
+        "completed": completed,
+        "llm_calls": llm_calls,
+        "news_calls": news.requests - news.failures - news_before,
+        "llm_per_run": llm_calls / max(completed, 1),
+        "wall": wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=40)
+    parser.add_argument("--failure-rate", type=float, default=0.2, help="Share of provider requests that fail")
+    parser.add_argument("--status", type=int, default=503, help="Status of injected failures (e.g. 429, 503)")
+    parser.add_argument("--retries", type=int, default=3, help="HTTP_MAX_RETRIES of the retrying variant")
+    args = parser.parse_args()
+
+    with GroqStub() as groq, NewsDataStub(articles=25) as news:
+        os.environ.update(
+            GROQ_API_BASE=groq.base_url,
+            NEWSDATA_API_BASE=news.api_base,
+            LLM_CACHE_ENABLED="false",
+            NEWS_CACHE_ENABLED="false",
+            GROQ_REQUESTS_PER_MINUTE="0",
+            NEWSDATA_REQUESTS_PER_MINUTE="0",
+            HTTP_BACKOFF_BASE_SECONDS="0.01",
+            # Keep the circuit closed: this measures retries, not fail-fast
+            CIRCUIT_FAILURE_THRESHOLD="1000",
+            LOG_LEVEL="ERROR",
+        )
+        os.environ.setdefault("GROQ_API_KEY", "stub-key")
+        os.environ.setdefault("NEWSDATA_API_KEY", "stub-key")
+
+        from agents.news_gatherer import NewsGathererAgent
+        from clients import rate_limit
+
+        agent = NewsGathererAgent()
+        _run(agent, 2, groq, news)  # warm up imports and connections
+
+        for stub in (groq, news):
+            stub.failure_rate, stub.failure_status = args.failure_rate, args.status
+
+        print(f"\n{args.failure_rate:.0%} of provider requests answered {args.status}, {args.runs} runs")
+        print(f"{'variant':<20}{'completed':>11}{'LLM calls':>11}{'LLM/run':>9}{'NewsData':>10}{'wall s':>9}")
+        for label, retries in (("no retries", 0), (f"{args.retries} retries", args.retries)):
+            for provider in rate_limit.PROVIDERS:
+                rate_limit.get_scheduler(provider).max_retries = retries
+            result = _run(agent, args.runs, groq, news)
+            print(f"{label:<20}{result['completed']:>8}/{args.runs:<2}{result['llm_calls']:>11}"
+                  f"{result['llm_per_run']:>9.2f}{result['news_calls']:>10}{result['wall']:>9.2f}")
+
+        print(f"\nInjected failures: {groq.failures} LLM, {news.failures} NewsData")
+        for provider in rate_limit.PROVIDERS:
+            print(f"{provider}: {rate_limit.get_scheduler(provider).stats()}")
+
+
+if __name__ == "__main__":
+    main()
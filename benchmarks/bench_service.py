@@ -0,0 +1,104 @@
+"""
+Load test of the HTTP service against local Groq and NewsData stubs
+
+Requests go through the ASGI app in process (httpx.ASGITransport), so the
+numbers cover queueing, the warm agent pool and the workflow itself but not
+socket handling of a real ASGI server.
+
+Usage:
+    python -m benchmarks.bench_service --requests 200 --concurrency 32 --pool 4 --queue 16
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from benchmarks.stubs import GroqStub, NewsDataStub
+
+
+async def _load(app, total: int, concurrency: int, topics: int) -> dict:
+    import httpx
+
+    statuses, latencies = {}, []
+    pending = iter(range(total))
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://service",
+                                 timeout=None) as client:
+        async def user() -> None:
+            for i in pending:
+                start = time.perf_counter()
+                response = await client.post("/curate", json={
+                    "user_request": f"Latest news on topic {i % topics}",
+                    "top_articles": 3
+                })
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+                if response.status_code == 200:
+                    latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(user() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+
+        metrics = (await client.get("/metrics")).text
+
+    return {"statuses": statuses, "latencies": latencies, "wall": wall, "metrics": metrics}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32, help="Simulated clients sending requests back to back")
+    parser.add_argument("--pool", type=int, default=4, help="SERVICE_AGENT_POOL_SIZE")
+    parser.add_argument("--queue", type=int, default=16, help="SERVICE_QUEUE_SIZE")
+    parser.add_argument("--topics", type=int, default=1000, help="Distinct requests (fewer means more cache hits)")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Groq stub latency in seconds")
+    parser.add_argument("--news-latency", type=float, default=0.1, help="NewsData stub latency in seconds")
+    args = parser.parse_args()
+
+    with GroqStub(latency=args.llm_latency) as groq, NewsDataStub(latency=args.news_latency) as news:
+        os.environ["GROQ_API_BASE"] = groq.base_url
+        os.environ.setdefault("GROQ_API_KEY", "stub-key")
+        os.environ["NEWSDATA_API_BASE"] = news.api_base
+        os.environ.setdefault("NEWSDATA_API_KEY", "stub-key")
+        os.environ["GROQ_REQUESTS_PER_MINUTE"] = "0"
+        os.environ["NEWSDATA_REQUESTS_PER_MINUTE"] = "0"
+        os.environ["LLM_CACHE_PATH"] = ""
+        os.environ["NEWS_CACHE_PATH"] = ""
+        os.environ["LOG_LEVEL"] = "WARNING"
+
+        from agents.batch import percentile
+        from service.app import CurationService
+        from service.metrics import Metrics
+        from service.pool import AgentPool
+
+        async def run() -> dict:
+            app = CurationService(pool=AgentPool(size=args.pool, queue_size=args.queue, metrics=Metrics()))
+            started = time.perf_counter()
+            await app.startup()
+            warmup = time.perf_counter() - started
+            try:
+                result = await _load(app, args.requests, args.concurrency, args.topics)
+            finally:
+                await app.shutdown()
+            result["warmup"] = warmup
+            return result
+
+        result = asyncio.run(run())
+
+    latencies = result["latencies"]
+    completed = len(latencies)
+    print(f"\nPool {args.pool} agents, queue {args.queue}, {args.concurrency} clients, {args.requests} requests")
+    print(f"Warm-up (pool build): {result['warmup']:.2f}s")
+    print(f"Responses by status: {dict(sorted(result['statuses'].items()))}")
+    print(f"Throughput: {completed / result['wall']:.1f} completed requests/s over {result['wall']:.2f}s")
+    print(f"Latency ms  p50 {percentile(latencies, 50) * 1000:.0f}  p95 {percentile(latencies, 95) * 1000:.0f}"
+          f"  p99 {percentile(latencies, 99) * 1000:.0f}  max {max(latencies, default=0) * 1000:.0f}")
+
+    print("\nStage latency (from /metrics):")
+    for line in result["metrics"].splitlines():
+        if line.startswith("news_gatherer_stage_seconds{") and 'quantile="0.95"' in line:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
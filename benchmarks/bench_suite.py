@@ -0,0 +1,296 @@
+"""
+Offline performance suite: end-to-end runs and isolated stages against stub or replayed providers
+
+Stages:
+    parse     fetch_news parsing, dedup and serialization of a NewsData page
+    prompt    system and user prompt formatting
+    graph     workflow overhead: e2e run time not spent waiting on the LLM or NewsData
+    e2e       NewsGathererAgent.run with injected provider latency
+
+Each stage reports throughput, latency percentiles, peak RSS and token
+counts. Write the results with --json and pass them back as --baseline on
+the next change to fail on p50 regressions.
+
+Usage:
+    # Synthetic providers
+    python -m benchmarks.bench_suite --runs 30 --llm-latency 0.2 --news-latency 0.1
+
+    # Record once against the live APIs (needs GROQ_API_KEY and NEWSDATA_API_KEY), then replay offline
+    python -m benchmarks.bench_suite --record benchmarks/fixtures/cassette.json --request "Latest AI news"
+    python -m benchmarks.bench_suite --cassette benchmarks/fixtures/cassette.json --runs 30
+
+    # Regression check
+    python -m benchmarks.bench_suite --json bench.json
+    python -m benchmarks.bench_suite --baseline bench.json --tolerance 0.2
+"""
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+import argparse
+import json
+import os
+import sys
+import time
+
+from benchmarks.replay import Cassette, RecordingProxy, ReplayGroqStub, ReplayNewsDataStub
+from benchmarks.stubs import GroqStub, NewsDataStub
+
+FIXTURES = Path(__file__).parent / "fixtures"
+STAGES = ("parse", "prompt", "graph", "e2e")
+
+
+def _peak_rss_mb() -> float:
+    """Process high-water mark of resident memory (0.0 where unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _summarize(stage: str, samples: List[float], wall: float, tokens: Dict[str, float]) -> Dict[str, Any]:
+    from agents.batch import percentile
+
+    return {
+        "stage": stage,
+        "runs": len(samples),
+        "throughput": len(samples) / wall if wall else 0.0,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "peak_rss_mb": _peak_rss_mb(),
+        "tokens": tokens,
+    }
+
+
+def _measure(stage: str, operation: Callable[[int], None], runs: int, warmup: int,
+             tokens: Callable[[], Dict[str, float]] = dict) -> Dict[str, Any]:
+    """Time operation(i) runs times after warmup calls"""
+    for i in range(warmup):
+        operation(i)
+    samples = []
+    started = time.perf_counter()
+    for i in range(runs):
+        call_started = time.perf_counter()
+        operation(i)
+        samples.append(time.perf_counter() - call_started)
+    return _summarize(stage, samples, time.perf_counter() - started, tokens())
+
+
+def bench_parse(runs: int, warmup: int) -> Dict[str, Any]:
+    from tools.news_tools import _ArticleCollector, _success_payload
+    from tools.payload import estimate_tokens
+
+    page = json.loads((FIXTURES / "newsdata_latest.json").read_text(encoding="utf-8"))
+    params = {"q": "artificial intelligence", "language": "en"}
+    sizes = []
+
+    def operation(i: int) -> None:
+        collector = _ArticleCollector.from_settings()
+        collector.add_page(page)
+        payload = _success_payload(collector.result(), params)
+        sizes.append(estimate_tokens(payload))
+
+    return _measure("parse", operation, runs, warmup,
+                    tokens=lambda: {"payload_tokens": sizes[-1] if sizes else 0})
+
+
+def bench_prompt(runs: int, warmup: int) -> Dict[str, Any]:
+    from prompts.news_gatherer_prompts import NewsGathererPrompts
+    from tools.payload import estimate_tokens
+
+    prompts = NewsGathererPrompts()
+    rendered = []
+
+    def operation(i: int) -> None:
+        system = prompts.get_system_prompt(max_articles=10, top_articles=5)
+        user = prompts.get_user_prompt(user_request=f"Latest AI news #{i}", top_articles=5)
+        rendered.append(estimate_tokens(system) + estimate_tokens(user))
+
+    return _measure("prompt", operation, runs, warmup,
+                    tokens=lambda: {"prompt_tokens": rendered[-1] if rendered else 0})
+
+
+def _span_seconds(state: Dict[str, Any], kinds: tuple) -> float:
+    return sum(s["duration"] for s in state.get("spans", []) if s["kind"] in kinds)
+
+
+def _llm_tokens(states: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Mean prompt and completion tokens per run, from the llm.chat spans"""
+    totals = {"prompt_tokens": 0, "completion_tokens": 0}
+    for state in states:
+        for s in state.get("spans", []):
+            if s["kind"] == "llm":
+                for field in totals:
+                    totals[field] += s["attributes"].get(field) or 0
+    return {field: value / len(states) for field, value in totals.items()} if states else totals
+
+
+def bench_agent(agent, requests: List[str], runs: int, warmup: int) -> List[Dict[str, Any]]:
+    """
+    End-to-end runs, reported whole (e2e) and without provider wait (graph)
+
+    Provider wait is the time inside llm.chat and newsdata.page spans, so
+    what remains is graph scheduling, state handling, tools and ranking.
+    """
+    for i in range(warmup):
+        agent.run(requests[i % len(requests)])
+
+    states, e2e, graph = [], [], []
+    started = time.perf_counter()
+    for i in range(runs):
+        call_started = time.perf_counter()
+        state = agent.run(requests[i % len(requests)])
+        elapsed = time.perf_counter() - call_started
+        if state["status"] != "completed":
+            raise RuntimeError(f"Run {i} ended with status {state['status']}: {state.get('error')}")
+        states.append(state)
+        e2e.append(elapsed)
+        graph.append(elapsed - _span_seconds(state, ("llm", "http")))
+    wall = time.perf_counter() - started
+
+    tokens = _llm_tokens(states)
+    return [_summarize("graph", graph, wall, tokens), _summarize("e2e", e2e, wall, tokens)]
+
+
+def _configure_environment(groq_url: str, news_url: str) -> None:
+    os.environ["GROQ_API_BASE"] = groq_url
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+    os.environ["NEWSDATA_API_BASE"] = news_url
+    os.environ.setdefault("NEWSDATA_API_KEY", "stub-key")
+    os.environ["GROQ_REQUESTS_PER_MINUTE"] = "0"
+    os.environ["NEWSDATA_REQUESTS_PER_MINUTE"] = "0"
+    # Every run should reach the providers
+    os.environ["LLM_CACHE_ENABLED"] = "false"
+    os.environ["NEWS_CACHE_ENABLED"] = "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def record(path: str, requests: List[str], groq_upstream: str = "https://api.groq.com",
+           news_upstream: str = "https://newsdata.io") -> None:
+    """Run each request once against the live APIs through recording proxies"""
+    cassette = Cassette(path)
+    with RecordingProxy(groq_upstream, "groq", cassette) as groq, \
+            RecordingProxy(news_upstream, "newsdata", cassette) as news:
+        os.environ["GROQ_API_BASE"] = groq.base_url
+        os.environ["NEWSDATA_API_BASE"] = f"{news.base_url}/api/1/"
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+        os.environ["NEWS_CACHE_ENABLED"] = "false"
+
+        from agents.news_gatherer import NewsGathererAgent
+
+        agent = NewsGathererAgent()
+        for user_request in requests:
+            state = agent.run(user_request)
+            print(f"Recorded '{user_request}': {state['status']}")
+            if user_request not in cassette.user_requests:
+                cassette.user_requests.append(user_request)
+
+    cassette.save()
+    print(f"Cassette written to {path}: {len(cassette.data['groq'])} completions, "
+          f"{len(cassette.data['newsdata'])} NewsData pages")
+
+
+def _print_results(results: List[Dict[str, Any]], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"\n{'stage':<8}{'runs':>6}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+          f"{'peak RSS MB':>13}  tokens")
+    for r in results:
+        tokens = ", ".join(f"{k}={v:.0f}" for k, v in r["tokens"].items())
+        line = (f"{r['stage']:<8}{r['runs']:>6}{r['throughput']:>10.1f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+                f"{r['p99_ms']:>10.2f}{r['peak_rss_mb']:>13.1f}  {tokens}")
+        previous = (baseline or {}).get(r["stage"])
+        if previous and previous["p50_ms"]:
+            line += f"  (p50 {r['p50_ms'] / previous['p50_ms'] - 1:+.0%} vs baseline)"
+        print(line)
+
+
+def _regressions(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    failures = []
+    for r in results:
+        previous = baseline.get(r["stage"])
+        if previous and r["p50_ms"] > previous["p50_ms"] * (1 + tolerance):
+            failures.append(f"{r['stage']}: p50 {r['p50_ms']:.2f} ms vs baseline {previous['p50_ms']:.2f} ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--stages", default=",".join(STAGES), help=f"Comma-separated subset of {', '.join(STAGES)}")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--stage-runs", type=int, default=2000, help="Runs of the in-process parse and prompt stages")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per LLM response")
+    parser.add_argument("--news-latency", type=float, default=0.1, help="Seconds per NewsData page")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra seconds per response")
+    parser.add_argument("--request", action="append", help="User request to run (repeatable)")
+    parser.add_argument("--cassette", help="Replay recorded responses from this file")
+    parser.add_argument("--record", help="Record live responses to this file and exit")
+    parser.add_argument("--json", help="Write results to this file")
+    parser.add_argument("--baseline", help="Results file of a previous run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p50 slowdown vs the baseline")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.request or ["Latest news on artificial intelligence"])
+        return
+
+    stages = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(sorted(unknown))}")
+
+    if args.cassette:
+        cassette = Cassette(args.cassette)
+        groq = ReplayGroqStub(cassette, latency=args.llm_latency, jitter=args.jitter)
+        news = ReplayNewsDataStub(cassette, latency=args.news_latency, jitter=args.jitter)
+        requests = args.request or cassette.user_requests
+    else:
+        groq = GroqStub(latency=args.llm_latency, jitter=args.jitter)
+        news = NewsDataStub(latency=args.news_latency, jitter=args.jitter)
+        requests = args.request or [f"Latest news on artificial intelligence, angle {i}" for i in range(8)]
+    if not requests:
+        parser.error("No user requests: pass --request or a cassette recorded with requests")
+
+    results = []
+    with groq, news:
+        _configure_environment(groq.base_url, news.api_base)
+
+        if "parse" in stages:
+            results.append(bench_parse(args.stage_runs, args.warmup))
+        if "prompt" in stages:
+            results.append(bench_prompt(args.stage_runs, args.warmup))
+
+        if "graph" in stages or "e2e" in stages:
+            from agents.news_gatherer import NewsGathererAgent
+
+            agent = NewsGathererAgent()
+            results += [r for r in bench_agent(agent, requests, args.runs, args.warmup) if r["stage"] in stages]
+
+    baseline = None
+    if args.baseline:
+        baseline = {r["stage"]: r for r in json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]}
+
+    _print_results(results, baseline)
+    print(f"\nProvider requests: {groq.requests} LLM, {news.requests} NewsData")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            "created": time.time(),
+            "settings": {"llm_latency": args.llm_latency, "news_latency": args.news_latency,
+                         "jitter": args.jitter, "cassette": args.cassette},
+            "results": results
+        }, indent=2), encoding="utf-8")
+        print(f"Results written to {args.json}")
+
+    if baseline:
+        failures = _regressions(results, baseline, args.tolerance)
+        if failures:
+            print(f"\nRegressions beyond {args.tolerance:.0%}:")
+            for failure in failures:
+                print(f"  {failure}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Batch throughput of the worker pool by process count, and cache sharing between workers
+
+The stubs run in processes of their own so they do not compete with the
+workers for the parent's GIL. With zero stub latency a run is CPU-bound, so
+throughput should grow with workers up to the machine's core count; beyond
+it the extra processes only add scheduling overhead.
+
+The cache pass runs a batch with caches on a temporary directory, then the
+same batch on a fresh pool: every LLM and NewsData response of the second
+pass is read from the SQLite files the first pool's workers wrote.
+
+Usage:
+    python -m benchmarks.bench_workers --runs 64 --workers 1,2,4 --threads 1
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from benchmarks.stubs import GroqStub, NewsDataStub
+
+
+def _serve(kind: str, latency: float, conn) -> None:
+    """Run a stub until the parent says stop, reporting its address and request counts"""
+    stub = GroqStub(latency=latency) if kind == "groq" else NewsDataStub(latency=latency, articles=25)
+    stub.start()
+    conn.send(stub.base_url if kind == "groq" else stub.api_base)
+    while conn.recv() == "requests":
+        conn.send(stub.requests)
+    stub.stop()
+
+
+class _RemoteStub:
+    """Stub running in a spawned process"""
+
+    def __init__(self, kind: str, latency: float):
+        context = multiprocessing.get_context("spawn")
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(kind, latency, child), daemon=True)
+        self._process.start()
+        self.url = self._conn.recv()
+
+    @property
+    def requests(self) -> int:
+        self._conn.send("requests")
+        return self._conn.recv()
+
+    def stop(self) -> None:
+        self._conn.send("stop")
+        self._process.join()
+
+
+def _batch(workers: int, threads: int, runs: int, offset: int = 0) -> dict:
+    from agents.workers import WorkerPool
+
+    requests = [f"Latest news on artificial intelligence, angle {offset + i}" for i in range(runs)]
+    with WorkerPool(workers=workers, threads=threads) as pool:
+        # One run per worker thread so every process has built its agent and connections
+        list(pool.run_batch([f"warm-up {offset + i}" for i in range(workers * threads)]))
+        batch = pool.run_batch(requests)
+        list(batch)
+    return batch.report()
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, *(2 ** i for i in range(1, 8) if 2 ** i <= cores), cores, max(2, cores)})
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=64)
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)),
+                        help="Comma-separated worker counts")
+    parser.add_argument("--threads", type=int, default=1, help="Concurrent runs per worker")
+    parser.add_argument("--llm-latency", type=float, default=0.0)
+    parser.add_argument("--news-latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    groq = _RemoteStub("groq", args.llm_latency)
+    news = _RemoteStub("newsdata", args.news_latency)
+    cache_dir = tempfile.TemporaryDirectory()
+    try:
+        os.environ.update(
+            GROQ_API_BASE=groq.url,
+            NEWSDATA_API_BASE=news.url,
+            LLM_CACHE_ENABLED="false",
+            NEWS_CACHE_ENABLED="false",
+            LLM_CACHE_PATH=os.path.join(cache_dir.name, "llm.sqlite3"),
+            NEWS_CACHE_PATH=os.path.join(cache_dir.name, "news.sqlite3"),
+            CHECKPOINT_ENABLED="false",
+            GROQ_REQUESTS_PER_MINUTE="0",
+            NEWSDATA_REQUESTS_PER_MINUTE="0",
+            LOG_LEVEL="ERROR",
+        )
+        os.environ.setdefault("GROQ_API_KEY", "stub-key")
+        os.environ.setdefault("NEWSDATA_API_KEY", "stub-key")
+
+        from config.settings import get_settings
+
+        settings = get_settings()
+
+        print(f"\n{args.runs} runs, {args.threads} thread(s) per worker, {cores} CPU core(s)")
+        print(f"{'workers':>8}{'runs/s':>10}{'speedup':>9}{'p50 ms':>9}{'p95 ms':>9}{'wall s':>9}")
+        baseline = None
+        for offset, workers in enumerate(int(w) for w in args.workers.split(",")):
+            report = _batch(workers, args.threads, args.runs, offset=offset * args.runs)
+            baseline = baseline or report["throughput_per_second"]
+            print(f"{workers:>8}{report['throughput_per_second']:>10.1f}"
+                  f"{report['throughput_per_second'] / baseline:>8.2f}x"
+                  f"{report['latency_p50'] * 1000:>9.1f}{report['latency_p95'] * 1000:>9.1f}"
+                  f"{report['wall_seconds']:>9.2f}")
+
+        # Workers inherit the parent's settings when they fork
+        settings.LLM_CACHE_ENABLED = settings.NEWS_CACHE_ENABLED = True
+        workers = max(2, cores)
+        print(f"\nShared caches, two pools of {workers} workers on the same batch")
+        print(f"{'pass':<8}{'LLM reqs':>10}{'NewsData':>10}{'runs/s':>10}")
+        for label in ("cold", "warm"):
+            llm_before, news_before = groq.requests, news.requests
+            report = _batch(workers, args.threads, args.runs, offset=10_000)
+            print(f"{label:<8}{groq.requests - llm_before:>10}{news.requests - news_before:>10}"
+                  f"{report['throughput_per_second']:>10.1f}")
+    finally:
+        groq.stop()
+        news.stop()
+        cache_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
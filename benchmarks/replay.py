@@ -0,0 +1,158 @@
+"""
+Record real Groq and NewsData responses once, replay them offline
+
+Recording puts a forwarding proxy in front of each API and writes every
+request/response pair to a cassette (a JSON file). Replay serves the
+cassette from the same local stubs the other benchmarks use, so agents
+reach them through their normal HTTP clients and nothing is mocked.
+"""
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import hashlib
+import json
+import threading
+
+from benchmarks.stubs import GroqStub, NewsDataStub, StubServer, _StubHandler
+
+# Parts of a chat request that change between runs without changing the answer
+_VOLATILE_REQUEST_FIELDS = ("stream", "stream_options", "n")
+
+
+def groq_key(request: Dict[str, Any]) -> str:
+    body = {k: v for k, v in request.items() if k not in _VOLATILE_REQUEST_FIELDS}
+    return hashlib.sha256(json.dumps(body, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def groq_shape(request: Dict[str, Any]) -> str:
+    """Coarse position in the conversation, used when no exact recording matches"""
+    messages = request.get("messages", [])
+    tool_results = sum(1 for m in messages if m.get("role") == "tool")
+    return f"messages={len(messages)},tool_results={tool_results}"
+
+
+def newsdata_key(query: Dict[str, list]) -> str:
+    params = {k: v for k, v in sorted(query.items()) if k != "apikey"}
+    return json.dumps(params, sort_keys=True)
+
+
+class Cassette:
+    """Recorded responses per provider, keyed by request"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.data: Dict[str, Any] = {"requests": [], "groq": [], "newsdata": []}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            self.data.update(json.loads(self.path.read_text(encoding="utf-8")))
+
+    @property
+    def user_requests(self) -> List[str]:
+        return self.data["requests"]
+
+    def add(self, provider: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self.data[provider].append(entry)
+
+    def find(self, provider: str, key: str, shape: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Newest entry with this key, else (with shape) the newest entry of that shape"""
+        entries = self.data[provider]
+        for entry in reversed(entries):
+            if entry["key"] == key:
+                return entry
+        if shape is not None:
+            for entry in reversed(entries):
+                if entry.get("shape") == shape:
+                    return entry
+        return None
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self.path.write_text(json.dumps(self.data, indent=1, ensure_ascii=False), encoding="utf-8")
+
+
+class _ProxyHandler(_StubHandler):
+    def _forward(self, method: str) -> None:
+        stub = self.stub
+        stub.requests += 1
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0))) if method == "POST" else None
+        status, payload = stub.forward(method, self.path, dict(self.headers), body)
+        self._send_json(status, payload)
+
+    def do_GET(self):
+        self._forward("GET")
+
+    def do_POST(self):
+        self._forward("POST")
+
+
+class RecordingProxy(StubServer):
+    """
+    Forwards requests to a live API and records successful responses
+
+    Chat requests are always sent upstream without streaming and recorded
+    as whole completions; replay re-chunks them for streaming clients.
+    """
+
+    handler_class = _ProxyHandler
+
+    def __init__(self, upstream: str, provider: str, cassette: Cassette):
+        """
+        Args:
+            upstream: Scheme and host of the live API (e.g. https://api.groq.com)
+            provider: "groq" or "newsdata"
+            cassette: Where recordings go
+        """
+        super().__init__()
+        self.upstream = upstream.rstrip("/")
+        self.provider = provider
+        self.cassette = cassette
+
+    def forward(self, method: str, path: str, headers: Dict[str, str],
+                body: Optional[bytes]) -> Tuple[int, Dict[str, Any]]:
+        import httpx
+
+        headers = {k: v for k, v in headers.items() if k.lower() in ("authorization", "content-type", "accept")}
+        request = json.loads(body) if body else None
+        if request is not None and request.get("stream"):
+            request = {k: v for k, v in request.items() if k not in ("stream", "stream_options")}
+            body = json.dumps(request).encode("utf-8")
+
+        response = httpx.request(method, self.upstream + path, headers=headers, content=body, timeout=120)
+        payload = response.json()
+        if response.status_code == 200:
+            if self.provider == "groq":
+                entry = {"key": groq_key(request), "shape": groq_shape(request), "response": payload}
+            else:
+                entry = {"key": newsdata_key(parse_qs(urlsplit(path).query)), "response": payload}
+            self.cassette.add(self.provider, entry)
+        return response.status_code, payload
+
+
+class ReplayGroqStub(GroqStub):
+    """Chat completions answered from a cassette"""
+
+    def __init__(self, cassette: Cassette, latency: float = 0.0, token_latency: float = 0.0, jitter: float = 0.0):
+        super().__init__(latency=latency, token_latency=token_latency, jitter=jitter)
+        self.cassette = cassette
+
+    def completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        entry = self.cassette.find("groq", groq_key(request), groq_shape(request))
+        if entry is None:
+            raise LookupError(f"No recorded completion for a conversation with {groq_shape(request)}")
+        return entry["response"]
+
+
+class ReplayNewsDataStub(NewsDataStub):
+    """NewsData pages answered from a cassette"""
+
+    def __init__(self, cassette: Cassette, latency: float = 0.0, jitter: float = 0.0):
+        super().__init__(latency=latency, jitter=jitter)
+        self.cassette = cassette
+
+    def respond(self, query: Dict[str, list]) -> Tuple[int, Dict[str, Any]]:
+        entry = self.cassette.find("newsdata", newsdata_key(query))
+        if entry is None:
+            return 404, {"status": "error", "results": {"message": f"No recording for {newsdata_key(query)}"}}
+        return 200, entry["response"]
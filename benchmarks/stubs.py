@@ -0,0 +1,345 @@
+"""
+Local stand-ins for the Groq and NewsData HTTP APIs used by the benchmarks
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+import json
+import random
+import threading
+import time
+import uuid
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            # The client dropped a keep-alive connection, e.g. after a retried response
+            pass
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+
+class StubServer:
+    """Threaded HTTP server on a free localhost port, usable as a context manager"""
+
+    handler_class = _StubHandler
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, failure_rate: float = 0.0,
+                 failure_status: int = 503):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            jitter: Up to this many extra seconds, drawn uniformly per request
+            failure_rate: Share of requests answered with failure_status instead
+            failure_status: Status of injected failures (429 comes with Retry-After: 0)
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.failures = 0
+        self._random = random.Random(0)
+        self.requests = 0
+        self.connections = 0
+        stub = self
+
+        class Handler(self.handler_class):
+            def setup(self):
+                stub.connections += 1
+                super().setup()
+
+        Handler.stub = stub
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    def delay(self) -> None:
+        """Sleep for the configured latency plus jitter"""
+        seconds = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if seconds:
+            time.sleep(seconds)
+
+    def fail(self, handler: "_StubHandler") -> bool:
+        """Answer the request with an injected failure, if it draws one"""
+        if not self.failure_rate or self._random.random() >= self.failure_rate:
+            return False
+        self.failures += 1
+        body = json.dumps({"error": {"message": "injected failure", "type": "stub"}}).encode("utf-8")
+        handler.send_response(self.failure_status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        if self.failure_status == 429:
+            handler.send_header("Retry-After", "0")
+        handler.end_headers()
+        handler.wfile.write(body)
+        return True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _GroqHandler(_StubHandler):
+    def do_POST(self):
+        stub = self.stub
+        stub.requests += 1
+        request = self._read_json()
+        stub.delay()
+        if stub.fail(self):
+            return
+        try:
+            if request.get("stream"):
+                # Resolve the completion before the 200 status goes out
+                chunks = list(stub.completion_chunks(request))
+                self._send_events(chunks)
+            else:
+                self._send_json(200, stub.completion(request))
+        except LookupError as e:
+            self._send_json(404, {"error": {"message": str(e), "type": "not_found"}})
+
+    def _send_events(self, chunks) -> None:
+        """Server-sent events over chunked transfer encoding"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for chunk in chunks:
+            data = f"data: {json.dumps(chunk)}\n\n".encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+            if self.stub.token_latency:
+                time.sleep(self.stub.token_latency)
+        done = b"data: [DONE]\n\n"
+        self.wfile.write(f"{len(done):x}\r\n".encode("ascii") + done + b"\r\n0\r\n\r\n")
+
+
+class GroqStub(StubServer):
+    """
+    OpenAI-compatible chat completions endpoint
+
+    The first turn of a conversation answers with a fetch_news tool call, any
+    turn that already contains a tool result answers with a select_articles
+    call on the latest articles (or a prose analysis if that tool is not offered).
+    """
+
+    handler_class = _GroqHandler
+
+    def __init__(self, latency: float = 0.0, query: str = "artificial intelligence", token_latency: float = 0.0,
+                 jitter: float = 0.0, select: int = 3):
+        """
+        Args:
+            latency: Seconds to sleep before answering each request
+            query: Query of the fetch_news call made on the first turn
+            token_latency: Seconds between streamed chunks
+            jitter: Up to this many extra seconds per request
+            select: Articles picked by the select_articles call
+        """
+        super().__init__(latency=latency, jitter=jitter)
+        self.query = query
+        self.token_latency = token_latency
+        self.select = select
+
+    @staticmethod
+    def _tool_call(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [{
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(arguments)}
+            }]
+        }
+
+    @staticmethod
+    def _latest_article_ids(messages: list) -> list:
+        """Article ids of the last tool result, in the order given"""
+        try:
+            payload = json.loads(next(m for m in reversed(messages) if m.get("role") == "tool")["content"])
+        except (StopIteration, TypeError, ValueError):
+            return []
+        articles = payload.get("articles") or []
+        if isinstance(articles, str):
+            # TSV rows
+            columns = payload.get("columns") or []
+            articles = [dict(zip(columns, row.split("\t"))) for row in articles.split("\n") if row]
+        return [article["id"] for article in articles if isinstance(article, dict) and article.get("id")]
+
+    def completion(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        messages = request.get("messages", [])
+        has_tool_result = any(m.get("role") == "tool" for m in messages)
+        tools = {tool.get("function", {}).get("name") for tool in request.get("tools") or []}
+
+        if has_tool_result and "select_articles" in tools:
+            ids = self._latest_article_ids(messages)[:self.select]
+            message = self._tool_call("select_articles", {
+                "articles": [{"id": i, "reason": f"Stub pick #{n + 1}, covering the request in depth."}
+                             for n, i in enumerate(ids)],
+                "notes": "Stub selection."
+            })
+            finish_reason = "tool_calls"
+        elif has_tool_result:
+            message = {"role": "assistant", "content": "## News Curation Summary\n\n**Selected**: 1"}
+            finish_reason = "stop"
+        else:
+            message = self._tool_call("fetch_news", {"query": self.query, "language": "en"})
+            finish_reason = "tool_calls"
+
+        prompt_tokens = sum(len(str(m.get("content") or "")) for m in messages) // 4
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "stub"),
+            "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": 16,
+                "total_tokens": prompt_tokens + 16
+            }
+        }
+
+
+    def completion_chunks(self, request: Dict[str, Any]):
+        """
+        The completion split into chat.completion.chunk events: one per word of
+        content, or one per fragment of tool call arguments
+        """
+        completion = self.completion(request)
+        choice = completion["choices"][0]
+        message = choice["message"]
+
+        def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> Dict[str, Any]:
+            return {
+                "id": completion["id"],
+                "object": "chat.completion.chunk",
+                "created": completion["created"],
+                "model": completion["model"],
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+            }
+
+        yield chunk({"role": "assistant", "content": ""})
+        for index, call in enumerate(message.get("tool_calls") or []):
+            arguments = call["function"]["arguments"]
+            first = dict(call, index=index, function={"name": call["function"]["name"], "arguments": ""})
+            yield chunk({"tool_calls": [first]})
+            for start in range(0, len(arguments), 24):
+                yield chunk({"tool_calls": [{"index": index, "function": {"arguments": arguments[start:start + 24]}}]})
+        if message.get("content"):
+            for word in message["content"].split(" "):
+                yield chunk({"content": word + " "})
+
+        final = chunk({}, choice["finish_reason"])
+        final["x_groq"] = {"usage": completion["usage"]}
+        yield final
+
+
+_SUBJECTS = ["researchers", "regulators", "startups", "investors", "engineers", "lawmakers", "universities",
+             "hospitals", "automakers", "chipmakers", "banks", "farmers", "schools", "artists", "analysts"]
+_ACTIONS = ["unveil", "question", "fund", "delay", "expand", "test", "ban", "adopt", "criticise", "open",
+            "scale back", "accelerate", "audit", "license", "rethink"]
+_OBJECTS = ["open-source models", "chip export rules", "data centre plans", "safety benchmarks",
+            "medical imaging tools", "robotics pilots", "copyright deals", "energy contracts",
+            "tutoring assistants", "fraud detection systems", "translation services", "climate forecasts"]
+
+
+def make_articles(count: int, topic: str = "artificial intelligence", seed: int = 7) -> list:
+    """Synthetic, mutually distinct NewsData result entries"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        subject, action, obj = rng.choice(_SUBJECTS), rng.choice(_ACTIONS), rng.choice(_OBJECTS)
+        place = rng.choice(["in Europe", "across Asia", "in the US", "in Africa", "worldwide", "in Canada"])
+        sentences = [
+            f"{subject.capitalize()} {place} {action} {obj}, according to {rng.choice(_SUBJECTS)} briefed on day {i}.",
+            f"The decision affects how {topic} is deployed by {rng.choice(_SUBJECTS)}.",
+            f"Observers said the {rng.choice(_OBJECTS)} debate would shape the next quarter.",
+        ]
+        articles.append({
+            "article_id": uuid.uuid5(uuid.NAMESPACE_URL, f"{topic}/{i}").hex,
+            "title": f"{subject.capitalize()} {action} {obj} {place} ({i})",
+            "description": sentences[0],
+            "content": " ".join(sentences * rng.randint(2, 20)),
+            "link": f"https://news.example.com/{topic.replace(' ', '-')}/{i}",
+            "source_id": f"source{i % 7}",
+            "source_name": f"Source {i % 7}",
+            "pubDate": f"2024-11-{(i % 28) + 1:02d} 10:00:00",
+            "image_url": f"https://img.example.com/{i}.jpg" if i % 2 else None,
+            "keywords": [topic, obj],
+            "category": ["technology"],
+        })
+    return articles
+
+
+class _NewsDataHandler(_StubHandler):
+    def do_GET(self):
+        stub = self.stub
+        stub.requests += 1
+        stub.delay()
+        if stub.fail(self):
+            return
+        status, payload = stub.respond(parse_qs(urlsplit(self.path).query))
+        self._send_json(status, payload)
+
+
+class NewsDataStub(StubServer):
+    """NewsData latest-news endpoint serving synthetic articles, page_size at a time"""
+
+    handler_class = _NewsDataHandler
+
+    def __init__(self, latency: float = 0.0, articles: int = 10, page_size: int = 10, jitter: float = 0.0):
+        super().__init__(latency=latency, jitter=jitter)
+        self.results = make_articles(articles)
+        self.page_size = page_size
+
+    @property
+    def api_base(self) -> str:
+        return f"{self.base_url}/api/1/"
+
+    def respond(self, query: Dict[str, list]) -> Tuple[int, Dict[str, Any]]:
+        """Status and body answering a request's parsed query string"""
+        return 200, self.page(query.get("page", [None])[0])
+
+    def page(self, cursor: Optional[str] = None) -> Dict[str, Any]:
+        start = int(cursor or 0)
+        end = start + self.page_size
+        return {
+            "status": "success",
+            "totalResults": len(self.results),
+            "results": self.results[start:end],
+            "nextPage": str(end) if end < len(self.results) else None
+        }
@@ -0,0 +1,486 @@
+"""
+SQLite checkpoint store for resumable workflow runs
+"""
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+
+from tools.news_cache import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+# Blob type of a list stored as the hashes of its items
+LIST_BLOB = "hashes"
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS checkpoints ("
+    " thread_id TEXT NOT NULL,"
+    " checkpoint_ns TEXT NOT NULL,"
+    " checkpoint_id TEXT NOT NULL,"
+    " parent_id TEXT,"
+    " type TEXT NOT NULL,"
+    " checkpoint BLOB NOT NULL,"
+    " metadata_type TEXT NOT NULL,"
+    " metadata BLOB NOT NULL,"
+    " created_at REAL NOT NULL,"
+    " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id))",
+    "CREATE INDEX IF NOT EXISTS checkpoints_created ON checkpoints (created_at)",
+    # Value of a channel at a version, by blob hash (NULL: the channel was emptied)
+    "CREATE TABLE IF NOT EXISTS channel_values ("
+    " thread_id TEXT NOT NULL,"
+    " checkpoint_ns TEXT NOT NULL,"
+    " channel TEXT NOT NULL,"
+    " version TEXT NOT NULL,"
+    " hash TEXT,"
+    " PRIMARY KEY (thread_id, checkpoint_ns, channel, version))",
+    "CREATE TABLE IF NOT EXISTS writes ("
+    " thread_id TEXT NOT NULL,"
+    " checkpoint_ns TEXT NOT NULL,"
+    " checkpoint_id TEXT NOT NULL,"
+    " task_id TEXT NOT NULL,"
+    " idx INTEGER NOT NULL,"
+    " channel TEXT NOT NULL,"
+    " hash TEXT NOT NULL,"
+    " task_path TEXT NOT NULL,"
+    " PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx))",
+    # Serialized values, stored once per content hash
+    "CREATE TABLE IF NOT EXISTS blobs ("
+    " hash TEXT PRIMARY KEY,"
+    " type TEXT NOT NULL,"
+    " data BLOB NOT NULL,"
+    " size INTEGER NOT NULL)",
+)
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver):
+    """
+    LangGraph checkpointer on a single SQLite file
+
+    Channel values and pending writes are content-addressed: every value is
+    serialized, hashed and stored once in a blob table, and list values
+    (the conversation, spans, tool timings) are stored item by item. A tool
+    result carrying a page of articles is therefore written once, however
+    many checkpoints and writes of the run still contain it.
+
+    Growth is bounded three ways: each thread keeps only its newest
+    keep_per_thread checkpoints, threads idle for longer than ttl_seconds or
+    beyond the newest max_threads are dropped, and blobs no longer
+    referenced are deleted by a periodic sweep.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            keep_per_thread: int = 2,
+            ttl_seconds: int = 86400,
+            max_threads: int = 1000,
+            sweep_interval: float = 60.0
+    ):
+        """
+        Args:
+            path: SQLite file (None keeps checkpoints in memory for the life of the process)
+            keep_per_thread: Checkpoints kept per thread; the newest is all a resume needs
+            ttl_seconds: Time after a thread's last checkpoint at which it is dropped
+            max_threads: Threads kept; the least recently checkpointed beyond it are dropped
+            sweep_interval: Seconds between sweeps for expired threads and unreferenced blobs
+        """
+        super().__init__()
+        self.keep_per_thread = max(1, keep_per_thread)
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self.sweep_interval = sweep_interval
+
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        self._stats = {"checkpoints": 0, "writes": 0, "threads_dropped": 0, "blobs_dropped": 0}
+
+        self.path = Path(path) if path else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path or ":memory:"), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run the block as one transaction"""
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    # Values
+
+    def _put_blob(self, type_: str, data: bytes) -> str:
+        digest = hashlib.sha256(type_.encode("utf-8") + b"\0" + data).hexdigest()
+        self._db.execute(
+            "INSERT OR IGNORE INTO blobs (hash, type, data, size) VALUES (?, ?, ?, ?)",
+            (digest, type_, data, len(data))
+        )
+        return digest
+
+    def _put_value(self, value: Any) -> str:
+        """Store a value and return its hash (caller holds the lock)"""
+        if isinstance(value, list):
+            hashes = [self._put_blob(*self.serde.dumps_typed(item)) for item in value]
+            return self._put_blob(LIST_BLOB, json.dumps(hashes).encode("utf-8"))
+        return self._put_blob(*self.serde.dumps_typed(value))
+
+    def _get_value(self, digest: str) -> Any:
+        """Load a value stored by _put_value (caller holds the lock)"""
+        type_, data = self._db.execute("SELECT type, data FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        if type_ == LIST_BLOB:
+            return [self._get_value(item) for item in json.loads(data)]
+        return self.serde.loads_typed((type_, data))
+
+    # Reads
+
+    def _load_tuple(self, row: Tuple) -> CheckpointTuple:
+        """Checkpoint tuple of a checkpoints row (caller holds the lock)"""
+        thread_id, checkpoint_ns, checkpoint_id, parent_id, type_, blob, metadata_type, metadata = row
+        checkpoint: Checkpoint = self.serde.loads_typed((type_, blob))
+
+        stored = {
+            (channel, version): digest
+            for channel, version, digest in self._db.execute(
+                "SELECT channel, version, hash FROM channel_values WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns)
+            )
+        }
+        channel_values = {}
+        for channel, version in checkpoint["channel_versions"].items():
+            digest = stored.get((channel, str(version)))
+            if digest is not None:
+                channel_values[channel] = self._get_value(digest)
+
+        writes = self._db.execute(
+            "SELECT task_id, idx, channel, hash, task_path FROM writes"
+            " WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+            (thread_id, checkpoint_ns, checkpoint_id)
+        ).fetchall()
+        writes.sort(key=lambda w: writes_sort_key(w[4], w[0], w[1]))
+
+        def config_of(target_id: str) -> RunnableConfig:
+            return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns,
+                                     "checkpoint_id": target_id}}
+
+        return CheckpointTuple(
+            config=config_of(checkpoint_id),
+            checkpoint={**checkpoint, "channel_values": channel_values},
+            metadata=self.serde.loads_typed((metadata_type, metadata)),
+            parent_config=config_of(parent_id) if parent_id else None,
+            pending_writes=[(task_id, channel, self._get_value(digest))
+                            for task_id, _, channel, digest, _ in writes],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """The checkpoint named by config, or the thread's latest one"""
+        return next(self.list(config, limit=1), None)
+
+    def list(
+            self,
+            config: Optional[RunnableConfig],
+            *,
+            filter: Optional[Dict[str, Any]] = None,
+            before: Optional[RunnableConfig] = None,
+            limit: Optional[int] = None
+    ) -> Iterator[CheckpointTuple]:
+        """Checkpoints matching config, before and the metadata filter, newest first"""
+        query = ("SELECT thread_id, checkpoint_ns, checkpoint_id, parent_id, type, checkpoint,"
+                 " metadata_type, metadata FROM checkpoints")
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(get_checkpoint_id(config))
+        if before and get_checkpoint_id(before):
+            clauses.append("checkpoint_id < ?")
+            params.append(get_checkpoint_id(before))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            if filter:
+                metadata = self.serde.loads_typed((row[6], row[7]))
+                if not all(metadata.get(key) == value for key, value in filter.items()):
+                    continue
+            with self._lock:
+                checkpoint_tuple = self._load_tuple(row)
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+
+    # Writes
+
+    def put(
+            self,
+            config: RunnableConfig,
+            checkpoint: Checkpoint,
+            metadata: CheckpointMetadata,
+            new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        """Store a checkpoint and the channel values that changed since the previous one"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        saved = checkpoint.copy()
+        values = saved.pop("channel_values")
+        type_, blob = self.serde.dumps_typed(saved)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        with self._transaction() as db:
+            for channel, version in new_versions.items():
+                db.execute(
+                    "INSERT OR REPLACE INTO channel_values (thread_id, checkpoint_ns, channel, version, hash)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (thread_id, checkpoint_ns, channel, str(version),
+                     self._put_value(values[channel]) if channel in values else None)
+                )
+            db.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_id, type,"
+                " checkpoint, metadata_type, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, checkpoint["id"], config["configurable"].get("checkpoint_id"),
+                 type_, blob, metadata_type, metadata_blob, time.time())
+            )
+            self._prune_thread(thread_id, checkpoint_ns)
+            self._stats["checkpoints"] += 1
+
+        if time.monotonic() >= self._next_sweep:
+            self.sweep()
+
+        return {"configurable": {"thread_id": thread_id, "checkpoint_ns": checkpoint_ns,
+                                 "checkpoint_id": checkpoint["id"]}}
+
+    def put_writes(
+            self,
+            config: RunnableConfig,
+            writes: Sequence[Tuple[str, Any]],
+            task_id: str,
+            task_path: str = ""
+    ) -> None:
+        """Store the writes of a finished task against the checkpoint it ran from"""
+        configurable = config["configurable"]
+        key = (configurable["thread_id"], configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"])
+
+        with self._transaction() as db:
+            for idx, (channel, value) in enumerate(writes):
+                idx = WRITES_IDX_MAP.get(channel, idx)
+                # Special writes (errors, interrupts) replace earlier ones, regular writes are kept once
+                verb = "INSERT OR REPLACE" if idx < 0 else "INSERT OR IGNORE"
+                db.execute(
+                    f"{verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, hash,"
+                    " task_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*key, task_id, idx, channel, self._put_value(value), task_path)
+                )
+            self._stats["writes"] += len(writes)
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Drop every checkpoint and write of a thread (its blobs go with the next sweep)"""
+        with self._transaction():
+            self._delete_threads([thread_id])
+
+    # Retention
+
+    def _prune_thread(self, thread_id: str, checkpoint_ns: str) -> None:
+        """Keep the newest keep_per_thread checkpoints and the values they use (caller holds the lock)"""
+        db = self._db
+        old = [row[0] for row in db.execute(
+            "SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?"
+            " ORDER BY checkpoint_id DESC LIMIT -1 OFFSET ?",
+            (thread_id, checkpoint_ns, self.keep_per_thread)
+        )]
+        if not old:
+            return
+
+        for checkpoint_id in old:
+            db.execute("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                       (thread_id, checkpoint_ns, checkpoint_id))
+            db.execute("DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                       (thread_id, checkpoint_ns, checkpoint_id))
+
+        # Channel versions still named by a kept checkpoint
+        used = set()
+        for type_, blob in db.execute(
+                "SELECT type, checkpoint FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns)
+        ):
+            kept = self.serde.loads_typed((type_, blob))
+            used.update((channel, str(version)) for channel, version in kept["channel_versions"].items())
+        for channel, version in db.execute(
+                "SELECT channel, version FROM channel_values WHERE thread_id = ? AND checkpoint_ns = ?",
+                (thread_id, checkpoint_ns)
+        ).fetchall():
+            if (channel, version) not in used:
+                db.execute(
+                    "DELETE FROM channel_values WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ?"
+                    " AND version = ?",
+                    (thread_id, checkpoint_ns, channel, version)
+                )
+
+    def _delete_threads(self, thread_ids: List[str]) -> None:
+        """Caller holds the lock"""
+        for thread_id in thread_ids:
+            for table in ("checkpoints", "channel_values", "writes"):
+                self._db.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+        self._stats["threads_dropped"] += len(thread_ids)
+
+    def sweep(self) -> None:
+        """Drop expired and surplus threads, then every blob no checkpoint or write refers to"""
+        self._next_sweep = time.monotonic() + self.sweep_interval
+        with self._transaction() as db:
+            threads = [row[0] for row in db.execute(
+                "SELECT thread_id FROM checkpoints GROUP BY thread_id ORDER BY MAX(created_at) DESC"
+            )]
+            expired = {row[0] for row in db.execute(
+                "SELECT thread_id FROM checkpoints GROUP BY thread_id HAVING MAX(created_at) <= ?",
+                (time.time() - self.ttl_seconds,)
+            )}
+            dropped = [t for i, t in enumerate(threads) if t in expired or i >= self.max_threads]
+            self._delete_threads(dropped)
+
+            # Mark: hashes referenced directly, plus the items of referenced lists
+            live = {row[0] for row in db.execute(
+                "SELECT hash FROM channel_values WHERE hash IS NOT NULL UNION SELECT hash FROM writes"
+            )}
+            lists = db.execute(f"SELECT hash, data FROM blobs WHERE type = '{LIST_BLOB}'").fetchall()
+            for digest, data in lists:
+                if digest in live:
+                    live.update(json.loads(data))
+
+            # Sweep
+            db.execute("CREATE TEMP TABLE IF NOT EXISTS live_blobs (hash TEXT PRIMARY KEY)")
+            db.execute("DELETE FROM live_blobs")
+            db.executemany("INSERT INTO live_blobs (hash) VALUES (?)", ((digest,) for digest in live))
+            removed = db.execute("DELETE FROM blobs WHERE hash NOT IN (SELECT hash FROM live_blobs)").rowcount
+            db.execute("DELETE FROM live_blobs")
+            self._stats["blobs_dropped"] += removed
+
+        if dropped or removed:
+            logger.info(f"Checkpoint sweep dropped {len(dropped)} thread(s) and {removed} blob(s)")
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and current store sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            (stats["threads"],) = self._db.execute("SELECT COUNT(DISTINCT thread_id) FROM checkpoints").fetchone()
+            (stats["stored_checkpoints"],) = self._db.execute("SELECT COUNT(*) FROM checkpoints").fetchone()
+            stats["blobs"], stats["blob_bytes"] = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs"
+            ).fetchone()
+        return stats
+
+    # Async variants: the same statements on a worker thread
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+            self,
+            config: Optional[RunnableConfig],
+            *,
+            filter: Optional[Dict[str, Any]] = None,
+            before: Optional[RunnableConfig] = None,
+            limit: Optional[int] = None
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoints = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in checkpoints:
+            yield checkpoint_tuple
+
+    async def aput(
+            self,
+            config: RunnableConfig,
+            checkpoint: Checkpoint,
+            metadata: CheckpointMetadata,
+            new_versions: ChannelVersions
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+            self,
+            config: RunnableConfig,
+            writes: Sequence[Tuple[str, Any]],
+            task_id: str,
+            task_path: str = ""
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """Zero-padded counter, so versions compare as strings"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}"
+
+
+_checkpointer: Optional[SQLiteCheckpointSaver] = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> SQLiteCheckpointSaver:
+    """Process-wide checkpoint store built from settings on first use"""
+    global _checkpointer
+
+    if _checkpointer is None:
+        with _checkpointer_lock:
+            if _checkpointer is None:
+                from config.settings import settings
+
+                path = None
+                if settings.CHECKPOINT_PATH:
+                    path = Path(settings.CHECKPOINT_PATH)
+                    if not path.is_absolute():
+                        path = PROJECT_ROOT / path
+
+                _checkpointer = SQLiteCheckpointSaver(
+                    path=str(path) if path else None,
+                    keep_per_thread=settings.CHECKPOINT_KEEP_PER_THREAD,
+                    ttl_seconds=settings.CHECKPOINT_TTL_SECONDS,
+                    max_threads=settings.CHECKPOINT_MAX_THREADS
+                )
+                logger.info(f"Checkpoint store ready (path={path}, ttl={settings.CHECKPOINT_TTL_SECONDS}s)")
+    return _checkpointer
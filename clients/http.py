@@ -0,0 +1,196 @@
+"""
+Shared keep-alive HTTP connection pools
+"""
+from typing import Optional
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+
+import httpx
+
+from clients import rate_limit
+from clients.tracing import annotate
+
+logger = logging.getLogger(__name__)
+
+GROQ_DEFAULT_BASE = "https://api.groq.com"
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _pool_limits() -> httpx.Limits:
+    """Connection pool limits from settings"""
+    from config.settings import settings
+
+    return httpx.Limits(
+        max_connections=settings.HTTP_POOL_SIZE,
+        max_keepalive_connections=settings.HTTP_POOL_SIZE,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_SECONDS
+    )
+
+
+def _timeout() -> httpx.Timeout:
+    """Request timeout from settings"""
+    from config.settings import settings
+
+    return httpx.Timeout(settings.HTTP_TIMEOUT_SECONDS)
+
+
+def provider_for(url: httpx.URL) -> Optional[str]:
+    """The provider ("groq" or "newsdata") a request URL belongs to, if any"""
+    from config.settings import settings
+
+    groq_base = os.getenv("GROQ_API_BASE") or GROQ_DEFAULT_BASE
+    for provider, base in (("groq", groq_base), ("newsdata", settings.NEWSDATA_API_BASE)):
+        if httpx.URL(base).netloc == url.netloc:
+            return provider
+    return None
+
+
+class SchedulingTransport(httpx.BaseTransport):
+    """
+    Sends provider requests through the provider's scheduler
+
+    Each attempt waits for quota (and fails fast while the provider's circuit
+    is open); 429s, 5xx answers and connection errors are retried with
+    backoff before the caller ever sees them. Other hosts pass straight
+    through.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        provider = provider_for(request.url)
+        if provider is None:
+            return self._transport.handle_request(request)
+
+        scheduler = rate_limit.get_scheduler(provider)
+        attempt = 0
+        while True:
+            scheduler.acquire()
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as e:
+                delay = scheduler.failed(attempt, e)
+                if delay is None:
+                    raise
+            else:
+                delay = scheduler.completed(attempt, response.status_code, response.headers)
+                if delay is None:
+                    return response
+                response.close()
+
+            attempt += 1
+            annotate(retries=attempt)
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncSchedulingTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of SchedulingTransport"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        provider = provider_for(request.url)
+        if provider is None:
+            return await self._transport.handle_async_request(request)
+
+        scheduler = rate_limit.get_scheduler(provider)
+        attempt = 0
+        while True:
+            await scheduler.aacquire()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                delay = scheduler.failed(attempt, e)
+                if delay is None:
+                    raise
+            else:
+                delay = scheduler.completed(attempt, response.status_code, response.headers)
+                if delay is None:
+                    return response
+                await response.aclose()
+
+            attempt += 1
+            annotate(retries=attempt)
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Process-wide synchronous HTTP client
+
+    httpx.Client is thread-safe, so every agent and worker thread shares one
+    pool of keep-alive connections and TLS sessions.
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                limits = _pool_limits()
+                _http_client = httpx.Client(
+                    transport=SchedulingTransport(httpx.HTTPTransport(limits=limits)),
+                    timeout=_timeout()
+                )
+                logger.info(f"HTTP pool created (max_connections={limits.max_connections})")
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Asynchronous HTTP client for the running event loop
+
+    Async connections cannot move between event loops, so each loop gets its
+    own pool. Every coroutine on that loop (LLM calls and news fetches alike)
+    multiplexes over the same keep-alive connections.
+    """
+    loop = asyncio.get_running_loop()
+
+    client = _async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        with _http_client_lock:
+            client = _async_http_clients.get(loop)
+            if client is None or client.is_closed:
+                limits = _pool_limits()
+                client = httpx.AsyncClient(
+                    transport=AsyncSchedulingTransport(httpx.AsyncHTTPTransport(limits=limits)),
+                    timeout=_timeout()
+                )
+                _async_http_clients[loop] = client
+                logger.info(f"Async HTTP pool created (max_connections={limits.max_connections})")
+    return client
+
+
+def close_http_clients() -> None:
+    """Close the shared sync pool (it is rebuilt on next use)"""
+    global _http_client
+
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+
+
+async def aclose_http_client() -> None:
+    """Close the async pool of the running event loop"""
+    loop = asyncio.get_running_loop()
+    with _http_client_lock:
+        client = _async_http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
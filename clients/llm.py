@@ -0,0 +1,161 @@
+"""
+Shared ChatGroq clients and tool bindings
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence, Tuple
+import asyncio
+import logging
+import os
+import threading
+import weakref
+
+from langchain_core.caches import BaseCache
+from langchain_core.runnables import Runnable
+
+from clients.http import get_async_http_client, get_http_client
+from clients.llm_cache import get_llm_cache
+
+if TYPE_CHECKING:
+    # The Groq SDK is imported with the first client
+    from langchain_groq import ChatGroq
+
+logger = logging.getLogger(__name__)
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """The running event loop, or None when called from synchronous code"""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+class LLMClientRegistry:
+    """Builds each ChatGroq client and tool binding once and hands out the cached instance"""
+
+    def __init__(self, cache: Optional[BaseCache] = None):
+        """
+        Args:
+            cache: Response cache for deterministic clients (default: the LLM_CACHE_* settings)
+        """
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._llms: Dict[Tuple, "ChatGroq"] = {}
+        self._bound: Dict[Tuple, Runnable] = {}
+        # Clients used from an event loop share that loop's async pool
+        self._loop_llms: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._loop_bound: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _llm_key(model: str, temperature: float, max_tokens: int) -> Tuple:
+        return (model, temperature, max_tokens)
+
+    def _response_cache(self, temperature: float) -> Optional[BaseCache]:
+        """Response cache for clients with this temperature (sampled responses are never cached)"""
+        from config.settings import settings
+
+        if temperature > 0:
+            return None
+        if self.cache is not None:
+            return self.cache
+        return get_llm_cache() if settings.LLM_CACHE_ENABLED else None
+
+    def _caches(self) -> Tuple[Dict, Dict]:
+        """Client and binding caches for the current context (caller holds the lock)"""
+        loop = _running_loop()
+        if loop is None:
+            return self._llms, self._bound
+        return self._loop_llms.setdefault(loop, {}), self._loop_bound.setdefault(loop, {})
+
+    def get_llm(
+            self,
+            model: Optional[str] = None,
+            temperature: Optional[float] = None,
+            max_tokens: Optional[int] = None
+    ) -> "ChatGroq":
+        """
+        Get the shared ChatGroq client for a model configuration
+
+        Called from a coroutine, the client's async calls go through the
+        running loop's connection pool; otherwise through the process-wide
+        synchronous pool. Requests wait for the Groq quota, unless they are
+        answered by the response cache; the pools' transport retries
+        transient failures, so the SDK's own retries are turned off.
+
+        Args:
+            model: Model name (default: from settings)
+            temperature: Sampling temperature (default: from settings)
+            max_tokens: Maximum response tokens (default: from settings)
+
+        Returns:
+            ChatGroq client backed by the shared HTTP pools
+        """
+        from config.settings import settings
+
+        model = model or settings.LLM_MODEL
+        temperature = settings.LLM_TEMPERATURE if temperature is None else temperature
+        max_tokens = max_tokens or settings.LLM_MAX_TOKENS
+        key = self._llm_key(model, temperature, max_tokens)
+
+        with self._lock:
+            llms, _ = self._caches()
+            llm = llms.get(key)
+        if llm is None:
+            http_async_client = get_async_http_client() if _running_loop() else None
+            cache = self._response_cache(temperature)
+            with self._lock:
+                llms, _ = self._caches()
+                llm = llms.get(key)
+                if llm is None:
+                    from langchain_groq import ChatGroq
+
+                    llm = ChatGroq(
+                        model=model,
+                        api_key=os.getenv("GROQ_API_KEY"),
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        http_client=get_http_client(),
+                        http_async_client=http_async_client,
+                        cache=cache if cache is not None else False,
+                        max_retries=0
+                    )
+                    llms[key] = llm
+                    logger.info(f"ChatGroq client created for {model}")
+        return llm
+
+    def get_llm_with_tools(self, tools: Sequence[Any], **llm_kwargs) -> Runnable:
+        """
+        Get the shared ChatGroq client with tools bound
+
+        Args:
+            tools: Tools to bind (bindings are cached by tool name)
+            **llm_kwargs: Model overrides passed to get_llm
+
+        Returns:
+            Runnable that calls the LLM with the tool schemas attached
+        """
+        llm = self.get_llm(**llm_kwargs)
+        key = (id(llm),) + tuple(getattr(t, "name", repr(t)) for t in tools)
+
+        with self._lock:
+            _, bindings = self._caches()
+            bound = bindings.get(key)
+            if bound is None:
+                bound = llm.bind_tools(list(tools))
+                bindings[key] = bound
+        return bound
+
+    def clear(self) -> None:
+        """Forget every cached client and binding"""
+        with self._lock:
+            self._llms.clear()
+            self._bound.clear()
+            self._loop_llms.clear()
+            self._loop_bound.clear()
+
+
+# Global registry instance shared by every agent in the process
+llm_registry = LLMClientRegistry()
@@ -0,0 +1,163 @@
+"""
+Response cache for deterministic LLM calls
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import threading
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from clients.tracing import annotate
+from tools.news_cache import PROJECT_ROOT, NewsCache
+
+logger = logging.getLogger(__name__)
+
+# Message fields that differ between otherwise identical conversations
+# (token counts, provider metadata and ids of earlier responses)
+VOLATILE_MESSAGE_FIELDS = ("id", "response_metadata", "usage_metadata")
+
+# Client settings that don't affect what the model returns
+TRANSPORT_FIELDS = ("http_client", "http_async_client")
+
+
+class _ResponseStore(NewsCache):
+    """NewsCache tiers keyed on the exact prompt (no query normalization)"""
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        encoded = json.dumps(params, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain cache with an in-memory LRU tier in front of a SQLite tier
+
+    Chat models look it up with the serialized messages and an "llm string"
+    holding the model, its sampling settings and any bound tool schemas, so a
+    hit requires the exact same conversation, tools and configuration.
+    Attach it only to clients with temperature 0 (LLMClientRegistry does
+    this); sampled responses are not worth replaying.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            ttl_seconds: int = 86400,
+            max_memory_entries: int = 256,
+            max_disk_bytes: int = 64 * 1024 * 1024,
+            mmap_bytes: int = 0
+    ):
+        """
+        Args:
+            path: SQLite file for the disk tier (None keeps the cache in memory only)
+            ttl_seconds: Freshness window of a cached response
+            max_memory_entries: Number of responses kept in the LRU tier
+            max_disk_bytes: Total size kept in the disk tier before eviction
+            mmap_bytes: Size of the disk tier mapped into memory (see NewsCache)
+        """
+        self._store = _ResponseStore(
+            path=path,
+            ttl_seconds=ttl_seconds,
+            max_memory_entries=max_memory_entries,
+            max_disk_bytes=max_disk_bytes,
+            mmap_bytes=mmap_bytes
+        )
+
+    @staticmethod
+    def _canonical_prompt(prompt: str) -> Any:
+        """Serialized messages without per-response bookkeeping"""
+        try:
+            messages = json.loads(prompt)
+        except ValueError:
+            return prompt
+        for message in messages if isinstance(messages, list) else []:
+            kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+            for field in VOLATILE_MESSAGE_FIELDS:
+                kwargs.pop(field, None)
+        return messages
+
+    @staticmethod
+    def _canonical_llm(llm_string: str) -> Any:
+        """Model configuration without the HTTP clients it happens to be wired to"""
+        serialized, _, invocation = llm_string.partition("---")
+        try:
+            config = json.loads(serialized)
+        except ValueError:
+            return llm_string
+        for field in TRANSPORT_FIELDS:
+            config.get("kwargs", {}).pop(field, None)
+        return [config, invocation]
+
+    @staticmethod
+    def _encode(generation: Generation) -> Dict[str, Any]:
+        encoded = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            encoded["message"] = message_to_dict(generation.message)
+        return encoded
+
+    @staticmethod
+    def _decode(encoded: Dict[str, Any]) -> Generation:
+        if "message" in encoded:
+            (message,) = messages_from_dict([encoded["message"]])
+            return ChatGeneration(message=message, generation_info=encoded.get("generation_info"))
+        return Generation(text=encoded["text"], generation_info=encoded.get("generation_info"))
+
+    def _params(self, prompt: str, llm_string: str) -> Dict[str, Any]:
+        return {"prompt": self._canonical_prompt(prompt), "llm": self._canonical_llm(llm_string)}
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Cached generations for a prompt and model configuration, or None"""
+        cached = self._store.get(self._params(prompt, llm_string))
+        if cached is None:
+            return None
+        logger.info("Serving LLM response from cache")
+        annotate(cache_hit=True)
+        return [self._decode(generation) for generation in cached]
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations of a completed call"""
+        self._store.set(self._params(prompt, llm_string), [self._encode(generation) for generation in return_val])
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop every cached response"""
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current tier sizes"""
+        return self._store.stats()
+
+
+_llm_cache: Optional[LLMResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Process-wide LLM response cache built from settings on first use"""
+    global _llm_cache
+
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                from config.settings import settings
+
+                path = None
+                if settings.LLM_CACHE_PATH:
+                    path = Path(settings.LLM_CACHE_PATH)
+                    if not path.is_absolute():
+                        path = PROJECT_ROOT / path
+
+                _llm_cache = LLMResponseCache(
+                    path=str(path) if path else None,
+                    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                    max_memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+                    max_disk_bytes=settings.LLM_CACHE_DISK_MAX_MB * 1024 * 1024,
+                    mmap_bytes=settings.CACHE_MMAP_MB * 1024 * 1024
+                )
+                logger.info(f"LLM cache ready (path={path}, ttl={settings.LLM_CACHE_TTL_SECONDS}s)")
+    return _llm_cache
@@ -0,0 +1,223 @@
+"""
+NewsData paging and the clients on the shared HTTP pools
+"""
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, Optional, Tuple
+from urllib.parse import urljoin
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+
+from newsdataapi.newsdataapi_exception import NewsdataException
+
+from clients.http import get_async_http_client, get_http_client
+from clients.tracing import annotate
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: Optional["NewsDataClient"] = None
+_client_key: Optional[Tuple[str, str]] = None
+_client_lock = threading.Lock()
+
+
+def get_newsdata_client() -> "NewsDataClient":
+    """
+    Process-wide synchronous NewsData client for the configured key and API root
+
+    The client holds no per-request state, so every thread shares it instead
+    of building one per fetch. It is rebuilt if the key or API root changes.
+    """
+    global _client, _client_key
+    from config.settings import settings
+
+    key = (settings.NEWSDATA_API_KEY, settings.NEWSDATA_API_BASE)
+    if _client is None or _client_key != key:
+        with _client_lock:
+            if _client is None or _client_key != key:
+                _client = NewsDataClient(apikey=settings.NEWSDATA_API_KEY, base_url=settings.NEWSDATA_API_BASE)
+                _client_key = key
+    return _client
+
+
+class NewsDataClient:
+    """
+    Minimal counterpart of NewsDataApiClient.news_api on the shared HTTP pool
+
+    Requests go through the pool's scheduling transport, so they wait for the
+    NewsData quota and transient failures are retried before they surface.
+    """
+
+    def __init__(self, apikey: str, base_url: str = "https://newsdata.io/api/1/"):
+        """
+        Args:
+            apikey: NewsData API key
+            base_url: API root (the latest-news endpoint is resolved against it)
+        """
+        self.apikey = apikey
+        self.latest_url = urljoin(base_url, "latest")
+
+    def _query(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        query = {k: v for k, v in params.items() if v is not None}
+        query["apikey"] = self.apikey
+        return query
+
+    @staticmethod
+    def _parse(response: "httpx.Response") -> Dict[str, Any]:
+        annotate(response_bytes=len(response.content), http_status=response.status_code)
+        try:
+            data = response.json()
+        except ValueError:
+            # e.g. a gateway's HTML error page once retries are exhausted
+            data = {"status": "error", "results": {"code": response.status_code, "message": response.text[:200]}}
+        if response.status_code != 200 or data.get("status") != "success":
+            raise NewsdataException(data)
+        return data
+
+    def news_api(self, **params: Optional[Any]) -> Dict[str, Any]:
+        """
+        Fetch the latest news for the given query parameters
+
+        Args:
+            **params: NewsData query parameters (q, country, category, language, ...)
+
+        Returns:
+            Parsed NewsData response
+
+        Raises:
+            NewsdataException: If NewsData reports an error
+            CircuitOpenError: If NewsData has been failing and requests are refused
+        """
+        start = time.perf_counter()
+        response = get_http_client().get(self.latest_url, params=self._query(params))
+        logger.info(f"Time taken to fetch data: {time.perf_counter() - start:.2f} seconds")
+        return self._parse(response)
+
+
+class AsyncNewsDataClient(NewsDataClient):
+    """Non-blocking NewsDataClient on the running event loop's HTTP pool"""
+
+    async def news_api(self, **params: Optional[Any]) -> Dict[str, Any]:
+        """Async variant of NewsDataClient.news_api"""
+        start = time.perf_counter()
+        response = await get_async_http_client().get(self.latest_url, params=self._query(params))
+        logger.info(f"Time taken to fetch data: {time.perf_counter() - start:.2f} seconds")
+        return self._parse(response)
+
+
+class NewsPager:
+    """
+    Lazily walks NewsData's nextPage cursor, one page ahead of the consumer
+
+    While the consumer processes page N, page N+1 is already being fetched,
+    as long as fewer than article_budget articles have arrived. Past the
+    budget a further page is only requested if the consumer keeps iterating
+    (e.g. because deduplication left it short), so no credit is spent on a
+    page nobody reads. At most the current page and the prefetched one are
+    held in memory.
+    """
+
+    def __init__(
+            self,
+            max_pages: int = 1,
+            time_budget: Optional[float] = None,
+            article_budget: Optional[int] = None
+    ):
+        """
+        Args:
+            max_pages: Maximum pages to request
+            time_budget: Seconds after which no further page is awaited (the first page always is)
+            article_budget: Articles the consumer expects to need
+        """
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.article_budget = article_budget
+
+    def _remaining(self, started: float) -> Optional[float]:
+        if self.time_budget is None:
+            return None
+        return max(self.time_budget - (time.monotonic() - started), 0)
+
+    def _next_cursor(self, page: Dict[str, Any], pages: int) -> Optional[str]:
+        if pages >= self.max_pages:
+            return None
+        return page.get("nextPage")
+
+    def _prefetch(self, articles: int) -> bool:
+        return self.article_budget is None or articles < self.article_budget
+
+    def pages(self, fetch_page: Callable[[Optional[str]], Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield NewsData responses page by page
+
+        Args:
+            fetch_page: Fetches one page given the nextPage cursor (None for the first page)
+        """
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="news-pager")
+        try:
+            # Pages are fetched in the consumer's context, so spans and other context carry over
+            future: Optional[Future] = executor.submit(contextvars.copy_context().run, fetch_page, None)
+            pages = articles = 0
+            while future is not None:
+                try:
+                    page = future.result(timeout=self._remaining(started) if pages else None)
+                except FutureTimeoutError:
+                    logger.info(f"Fetch time budget spent after {pages} page(s)")
+                    return
+
+                pages += 1
+                articles += len(page.get("results") or [])
+                cursor = self._next_cursor(page, pages)
+
+                # Prefetch the next page before handing this one over
+                future = None
+                if cursor and self._prefetch(articles):
+                    future = executor.submit(contextvars.copy_context().run, fetch_page, cursor)
+                yield page
+
+                if cursor and future is None:
+                    future = executor.submit(contextvars.copy_context().run, fetch_page, cursor)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def apages(
+            self,
+            fetch_page: Callable[[Optional[str]], Awaitable[Dict[str, Any]]]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async variant of pages() with the prefetch running as a task on the event loop
+
+        Args:
+            fetch_page: Coroutine function fetching one page given the nextPage cursor
+        """
+        started = time.monotonic()
+        task: Optional[asyncio.Task] = asyncio.ensure_future(fetch_page(None))
+        pages = articles = 0
+        try:
+            while task is not None:
+                try:
+                    page = await asyncio.wait_for(task, timeout=self._remaining(started) if pages else None)
+                except asyncio.TimeoutError:
+                    logger.info(f"Fetch time budget spent after {pages} page(s)")
+                    task = None
+                    return
+
+                pages += 1
+                articles += len(page.get("results") or [])
+                cursor = self._next_cursor(page, pages)
+
+                task = None
+                if cursor and self._prefetch(articles):
+                    task = asyncio.ensure_future(fetch_page(cursor))
+                yield page
+
+                if cursor and task is None:
+                    task = asyncio.ensure_future(fetch_page(cursor))
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
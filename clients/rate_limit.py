@@ -0,0 +1,590 @@
+"""
+Client-side scheduling of Groq and NewsData requests
+
+Every provider request goes through its provider's scheduler: a token bucket
+for the quota that adapts to the provider's rate-limit headers and 429s, a
+circuit breaker that fails fast while the provider is down, and the retry
+policy (jittered exponential backoff) applied by the HTTP transport.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Mapping, Optional, Tuple
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+
+from langchain_core.rate_limiters import BaseRateLimiter
+
+logger = logging.getLogger(__name__)
+
+PROVIDERS = ("groq", "newsdata")
+
+# Request priorities: batch requests leave part of the burst capacity to interactive ones
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+# Answers worth another attempt; 429 is a quota signal, the rest an outage
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_priority: ContextVar[str] = ContextVar("provider_request_priority", default=INTERACTIVE)
+_scoped_buckets: ContextVar[Optional[Dict[str, "TokenBucket"]]] = ContextVar("provider_scoped_buckets", default=None)
+
+# Groq-style reset durations such as "2m59.56s", "7.66s" or "120ms"
+_DURATION = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+@contextmanager
+def priority(level: str) -> Iterator[None]:
+    """
+    Schedule provider requests made inside the block at the given priority
+
+    Args:
+        level: INTERACTIVE (the default) or BATCH
+    """
+    if level not in (INTERACTIVE, BATCH):
+        raise ValueError(f"Unknown priority: {level}")
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+@contextmanager
+def scoped_quota(buckets: Optional[Dict[str, "TokenBucket"]]) -> Iterator[None]:
+    """
+    Additionally limit provider requests made inside the block
+
+    The buckets apply on top of the process-wide schedulers and only to this
+    context (and the threads it is copied into), e.g. a batch with a quota of
+    its own; requests outside the block are unaffected.
+
+    Args:
+        buckets: Token bucket per provider ("groq", "newsdata"); None or empty limits nothing extra
+    """
+    for provider in buckets or {}:
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unknown provider: {provider}")
+    token = _scoped_buckets.set(buckets or None)
+    try:
+        yield
+    finally:
+        _scoped_buckets.reset(token)
+
+
+def parse_wait(value: Optional[str]) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After or rate-limit reset header
+
+    Accepts plain seconds, Groq-style durations ("1m30s") and HTTP dates;
+    plain numbers too large to be a delay are read as Unix timestamps.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+        return max(0.0, seconds - time.time()) if seconds > 1e9 else max(0.0, seconds)
+    except ValueError:
+        pass
+
+    parts = _DURATION.findall(value)
+    if parts and "".join(number + unit for number, unit in parts) == value:
+        return sum(float(number) * _DURATION_UNITS[unit] for number, unit in parts)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at a fixed rate
+
+    Callers reserve tokens up front (the balance may go negative) and then
+    wait out the deficit, so concurrent callers are served in arrival order.
+    """
+
+    def __init__(self, rate_per_second: float, capacity: float):
+        """
+        Args:
+            rate_per_second: Refill rate
+            capacity: Maximum burst size
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float) -> "TokenBucket":
+        """Bucket allowing a minute's worth of requests as a burst"""
+        return cls(rate_per_second=requests_per_minute / 60.0, capacity=max(1.0, requests_per_minute))
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (caller holds the lock)"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds the caller must wait before using the reservation
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_second
+
+    def take(self, tokens: float = 1.0, floor: float = 0.0) -> float:
+        """
+        Take tokens only if at least floor tokens remain afterwards
+
+        Unlike reserve() this never goes into debt, so it does not delay
+        callers that reserve after it.
+
+        Args:
+            tokens: Number of tokens to take
+            floor: Balance to leave in the bucket
+
+        Returns:
+            0 if the tokens were taken, else the seconds until they could be
+        """
+        with self._lock:
+            self._refill()
+            floor = min(floor, self.capacity - tokens)
+            if self._tokens - tokens >= floor:
+                self._tokens -= tokens
+                return 0.0
+            return (floor + tokens - self._tokens) / self.rate_per_second
+
+    def set_rate(self, rate_per_second: float) -> None:
+        """Change the refill rate, keeping the current balance"""
+        with self._lock:
+            self._refill()
+            self.rate_per_second = rate_per_second
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until tokens are available; returns the time waited"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, tokens: float = 1.0) -> float:
+        """Wait without blocking the event loop until tokens are available"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class CircuitOpenError(Exception):
+    """A provider failed repeatedly and requests to it are refused for a while"""
+
+    def __init__(self, provider: str, retry_in: float):
+        super().__init__(f"{provider} is unavailable after repeated failures, retry in {retry_in:.0f}s")
+        self.provider = provider
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a provider that keeps failing
+
+    After failure_threshold consecutive failures the circuit opens and
+    requests fail immediately. Once reset_seconds have passed one probe
+    request is let through: success closes the circuit, failure opens it
+    again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Time the circuit stays open before a probe is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """closed, open or half_open"""
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            return "half_open" if time.monotonic() - self.opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> float:
+        """
+        Admit a request
+
+        Returns:
+            0 if the request may be sent, else the seconds until the next probe
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            now = time.monotonic()
+            remaining = self.opened_at + self.reset_seconds - now
+            if remaining > 0:
+                return remaining
+            # One probe at a time; a probe that never reported back is replaced after reset_seconds
+            if self._probe_started is not None and now - self._probe_started < self.reset_seconds:
+                return self._probe_started + self.reset_seconds - now
+            self._probe_started = now
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probe_started = None
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True if it opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            reopened = self._probe_started is not None
+            self._probe_started = None
+            if reopened or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class ProviderScheduler:
+    """
+    Admission, adaptation and retry decisions for one provider's requests
+
+    Interactive requests reserve quota in arrival order. Batch requests only
+    take tokens while more than interactive_reserve of the bucket's capacity
+    is left, so an interactive request arriving during a batch finds tokens
+    waiting. The refill rate backs off multiplicatively on 429s and recovers
+    additively on successes, never above the configured quota; exhausted
+    rate-limit headers and Retry-After pause the provider until the reset.
+    """
+
+    def __init__(
+            self,
+            provider: str,
+            requests_per_minute: Optional[float] = None,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 20.0,
+            breaker: Optional[CircuitBreaker] = None,
+            interactive_reserve: float = 0.2
+    ):
+        """
+        Args:
+            provider: Provider name, used in logs and errors
+            requests_per_minute: Client-side quota (None or 0 disables the bucket)
+            max_retries: Retries of a failed request before its error is returned
+            backoff_base: Upper bound of the first retry delay in seconds, doubled per attempt
+            backoff_max: Cap of the retry delay in seconds
+            breaker: Circuit breaker (default: 5 failures, 30s)
+            interactive_reserve: Share of the burst capacity batch requests leave untouched
+        """
+        self.provider = provider
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = breaker or CircuitBreaker()
+        self.interactive_reserve = interactive_reserve
+        self.bucket: Optional[TokenBucket] = None
+        self.rate_per_second: Optional[float] = None
+        self.set_rate_limit(requests_per_minute)
+
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "throttled": 0, "failures": 0, "rejected": 0}
+
+    def set_rate_limit(self, requests_per_minute: Optional[float]) -> None:
+        """Replace the quota (None or 0 disables the bucket)"""
+        self.bucket = TokenBucket.per_minute(requests_per_minute) if requests_per_minute else None
+        self.rate_per_second = self.bucket.rate_per_second if self.bucket else None
+
+    def _check_circuit(self) -> None:
+        """Raise CircuitOpenError unless the breaker lets the request through"""
+        retry_in = self.breaker.allow()
+        if retry_in > 0:
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise CircuitOpenError(self.provider, retry_in)
+
+    def _admit(self, level: str) -> Tuple[float, bool]:
+        """Seconds to wait, and whether the request is admitted once they have passed"""
+        paused = self._paused_until - time.monotonic()
+        if paused > 0:
+            return paused, False
+
+        bucket = self.bucket
+        if bucket is None:
+            return 0.0, True
+        if level == BATCH:
+            wait = bucket.take(floor=bucket.capacity * self.interactive_reserve)
+            return wait, wait <= 0
+        # Reserved tokens are the caller's once it has waited out the deficit
+        return bucket.reserve(), True
+
+    def acquire(self) -> float:
+        """
+        Wait until a request may be sent, at the current context's priority
+        and within its scoped quota, if any
+
+        Returns:
+            Seconds waited
+
+        Raises:
+            CircuitOpenError: If the provider's circuit is open
+        """
+        self._check_circuit()
+        level = _priority.get()
+        started = time.monotonic()
+        scoped = (_scoped_buckets.get() or {}).get(self.provider)
+        if scoped is not None:
+            # The scope's own quota first, so no shared tokens are held while waiting on it
+            time.sleep(scoped.reserve())
+        while True:
+            wait, admitted = self._admit(level)
+            if wait > 0:
+                time.sleep(wait)
+            if admitted:
+                break
+        return self._record_admission(time.monotonic() - started)
+
+    async def aacquire(self) -> float:
+        """Async variant of acquire()"""
+        self._check_circuit()
+        level = _priority.get()
+        started = time.monotonic()
+        scoped = (_scoped_buckets.get() or {}).get(self.provider)
+        if scoped is not None:
+            await asyncio.sleep(scoped.reserve())
+        while True:
+            wait, admitted = self._admit(level)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            if admitted:
+                break
+        return self._record_admission(time.monotonic() - started)
+
+    def _record_admission(self, waited: float) -> float:
+        throttled = waited > 0.001
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["throttled"] += throttled
+        if throttled:
+            logger.info(f"Rate limited by {self.provider} quota for {waited:.2f}s")
+        return waited
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number attempt + 1: full jitter, or the provider's Retry-After plus jitter"""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = min(self.backoff_max, retry_after) + random.uniform(0, self.backoff_base)
+        return delay
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """Adapt to a response: pause on exhausted quota or Retry-After, and tune the refill rate"""
+        pause = 0.0
+        # Groq reports requests and tokens separately; other providers a single pair
+        for suffix in ("-requests", "-tokens", ""):
+            remaining = headers.get(f"x-ratelimit-remaining{suffix}")
+            try:
+                exhausted = remaining is not None and float(remaining) <= 0
+            except ValueError:
+                exhausted = False
+            if exhausted:
+                pause = max(pause, parse_wait(headers.get(f"x-ratelimit-reset{suffix}")) or 0.0)
+        if status in (429, 503):
+            pause = max(pause, parse_wait(headers.get("retry-after")) or 0.0)
+        if pause > 0:
+            self.pause(pause)
+
+        bucket, quota = self.bucket, self.rate_per_second
+        if bucket is None or not quota:
+            return
+        if status == 429:
+            bucket.set_rate(max(quota * 0.1, bucket.rate_per_second * 0.5))
+            logger.warning(f"{self.provider} answered 429, slowing to {bucket.rate_per_second * 60:.1f} requests/minute")
+        elif status < 400 and bucket.rate_per_second < quota:
+            bucket.set_rate(min(quota, bucket.rate_per_second + quota * 0.05))
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request to the provider for this long"""
+        seconds = min(seconds, self.backoff_max * 4)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.info(f"Pausing {self.provider} requests for {seconds:.2f}s")
+
+    def completed(self, attempt: int, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Record an answered attempt
+
+        Returns:
+            Delay before retrying it, or None if the response should be returned
+        """
+        self.observe(status, headers)
+        # A 429 means the provider is up but we are too fast; only outages count towards the circuit
+        if status in RETRY_STATUSES and status != 429:
+            self._record_failure()
+        else:
+            self.breaker.record_success()
+        if status not in RETRY_STATUSES or attempt >= self.max_retries:
+            return None
+        return self._retry(attempt, f"answered {status}", parse_wait(headers.get("retry-after")))
+
+    def failed(self, attempt: int, error: Exception) -> Optional[float]:
+        """
+        Record an attempt that got no answer (connection error, timeout)
+
+        Returns:
+            Delay before retrying it, or None if the error should be raised
+        """
+        self._record_failure()
+        if attempt >= self.max_retries:
+            return None
+        return self._retry(attempt, f"failed ({type(error).__name__})")
+
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._stats["failures"] += 1
+        if self.breaker.record_failure():
+            logger.error(f"🔌 {self.provider} circuit opened after {self.breaker.failures} consecutive failures")
+
+    def _retry(self, attempt: int, reason: str, retry_after: Optional[float] = None) -> float:
+        delay = self.backoff(attempt, retry_after)
+        with self._lock:
+            self._stats["retries"] += 1
+        logger.warning(f"{self.provider} request {reason}, retrying in {delay:.2f}s "
+                       f"(retry {attempt + 1}/{self.max_retries})")
+        return delay
+
+    def stats(self) -> Dict[str, object]:
+        """Request, retry and failure counters with the current rate and circuit state"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["circuit"] = self.breaker.state
+        if self.bucket is not None:
+            stats["requests_per_minute"] = round(self.bucket.rate_per_second * 60, 2)
+        return stats
+
+
+_schedulers: Dict[str, ProviderScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_scheduler(provider: str) -> ProviderScheduler:
+    """
+    Process-wide scheduler for a provider, built from settings on first use
+
+    Args:
+        provider: "groq" or "newsdata"
+    """
+    if provider not in _schedulers:
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unknown provider: {provider}")
+        from config.settings import settings
+
+        with _schedulers_lock:
+            if provider not in _schedulers:
+                _schedulers[provider] = ProviderScheduler(
+                    provider,
+                    requests_per_minute=getattr(settings, f"{provider.upper()}_REQUESTS_PER_MINUTE"),
+                    max_retries=settings.HTTP_MAX_RETRIES,
+                    backoff_base=settings.HTTP_BACKOFF_BASE_SECONDS,
+                    backoff_max=settings.HTTP_BACKOFF_MAX_SECONDS,
+                    breaker=CircuitBreaker(
+                        failure_threshold=settings.CIRCUIT_FAILURE_THRESHOLD,
+                        reset_seconds=settings.CIRCUIT_RESET_SECONDS
+                    ),
+                    interactive_reserve=settings.INTERACTIVE_RESERVE
+                )
+    return _schedulers[provider]
+
+
+def get_rate_limiter(provider: str) -> Optional[TokenBucket]:
+    """
+    Process-wide bucket for a provider
+
+    Args:
+        provider: "groq" or "newsdata"
+
+    Returns:
+        The shared bucket, or None when the provider is not rate limited
+    """
+    return get_scheduler(provider).bucket
+
+
+def set_rate_limit(provider: str, requests_per_minute: Optional[float]) -> None:
+    """
+    Replace a provider's shared bucket
+
+    Args:
+        provider: "groq" or "newsdata"
+        requests_per_minute: New quota (None or 0 disables limiting)
+    """
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown provider: {provider}")
+
+    get_scheduler(provider).set_rate_limit(requests_per_minute)
+    logger.info(f"Rate limit for {provider}: {requests_per_minute or 'unlimited'} requests/minute")
+
+
+def acquire(provider: str) -> None:
+    """Wait for a request slot with the provider, if it is rate limited"""
+    get_scheduler(provider).acquire()
+
+
+async def aacquire(provider: str) -> None:
+    """Async variant of acquire()"""
+    await get_scheduler(provider).aacquire()
+
+
+class ProviderRateLimiter(BaseRateLimiter):
+    """
+    LangChain rate limiter backed by a provider's shared scheduler
+
+    For clients that do not go through the shared HTTP pools (whose transport
+    schedules every request itself). The scheduler is looked up on every
+    call, so set_rate_limit() overrides apply to clients that already exist.
+    """
+
+    def __init__(self, provider: str):
+        """
+        Args:
+            provider: "groq" or "newsdata"
+        """
+        if provider not in PROVIDERS:
+            raise ValueError(f"Unknown provider: {provider}")
+        self.provider = provider
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Wait for a request slot (requests are always allowed eventually, so blocking is implied)"""
+        acquire(self.provider)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Async variant of acquire()"""
+        await aacquire(self.provider)
+        return True
@@ -0,0 +1,156 @@
+"""
+Lightweight timing spans recorded into the workflow state
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+import logging
+import os
+import time
+
+from schemas.state_schemas import Span
+
+logger = logging.getLogger(__name__)
+
+
+class _Recorder:
+    """Where spans opened in the current context go, and which span is their parent"""
+
+    def __init__(self, spans: List[Span], trace_id: str, parent: Optional[Span] = None):
+        self.spans = spans
+        self.trace_id = trace_id
+        self.parent = parent
+
+
+_current: ContextVar[Optional[_Recorder]] = ContextVar("news_gatherer_span", default=None)
+
+
+def new_trace_id() -> str:
+    """Random 128-bit trace id in OpenTelemetry's hex form"""
+    return os.urandom(16).hex()
+
+
+def recording() -> bool:
+    """Whether spans opened here are recorded"""
+    return _current.get() is not None
+
+
+@contextmanager
+def trace(spans: List[Span], trace_id: str) -> Iterator[None]:
+    """
+    Record spans opened in this context (and contexts copied from it) into a list
+
+    Args:
+        spans: List that completed spans are appended to (e.g. state["spans"])
+        trace_id: Trace the spans belong to
+    """
+    token = _current.set(_Recorder(spans, trace_id))
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attributes: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Time a block as a child of the innermost open span
+
+    Outside trace() this is a no-op. Spans are appended when they end, so
+    children precede their parents in the list.
+
+    Example:
+        with span("llm.chat", kind="llm", model=model) as attrs:
+            response = llm.invoke(messages)
+            attrs["completion_tokens"] = ...
+
+    Args:
+        name: What is being timed (e.g. "node.agent", "newsdata.page")
+        kind: node, llm, http, tool or internal
+        **attributes: Initial span attributes
+
+    Yields:
+        The span's attribute dict, to add attributes while the block runs
+    """
+    recorder = _current.get()
+    if recorder is None:
+        yield dict(attributes)
+        return
+
+    record: Span = {
+        "trace_id": recorder.trace_id,
+        "span_id": os.urandom(8).hex(),
+        "parent_id": recorder.parent["span_id"] if recorder.parent else None,
+        "name": name,
+        "kind": kind,
+        "start": time.time(),
+        "duration": 0.0,
+        "status": "ok",
+        "attributes": dict(attributes),
+    }
+    token = _current.set(_Recorder(recorder.spans, recorder.trace_id, record))
+    started = time.perf_counter()
+    try:
+        yield record["attributes"]
+    except BaseException as e:
+        record["status"] = "error"
+        record["attributes"]["error"] = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record["duration"] = time.perf_counter() - started
+        _current.reset(token)
+        recorder.spans.append(record)
+
+
+def annotate(**attributes: Any) -> None:
+    """Add attributes to the innermost open span, if any (e.g. cache_hit from deep inside a client)"""
+    recorder = _current.get()
+    if recorder is not None and recorder.parent is not None:
+        recorder.parent["attributes"].update(attributes)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_OTLP_KINDS = {"llm": 3, "http": 3}  # SPAN_KIND_CLIENT, everything else SPAN_KIND_INTERNAL
+
+
+def to_otlp(spans: List[Span], service_name: str = "news-gatherer") -> Dict[str, Any]:
+    """
+    Spans as an OTLP/JSON ExportTraceServiceRequest
+
+    The result can be POSTed to an OpenTelemetry collector's /v1/traces
+    endpoint or written out as JSON lines.
+    """
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [
+                    {
+                        "traceId": s["trace_id"],
+                        "spanId": s["span_id"],
+                        "parentSpanId": s["parent_id"] or "",
+                        "name": s["name"],
+                        "kind": _OTLP_KINDS.get(s["kind"], 1),
+                        "startTimeUnixNano": str(int(s["start"] * 1e9)),
+                        "endTimeUnixNano": str(int((s["start"] + s["duration"]) * 1e9)),
+                        "attributes": [
+                            {"key": key, "value": _otlp_value(value)}
+                            for key, value in s["attributes"].items() if value is not None
+                        ],
+                        "status": {"code": 2 if s["status"] == "error" else 1},
+                    }
+                    for s in spans
+                ],
+            }],
+        }]
+    }
@@ -1,14 +1,15 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
+from typing import Any, Optional
 from pathlib import Path
+import logging
 import os
-from dotenv import load_dotenv
+import threading
 
+logger = logging.getLogger(__name__)
 
-# Load .env file from project root
+# .env file in the project root, loaded the first time settings are read
 env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
 
 
 class Settings(BaseSettings):
@@ -18,6 +19,10 @@ class Settings(BaseSettings):
         description="Groq API key for Llama models"
     )
     NEWSDATA_API_KEY: str = Field(description="NewsData API key")
+    NEWSDATA_API_BASE: str = Field(
+        default="https://newsdata.io/api/1/",
+        description="NewsData API root URL"
+    )
 
     # Model Configuration
     LLM_MODEL: str = Field(
@@ -36,18 +41,322 @@ class Settings(BaseSettings):
         description="Maximum tokens for LLM response"
     )
 
+    # HTTP Connection Pool
+    HTTP_POOL_SIZE: int = Field(
+        default=20,
+        gt=0,
+        description="Keep-alive connections in the shared HTTP pool"
+    )
+    HTTP_KEEPALIVE_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="How long idle pooled connections are kept open"
+    )
+    HTTP_TIMEOUT_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Timeout for outbound HTTP requests"
+    )
+
+    # Rate Limits
+    GROQ_REQUESTS_PER_MINUTE: Optional[float] = Field(
+        default=30,
+        ge=0,
+        description="Client-side Groq request quota (0 disables limiting)"
+    )
+    NEWSDATA_REQUESTS_PER_MINUTE: Optional[float] = Field(
+        default=30,
+        ge=0,
+        description="Client-side NewsData request quota (0 disables limiting)"
+    )
+    INTERACTIVE_RESERVE: float = Field(
+        default=0.2,
+        ge=0.0,
+        lt=1.0,
+        description="Share of each provider's burst capacity that batch runs leave to interactive requests"
+    )
+
+    # Retries
+    HTTP_MAX_RETRIES: int = Field(
+        default=3,
+        ge=0,
+        description="Retries of a provider request answered with 429/5xx or a connection error"
+    )
+    HTTP_BACKOFF_BASE_SECONDS: float = Field(
+        default=0.5,
+        gt=0,
+        description="Upper bound of the first retry delay, doubled on every further retry"
+    )
+    HTTP_BACKOFF_MAX_SECONDS: float = Field(
+        default=20.0,
+        gt=0,
+        description="Longest delay before a retry, including waits asked for by Retry-After"
+    )
+    CIRCUIT_FAILURE_THRESHOLD: int = Field(
+        default=5,
+        gt=0,
+        description="Consecutive failed requests after which a provider's requests fail fast"
+    )
+    CIRCUIT_RESET_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time a provider's requests fail fast before a probe request is let through"
+    )
+
     # Agent Configuration
     MAX_ARTICLES_PER_FETCH: int = Field(
         default=10,
         gt=0,
         description="Maximum articles to fetch per request"
     )
+    NEWS_MAX_PAGES: int = Field(
+        default=3,
+        gt=0,
+        description="Result pages fetch_news may walk to reach MAX_ARTICLES_PER_FETCH"
+    )
+    NEWS_FETCH_TIME_BUDGET_SECONDS: float = Field(
+        default=10.0,
+        gt=0,
+        description="Time after which fetch_news stops waiting for further pages"
+    )
     TOP_ARTICLES_TO_SELECT: int = Field(
         default=5,
         gt=0,
         description="Number of top articles to select"
     )
 
+    BATCH_MAX_CONCURRENCY: int = Field(
+        default=4,
+        gt=0,
+        description="Workflows run in parallel by run_batch"
+    )
+    TOOL_MAX_WORKERS: int = Field(
+        default=4,
+        gt=0,
+        description="Tool calls of one agent message executed in parallel"
+    )
+    TOOL_TIMEOUT_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time after which a tool call is reported to the agent as timed out"
+    )
+    NEWS_MULTI_MAX_QUERIES: int = Field(
+        default=4,
+        gt=0,
+        description="Query variants a single fetch_news_multi call may fetch"
+    )
+    NEWS_MULTI_MAX_CONCURRENCY: int = Field(
+        default=4,
+        gt=0,
+        description="Query variants fetch_news_multi fetches in parallel"
+    )
+
+    # Deduplication
+    DEDUP_ENABLED: bool = Field(
+        default=True,
+        description="Collapse syndicated and near-duplicate articles in fetch_news"
+    )
+    DEDUP_MIN_SIMILARITY: float = Field(
+        default=0.5,
+        gt=0.0,
+        le=1.0,
+        description="Title/description Jaccard similarity at which articles count as duplicates"
+    )
+
+    # Pre-ranking
+    RANKING_ENABLED: bool = Field(
+        default=True,
+        description="Score fetched articles locally and send only the best to the LLM"
+    )
+    RANK_TOP_K: int = Field(
+        default=10,
+        gt=0,
+        description="Articles passed to the LLM after pre-ranking"
+    )
+    RANK_RECENCY_HALF_LIFE_HOURS: float = Field(
+        default=48.0,
+        gt=0,
+        description="Article age at which the recency score halves"
+    )
+
+    # Context compaction
+    COMPACTION_ENABLED: bool = Field(
+        default=True,
+        description="Summarize superseded tool results before each agent step"
+    )
+    CONTEXT_TOKEN_BUDGET: int = Field(
+        default=6000,
+        ge=0,
+        description="Estimated prompt tokens allowed per agent step; the latest results are trimmed to fit (0 = no limit)"
+    )
+
+    # Tool Payload
+    PAYLOAD_FIELDS: str = Field(
+        default="id,title,description,content,link,source_name,pub_date,category,duplicate_sources",
+        description="Comma-separated article fields sent to the LLM (empty keeps all; id is always sent)"
+    )
+    PAYLOAD_CONTENT_MAX_CHARS: int = Field(
+        default=800,
+        ge=0,
+        description="Truncate article content to this many characters (0 = no limit)"
+    )
+    PAYLOAD_CONTENT_MAX_SENTENCES: int = Field(
+        default=0,
+        ge=0,
+        description="Truncate article content to this many sentences (0 = no limit)"
+    )
+    PAYLOAD_FORMAT: str = Field(
+        default="compact",
+        description="Article encoding: json, compact or tsv"
+    )
+    PAYLOAD_TOKEN_BUDGET: int = Field(
+        default=0,
+        ge=0,
+        description="Pack only as many articles as fit in this many tokens (0 = no limit)"
+    )
+
+    # News Cache
+    NEWS_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Serve repeated fetch_news requests from the response cache"
+    )
+    NEWS_CACHE_TTL_SECONDS: int = Field(
+        default=900,
+        gt=0,
+        description="Freshness window for cached NewsData responses"
+    )
+    NEWS_CACHE_MEMORY_ENTRIES: int = Field(
+        default=256,
+        gt=0,
+        description="Number of responses kept in the in-memory LRU tier"
+    )
+    NEWS_CACHE_PATH: Optional[str] = Field(
+        default=".cache/news_cache.sqlite3",
+        description="SQLite file for the on-disk tier (empty disables it)"
+    )
+    NEWS_CACHE_DISK_MAX_MB: int = Field(
+        default=64,
+        gt=0,
+        description="Size budget of the on-disk tier in megabytes"
+    )
+
+    # LLM Cache
+    LLM_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Replay responses of identical temperature-0 LLM calls"
+    )
+    LLM_CACHE_TTL_SECONDS: int = Field(
+        default=86400,
+        gt=0,
+        description="How long a cached LLM response stays valid"
+    )
+    LLM_CACHE_MEMORY_ENTRIES: int = Field(
+        default=256,
+        gt=0,
+        description="LLM responses kept in the in-memory LRU tier"
+    )
+    LLM_CACHE_PATH: Optional[str] = Field(
+        default=".cache/llm_cache.sqlite3",
+        description="SQLite file for the LLM on-disk tier (empty disables it)"
+    )
+    LLM_CACHE_DISK_MAX_MB: int = Field(
+        default=64,
+        gt=0,
+        description="Size of the LLM disk tier before least recently used entries are evicted"
+    )
+
+    # Checkpointing
+    CHECKPOINT_ENABLED: bool = Field(
+        default=False,
+        description="Checkpoint every workflow step so interrupted runs resume where they stopped"
+    )
+    CHECKPOINT_PATH: Optional[str] = Field(
+        default=".cache/checkpoints.sqlite3",
+        description="SQLite file for workflow checkpoints (empty keeps them in memory)"
+    )
+    CHECKPOINT_KEEP_PER_THREAD: int = Field(
+        default=2,
+        gt=0,
+        description="Newest checkpoints kept per run"
+    )
+    CHECKPOINT_TTL_SECONDS: int = Field(
+        default=86400,
+        gt=0,
+        description="Time after its last step at which a run's checkpoints are dropped"
+    )
+    CHECKPOINT_MAX_THREADS: int = Field(
+        default=1000,
+        gt=0,
+        description="Runs kept in the checkpoint store; the least recently active beyond it are dropped"
+    )
+
+    # Incremental Editions
+    SEEN_INDEX_PATH: Optional[str] = Field(
+        default=".cache/seen_articles.sqlite3",
+        description="SQLite file of the articles each edition has covered (empty keeps it in memory)"
+    )
+    SEEN_INDEX_MAX_AGE_DAYS: float = Field(
+        default=14.0,
+        gt=0,
+        description="Time after an edition last covered an article at which it is forgotten"
+    )
+    SEEN_INDEX_MAX_ENTRIES: int = Field(
+        default=200_000,
+        gt=0,
+        description="Article keys kept across all editions; the least recently covered beyond it are evicted"
+    )
+    EDITION_WINDOW_OVERLAP_MINUTES: int = Field(
+        default=15,
+        ge=0,
+        description="Extra minutes before the last run an edition fetches, for articles NewsData indexes late"
+    )
+
+    # Service
+    SERVICE_AGENT_POOL_SIZE: int = Field(
+        default=4,
+        gt=0,
+        description="Warm agents the HTTP service runs workflows on concurrently"
+    )
+    SERVICE_QUEUE_SIZE: int = Field(
+        default=16,
+        gt=0,
+        description="Requests allowed to wait for a free agent before answering 429"
+    )
+    SERVICE_REQUEST_TIMEOUT_SECONDS: float = Field(
+        default=120.0,
+        gt=0,
+        description="Time after which a queued or running request is answered with 504"
+    )
+
+    # Worker Processes
+    WORKER_PROCESSES: int = Field(
+        default=0,
+        ge=0,
+        description="Processes the pre-fork worker pool runs (0 = one per CPU core)"
+    )
+    WORKER_THREADS: int = Field(
+        default=2,
+        gt=0,
+        description="Runs each worker process executes concurrently, to overlap provider waits"
+    )
+    CACHE_MMAP_MB: int = Field(
+        default=64,
+        ge=0,
+        description="Megabytes of each cache's SQLite file memory-mapped and shared through the OS page cache (0 disables)"
+    )
+
+    # Prompts
+    PROMPT_RELOAD_CHECK_SECONDS: float = Field(
+        default=2.0,
+        ge=0,
+        description="How often the prompt YAML is checked for changes (0 disables hot reload)"
+    )
+    PROMPT_CACHE_SIZE: int = Field(
+        default=64,
+        ge=0,
+        description="Rendered system prompts memoized per prompt version"
+    )
+
     # Logging
     LOG_LEVEL: str = Field(
         default="INFO",
@@ -73,14 +382,44 @@ class Settings(BaseSettings):
     #         )
 
 
-# Global settings instance
-try:
-    settings = Settings()
-    print(f"Settings loaded successfully from {env_path}")
-    print(f"LLM Model: {settings.LLM_MODEL}")
-    print(f"Log Level: {settings.LOG_LEVEL}")
-    print(f"Max Articles: {settings.MAX_ARTICLES_PER_FETCH}")
-except Exception as e:
-    print(f"ERROR: Error loading settings: {e}")
-    raise
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
+
+
+def get_settings() -> Settings:
+    """
+    Process-wide settings, loaded from the environment and .env on first use
+
+    Importing this module has no side effects, so tools and short-lived
+    processes only pay for reading configuration when they need it.
+    """
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                from dotenv import load_dotenv
+
+                load_dotenv(dotenv_path=env_path)
+                try:
+                    _settings = Settings()
+                except Exception as e:
+                    logger.error(f"Error loading settings: {e}")
+                    raise
+                logger.debug(f"Settings loaded from {env_path} (LLM model: {_settings.LLM_MODEL}, "
+                             f"log level: {_settings.LOG_LEVEL}, max articles: {_settings.MAX_ARTICLES_PER_FETCH})")
+    return _settings
+
+
+def configure_logging() -> None:
+    """Root logging at LOG_LEVEL; does nothing if logging is already configured"""
+    logging.basicConfig(
+        level=get_settings().LOG_LEVEL,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
 
+def __getattr__(name: str) -> Any:
+    # `from config.settings import settings` keeps working, resolved on first access
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,6 +15,8 @@ def print_results(state):
     print(f"Status: {state['status']}")
     print(f"Tool Calls: {state['tool_calls_count']}")
     print(f"Timestamp: {state['timestamp']}")
+    if state.get("edition"):
+        print(f"Edition: {state['edition']['name']} ({state['edition']['skipped']} already covered articles skipped)")
     
     if state.get('error'):
         print(f"❌ Error: {state['error']}")
@@ -45,6 +47,17 @@ def print_results(state):
             except Exception as e:
                 pass
 
+    if state.get("final_articles"):
+        print(f"\n{'='*80}")
+        print(f"📰 SELECTED ARTICLES")
+        print(f"{'='*80}\n")
+
+        for article in state["final_articles"]:
+            print(f"{article['rank']}. {article['title']}")
+            print(f"   Source: {article.get('source_name')} | Published: {article.get('pub_date')}")
+            print(f"   Link: {article.get('link')}")
+            print(f"   Why: {article['reason']}\n")
+
 
 if __name__ == "__main__":
     # Initialize agent
@@ -70,4 +83,33 @@ if __name__ == "__main__":
     #                 "with good depth and interesting content.",
     #     top_articles=3
     # )
-    # print_results(result2)
\ No newline at end of file
+    # print_results(result2)
+
+    # # Example 3: Several topics in parallel
+    # print("\n\n🚀 EXAMPLE 3: Batch of topic newsletters")
+    # batch = agent.run_batch(
+    #     [
+    #         "Latest breakthroughs in quantum computing",
+    #         {"user_request": "Major climate policy decisions this week", "top_articles": 3},
+    #     ],
+    #     max_concurrency=4
+    # )
+    # for result in batch:
+    #     print_results(result["state"])
+    # print(batch.report())
+
+    # # Example 4: Stream progress and the analysis as it is generated
+    # print("\n\n🚀 EXAMPLE 4: Streaming")
+    # for event in agent.stream("Latest developments in renewable energy storage", top_articles=3):
+    #     if event["type"] == "node":
+    #         print(f"\n▶️  {event['node']}")
+    #     elif event["type"] == "tool_start":
+    #         print(f"  🔧 {event['tool']} {json.dumps(event['args'])}")
+    #     elif event["type"] == "tool_end":
+    #         print(f"  ✅ {event['tool']} {event['status']} in {event['seconds']:.2f}s")
+    #     elif event["type"] == "token":
+    #         print(event["content"], end="", flush=True)
+    #     elif event["type"] == "article":
+    #         print(f"  📰 #{event['article']['rank']} {event['article']['title']}")
+    #     elif event["type"] == "done":
+    #         print_results(event["state"])
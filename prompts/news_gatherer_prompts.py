@@ -1,39 +1,168 @@
 """
 Prompt loader for news gatherer agent using YAML
 """
-import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple, Union
 import logging
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+_formatter = Formatter()
+
+# Literal text, or (field name, conversion, format spec) of a replacement field
+_Part = Union[str, Tuple[str, Optional[str], str]]
+
+
+class PromptTemplate:
+    """
+    A str.format template parsed once into literal and field parts
+
+    Rendering joins the parts instead of re-parsing the template text, and
+    produces exactly what template.format(**variables) would.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self.parts: List[_Part] = []
+        for literal, field, spec, conversion in _formatter.parse(template):
+            if literal:
+                self.parts.append(literal)
+            if field is not None:
+                if not field or field.isdigit():
+                    raise ValueError(f"Positional field in prompt template: {{{field}}}")
+                self.parts.append((field, conversion, spec or ""))
+        self.fields = {part[0] for part in self.parts if isinstance(part, tuple)}
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        Raises:
+            KeyError: If a field has no value in variables
+        """
+        pieces = []
+        for part in self.parts:
+            if isinstance(part, str):
+                pieces.append(part)
+                continue
+            field, conversion, spec = part
+            value, _ = _formatter.get_field(field, (), variables)
+            if conversion:
+                value = _formatter.convert_field(value, conversion)
+            if spec and "{" in spec:
+                # Nested fields in the spec, e.g. {title:{width}}
+                spec = spec.format(**variables)
+            pieces.append(format(value, spec))
+        return "".join(pieces)
+
+
+class PromptVersion:
+    """
+    One immutable load of the prompt file: metadata, default variables and
+    compiled templates, plus the system prompts rendered from it
+    """
+
+    def __init__(self, prompts: Dict[str, Any], mtime_ns: int, cache_size: int):
+        self.prompts = prompts
+        self.mtime_ns = mtime_ns
+        self.metadata: Dict[str, Any] = prompts.get('metadata', {}) or {}
+        self.variables: Dict[str, Any] = dict(prompts.get('variables', {}) or {})
+        self.system = PromptTemplate(prompts.get('system_prompt', ''))
+        self.user = PromptTemplate(prompts.get('user_prompt', ''))
+        self.cache_size = cache_size
+        self._rendered: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[str]:
+        return self.metadata.get('version')
+
+    def merged(self, overrides: Dict[str, Any]) -> Dict[str, Any]:
+        """Default variables with per-call overrides, as a new dict"""
+        variables = dict(self.variables)
+        variables.update(overrides)
+        return variables
+
+    def system_prompt(self, overrides: Dict[str, Any]) -> str:
+        """Rendered system prompt, memoized by the variables it was rendered with"""
+        try:
+            key = tuple(sorted(overrides.items()))
+            hash(key)
+        except TypeError:
+            # Unhashable variable values are rendered every time
+            return self.system.render(self.merged(overrides))
+
+        with self._lock:
+            rendered = self._rendered.get(key)
+            if rendered is not None:
+                self._rendered.move_to_end(key)
+                return rendered
+
+        rendered = self.system.render(self.merged(overrides))
+        if self.cache_size:
+            with self._lock:
+                self._rendered[key] = rendered
+                while len(self._rendered) > self.cache_size:
+                    self._rendered.popitem(last=False)
+        return rendered
+
 
 class NewsGathererPrompts:
-    """Loads and manages prompts from YAML file"""
+    """
+    Loads and manages prompts from YAML file
+
+    Templates are compiled once per version of the file. Every
+    reload_interval seconds the next read checks the file's mtime and, if it
+    changed, loads the new version and swaps it in with a single reference
+    assignment: readers never wait on a reload and always render from one
+    complete version. A file that fails to load leaves the current version
+    in place.
+    """
 
-    def __init__(self, yaml_path: str = "prompts/news_gatherer.yaml"):
+    def __init__(
+            self,
+            yaml_path: str = "prompts/news_gatherer.yaml",
+            reload_interval: Optional[float] = None,
+            cache_size: Optional[int] = None
+    ):
         """
         Initialize prompt loader
 
         Args:
             yaml_path: Path to the YAML prompt file
+            reload_interval: Seconds between checks for a changed file, 0 to disable
+                (default: PROMPT_RELOAD_CHECK_SECONDS)
+            cache_size: Rendered system prompts kept per version (default: PROMPT_CACHE_SIZE)
         """
+        from config.settings import settings
+
         self.yaml_path = Path(yaml_path)
-        self._prompts: Dict[str, Any] = {}
-        self._load_prompts()
+        self.reload_interval = settings.PROMPT_RELOAD_CHECK_SECONDS if reload_interval is None else reload_interval
+        self.cache_size = settings.PROMPT_CACHE_SIZE if cache_size is None else cache_size
+        self._reload_lock = threading.Lock()
+        self._next_check = 0.0
+        self._failed_mtime_ns: Optional[int] = None
+        self._current: PromptVersion = self._load_prompts()
+        self._schedule_check()
         logger.info(f"Loaded prompts from: {self.yaml_path}")
 
-    def _load_prompts(self):
+    def _load_prompts(self) -> PromptVersion:
         """Load prompts from YAML file"""
+        import yaml
+
         try:
+            mtime_ns = os.stat(self.yaml_path).st_mtime_ns
             with open(self.yaml_path, 'r', encoding='utf-8') as f:
-                self._prompts = yaml.safe_load(f)
+                prompts = yaml.safe_load(f) or {}
+            version = PromptVersion(prompts, mtime_ns, self.cache_size)
 
             # Log metadata
-            metadata = self._prompts.get('metadata', {})
-            logger.info(f"Prompt version: {metadata.get('version')}")
-            logger.info(f"Last updated: {metadata.get('last_updated')}")
+            logger.info(f"Prompt version: {version.metadata.get('version')}")
+            logger.info(f"Last updated: {version.metadata.get('last_updated')}")
+            return version
 
         except FileNotFoundError:
             logger.error(f"Prompt file not found: {self.yaml_path}")
@@ -42,6 +171,38 @@ class NewsGathererPrompts:
             logger.error(f"Error parsing YAML: {e}")
             raise
 
+    def _schedule_check(self) -> None:
+        self._next_check = time.monotonic() + self.reload_interval
+
+    def _prompt_version(self) -> PromptVersion:
+        """The current version, after picking up a changed file if a check is due"""
+        if self.reload_interval and time.monotonic() >= self._next_check:
+            # One reader checks; the others keep rendering the current version
+            if self._reload_lock.acquire(blocking=False):
+                try:
+                    self._schedule_check()
+                    self._reload_if_changed()
+                finally:
+                    self._reload_lock.release()
+        return self._current
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime_ns = os.stat(self.yaml_path).st_mtime_ns
+        except OSError as e:
+            logger.error(f"Cannot check prompt file {self.yaml_path}: {e}")
+            return
+        # Unchanged, or the same broken edit that already failed to load
+        if mtime_ns in (self._current.mtime_ns, self._failed_mtime_ns):
+            return
+        try:
+            self._current = self._load_prompts()
+        except Exception as e:
+            self._failed_mtime_ns = mtime_ns
+            logger.error(f"Keeping prompt version {self._current.version}, reload failed: {e}")
+            return
+        logger.info(f"Prompts reloaded from {self.yaml_path} (version {self._current.version})")
+
     def get_system_prompt(self, **kwargs) -> str:
         """
         Get system prompt with variable substitution
@@ -52,14 +213,8 @@ class NewsGathererPrompts:
         Returns:
             Formatted system prompt
         """
-        prompt_template = self._prompts.get('system_prompt', '')
-
-        # Merge default variables with provided kwargs
-        variables = self._prompts.get('variables', {})
-        variables.update(kwargs)
-
         try:
-            return prompt_template.format(**variables)
+            return self._prompt_version().system_prompt(kwargs)
         except KeyError as e:
             logger.error(f"Missing variable in system prompt: {e}")
             raise ValueError(f"Missing required variable: {e}")
@@ -75,25 +230,47 @@ class NewsGathererPrompts:
         Returns:
             Formatted user prompt
         """
-        prompt_template = self._prompts.get('user_prompt', '')
-
-        # Merge default variables with provided kwargs
-        variables = self._prompts.get('variables', {})
-        variables.update(kwargs)
+        version = self._prompt_version()
+        variables = version.merged(kwargs)
         variables['user_request'] = user_request
 
         try:
-            return prompt_template.format(**variables)
+            return version.user.render(variables)
         except KeyError as e:
             logger.error(f"Missing variable in user prompt: {e}")
             raise ValueError(f"Missing required variable: {e}")
 
     def get_metadata(self) -> Dict[str, Any]:
         """Get prompt metadata"""
-        return self._prompts.get('metadata', {})
+        return self._prompt_version().metadata
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version of the prompts currently served"""
+        return self._current.version
 
     def reload(self):
         """Reload prompts from file"""
-        self._load_prompts()
+        with self._reload_lock:
+            self._current = self._load_prompts()
+            self._schedule_check()
         logger.info("Prompts reloaded")
 
+
+_shared: Dict[str, NewsGathererPrompts] = {}
+_shared_lock = threading.Lock()
+
+
+def get_prompts(yaml_path: str = "prompts/news_gatherer.yaml") -> NewsGathererPrompts:
+    """
+    Process-wide prompts for a file, so every agent renders from the same
+    compiled version and picks up an edit at the same time
+    """
+    key = os.path.abspath(yaml_path)
+    prompts = _shared.get(key)
+    if prompts is None:
+        with _shared_lock:
+            prompts = _shared.get(key)
+            if prompts is None:
+                prompts = _shared[key] = NewsGathererPrompts(yaml_path)
+    return prompts
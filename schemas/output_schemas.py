@@ -0,0 +1,23 @@
+"""
+Structured output the agent produces with its final tool call
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class SelectedArticle(BaseModel):
+    """One selected article, referenced by the id it was fetched under"""
+
+    id: str = Field(description="id of the article exactly as given in the fetch results")
+    reason: str = Field(description="1-2 sentences on why this article earns its place in the newsletter")
+
+
+class ArticleSelection(BaseModel):
+    """The final curated selection, best article first"""
+
+    articles: List[SelectedArticle] = Field(description="Selected articles, best first")
+    notes: Optional[str] = Field(
+        default=None,
+        description="Optional 2-4 sentences on overall findings, content quality or gaps for the editor"
+    )
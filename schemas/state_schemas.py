@@ -13,12 +13,135 @@ class NewsGathererState(TypedDict):
     # configuration
     top_articles_count: int
 
+    # Articles shown to the agent so far, by id
+    fetched_articles: Dict[str, Dict]
+
     # Output
-    final_articles: Optional[List[Dict]]
+    final_articles: Optional[List["FinalArticle"]]
     status: str
     timestamp: str
 
     # Metadata
-    tool_calls_count: int
+    tool_calls_count: int  # News tool calls; the final select_articles call is not counted
+    tool_timings: List["ToolTiming"]
     error: Optional[str]
 
+    # Instrumentation
+    trace_id: str
+    spans: List["Span"]
+
+    # Checkpoint thread the run is stored under (None without checkpointing)
+    thread_id: Optional[str]
+
+    # Recurring edition the run belongs to (None for a one-off run)
+    edition: Optional["Edition"]
+
+
+class Edition(TypedDict):
+    name: str
+
+    # Fetch window start as a Unix timestamp (None on the edition's first run) and this run's start
+    since: Optional[float]
+    started_at: float
+
+    # Fetched articles dropped because an earlier run already covered them
+    skipped: int
+
+
+class FinalArticle(TypedDict, total=False):
+    # Position in the agent's selection, best first (from 1) and its justification
+    rank: int
+    reason: str
+
+    # The fetched article the selection refers to
+    id: str
+    title: str
+    description: str
+    content: str
+    link: str
+    source_id: str
+    source_name: str
+    pub_date: str
+    image_url: str
+    keywords: List[str]
+    category: List[str]
+
+
+class ToolTiming(TypedDict):
+    tool: str
+    tool_call_id: str
+
+    # success, error or timeout
+    status: str
+    seconds: float
+
+
+
+class Span(TypedDict):
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+
+    # e.g. node.agent, llm.chat, tool.fetch_news, news.collect, newsdata.page
+    name: str
+    # node, llm, http, tool or internal
+    kind: str
+
+    # Start as a Unix timestamp, duration in seconds
+    start: float
+    duration: float
+
+    # ok or error
+    status: str
+    # Token counts, response bytes, cache_hit flags, ...
+    attributes: Dict
+
+
+class StreamEvent(TypedDict, total=False):
+    # node, token, tool_start, tool_end, article or done
+    type: str
+
+    # node: graph node being entered; token: node that generated the text
+    node: str
+
+    # tool_start / tool_end
+    tool: str
+    tool_call_id: str
+    args: Dict
+    status: str
+    seconds: float
+
+    # token: generated text
+    content: str
+
+    # article: one selected article, as soon as the agent has streamed it
+    article: FinalArticle
+
+    # done: final workflow state
+    state: NewsGathererState
+
+
+class BatchResult(TypedDict):
+    # Position of the request in the submitted batch
+    index: int
+    user_request: str
+
+    # Final workflow state (None if the run raised)
+    state: Optional[NewsGathererState]
+    error: Optional[str]
+    latency_seconds: float
+
+
+class BatchReport(TypedDict):
+    total: int
+    completed: int
+    failed: int
+    wall_seconds: float
+    throughput_per_second: float
+
+    # Per-run latency in seconds
+    latency_mean: float
+    latency_p50: float
+    latency_p95: float
+    latency_p99: float
+    latency_max: float
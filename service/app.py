@@ -0,0 +1,217 @@
+"""
+ASGI entry point for running the news gatherer as a long-lived HTTP service
+
+Serve with any ASGI server, e.g.:
+    uvicorn service.app:app --host 0.0.0.0 --port 8000
+
+Endpoints:
+    POST /curate   {"user_request": "...", "top_articles": 5, "thread_id": "..."}
+                   (thread_id is optional; resending it resumes an interrupted run)
+    GET  /healthz
+    GET  /metrics  Prometheus text format
+"""
+from typing import Any, Awaitable, Callable, Dict, Optional
+import asyncio
+import json
+import logging
+
+from clients.http import aclose_http_client
+from schemas.state_schemas import NewsGathererState
+from service.metrics import Metrics
+from service.pool import AgentPool, PoolOverloaded
+
+logger = logging.getLogger(__name__)
+
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+MAX_BODY_BYTES = 64 * 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _final_analysis(state: NewsGathererState) -> Optional[str]:
+    """Notes of the agent's selection, or the content of its last non-tool-call message"""
+    from langchain_core.messages import AIMessage
+
+    from agents.selection import selection_call
+
+    for msg in reversed(state["messages"]):
+        if not isinstance(msg, AIMessage):
+            continue
+        selection = selection_call(msg)
+        if selection is not None:
+            return selection["args"].get("notes")
+        if not msg.tool_calls and msg.content:
+            return msg.content
+    return None
+
+
+def _response_body(result: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-serializable summary of a finished workflow"""
+    state = result["state"]
+    return {
+        "status": state["status"],
+        "analysis": _final_analysis(state),
+        "final_articles": state.get("final_articles"),
+        "error": state.get("error"),
+        "tool_calls_count": state["tool_calls_count"],
+        "tool_timings": state.get("tool_timings", []),
+        "timings": result["timings"],
+        "trace_id": state.get("trace_id"),
+        "thread_id": state.get("thread_id"),
+        "spans": state.get("spans", []),
+        "timestamp": state["timestamp"],
+    }
+
+
+class CurationService:
+    """
+    Raw ASGI application around an AgentPool
+
+    The pool is built during the ASGI lifespan startup, so the first request
+    is served by warm agents. Requests beyond the pool's queue are answered
+    with 429 and a Retry-After header.
+    """
+
+    def __init__(self, pool: Optional[AgentPool] = None, request_timeout: Optional[float] = None):
+        """
+        Args:
+            pool: Agent pool to serve from (default: sized from the SERVICE_* settings)
+            request_timeout: Seconds before a request is answered with 504 (default: from settings)
+        """
+        from config.settings import settings
+
+        self.pool = pool or AgentPool(
+            size=settings.SERVICE_AGENT_POOL_SIZE,
+            queue_size=settings.SERVICE_QUEUE_SIZE,
+            metrics=Metrics()
+        )
+        self.metrics = self.pool.metrics
+        self.request_timeout = request_timeout or settings.SERVICE_REQUEST_TIMEOUT_SECONDS
+
+    async def startup(self) -> None:
+        await self.pool.start()
+
+    async def shutdown(self) -> None:
+        await self.pool.stop()
+        await aclose_http_client()
+
+    async def __call__(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive: Receive, send: Send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await self.startup()
+                except Exception as e:
+                    logger.error(f"Service startup failed: {str(e)}")
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope: Dict[str, Any], receive: Receive, send: Send) -> None:
+        method, path = scope["method"], scope["path"]
+        try:
+            if path == "/curate":
+                if method != "POST":
+                    raise HTTPError(405, "Use POST")
+                body = await self._curate(await self._read_json(receive))
+                await self._send_json(send, 200, body)
+            elif path == "/healthz" and method == "GET":
+                status = 200 if self.pool.started else 503
+                await self._send_json(send, status, {
+                    "status": "ok" if self.pool.started else "starting",
+                    "agents": self.pool.size,
+                    "queue_depth": self.pool.queue_depth()
+                })
+            elif path == "/metrics" and method == "GET":
+                await self._send(send, 200, self.metrics.render().encode("utf-8"),
+                                 b"text/plain; version=0.0.4; charset=utf-8")
+            else:
+                raise HTTPError(404, f"No route for {method} {path}")
+
+        except PoolOverloaded as e:
+            await self._send_json(send, 429, {"error": str(e)}, headers=[(b"retry-after", b"1")])
+        except HTTPError as e:
+            await self._send_json(send, e.status, {"error": str(e)})
+        except Exception as e:
+            logger.error(f"Error handling {method} {path}: {str(e)}")
+            await self._send_json(send, 500, {"error": str(e)})
+
+    async def _curate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        user_request = payload.get("user_request")
+        top_articles = payload.get("top_articles")
+        thread_id = payload.get("thread_id")
+        if not isinstance(user_request, str) or not user_request.strip():
+            raise HTTPError(400, "user_request must be a non-empty string")
+        if top_articles is not None and (not isinstance(top_articles, int) or top_articles <= 0):
+            raise HTTPError(400, "top_articles must be a positive integer")
+        if thread_id is not None and (not isinstance(thread_id, str) or not thread_id.strip()):
+            raise HTTPError(400, "thread_id must be a non-empty string")
+        if not self.pool.started:
+            raise HTTPError(503, "Agent pool is starting")
+
+        try:
+            result = await asyncio.wait_for(self.pool.submit(user_request, top_articles, thread_id), self.request_timeout)
+        except asyncio.TimeoutError:
+            self.metrics.inc("requests_total", "Curation requests by outcome", status="timeout")
+            raise HTTPError(504, f"Request not completed within {self.request_timeout}s")
+        return _response_body(result)
+
+    @staticmethod
+    async def _read_json(receive: Receive) -> Dict[str, Any]:
+        chunks, size = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                raise HTTPError(400, "Client disconnected")
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > MAX_BODY_BYTES:
+                raise HTTPError(413, f"Body larger than {MAX_BODY_BYTES} bytes")
+            chunks.append(chunk)
+            if not message.get("more_body"):
+                break
+        try:
+            payload = json.loads(b"".join(chunks) or b"{}")
+        except ValueError:
+            raise HTTPError(400, "Body must be JSON")
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "Body must be a JSON object")
+        return payload
+
+    async def _send_json(self, send: Send, status: int, payload: Dict[str, Any], headers=None) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+        await self._send(send, status, body, b"application/json", headers)
+
+    @staticmethod
+    async def _send(send: Send, status: int, body: bytes, content_type: bytes, headers=None) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(b"content-type", content_type), (b"content-length", str(len(body)).encode())]
+                       + list(headers or [])
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def create_app() -> CurationService:
+    """Service configured from settings"""
+    return CurationService()
+
+
+app = create_app()
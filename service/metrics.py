@@ -0,0 +1,140 @@
+"""
+In-process counters, gauges and latency summaries rendered as Prometheus text
+"""
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Tuple
+import threading
+
+from agents.batch import percentile
+from schemas.state_schemas import Span
+
+QUANTILES = (50, 95, 99)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: Labels, **extra: str) -> str:
+    pairs = list(labels) + sorted(extra.items())
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+class Metrics:
+    """
+    Minimal metrics registry for the curation service
+
+    Summaries keep the last `window` observations per label set for
+    quantiles, plus an all-time count and sum. Gauges are callables read at
+    render time so they always report the current value.
+    """
+
+    def __init__(self, namespace: str = "news_gatherer", window: int = 1024):
+        """
+        Args:
+            namespace: Prefix of every metric name
+            window: Recent observations kept per summary for quantiles
+        """
+        self.namespace = namespace
+        self.window = window
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = defaultdict(lambda: defaultdict(float))
+        self._summaries: Dict[str, Dict[Labels, Deque[float]]] = defaultdict(dict)
+        self._summary_totals: Dict[str, Dict[Labels, list]] = defaultdict(dict)
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def _name(self, name: str, kind: str, help_text: str) -> str:
+        full_name = f"{self.namespace}_{name}"
+        self._help.setdefault(full_name, (kind, help_text))
+        return full_name
+
+    def inc(self, name: str, help_text: str = "", value: float = 1.0, **labels: str) -> None:
+        """Increase a counter"""
+        with self._lock:
+            self._counters[self._name(name, "counter", help_text)][_labels(labels)] += value
+
+    def observe(self, name: str, seconds: float, help_text: str = "", **labels: str) -> None:
+        """Record one latency observation in a summary"""
+        key = _labels(labels)
+        with self._lock:
+            full_name = self._name(name, "summary", help_text)
+            samples = self._summaries[full_name].get(key)
+            if samples is None:
+                samples = self._summaries[full_name][key] = deque(maxlen=self.window)
+                self._summary_totals[full_name][key] = [0, 0.0]
+            samples.append(seconds)
+            totals = self._summary_totals[full_name][key]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def gauge(self, name: str, read: Callable[[], float], help_text: str = "") -> None:
+        """Register a gauge whose value is read at render time"""
+        with self._lock:
+            self._gauges[self._name(name, "gauge", help_text)] = read
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines = []
+        with self._lock:
+            for name, read in self._gauges.items():
+                lines += self._header(name)
+                lines.append(f"{name} {float(read())}")
+
+            for name, series in self._counters.items():
+                lines += self._header(name)
+                for labels, value in series.items():
+                    lines.append(f"{name}{_format_labels(labels)} {value}")
+
+            for name, series in self._summaries.items():
+                lines += self._header(name)
+                for labels, samples in series.items():
+                    values = list(samples)
+                    for pct in QUANTILES:
+                        lines.append(f"{name}{_format_labels(labels, quantile=str(pct / 100))} {percentile(values, pct)}")
+                    count, total = self._summary_totals[name][labels]
+                    lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _header(self, name: str) -> list:
+        kind, help_text = self._help[name]
+        header = [f"# HELP {name} {help_text}"] if help_text else []
+        return header + [f"# TYPE {name} {kind}"]
+
+
+def record_spans(metrics: Metrics, spans: List[Span]) -> None:
+    """
+    Aggregate a run's spans into metrics
+
+    Every span feeds span_seconds by name and kind. Token counts, response
+    bytes and cache hit/miss flags found in span attributes feed counters,
+    so hot spots stay visible across thousands of runs.
+    """
+    for s in spans:
+        attributes = s["attributes"]
+        metrics.observe("span_seconds", s["duration"], "Duration of workflow spans", span=s["name"], kind=s["kind"])
+
+        if "cache_hit" in attributes:
+            metrics.inc("cache_lookups_total", "Cache lookups by span and outcome",
+                        span=s["name"], result="hit" if attributes["cache_hit"] else "miss")
+        if attributes.get("coalesced"):
+            metrics.inc("coalesced_total", "Requests that joined an identical in-flight request", span=s["name"])
+        if s["kind"] == "llm" and not attributes.get("cache_hit"):
+            for field in ("prompt_tokens", "completion_tokens"):
+                if attributes.get(field):
+                    metrics.inc("llm_tokens_total", "Tokens billed by the LLM provider",
+                                value=attributes[field], type=field.split("_")[0])
+        if attributes.get("retries"):
+            metrics.inc("provider_retries_total", "Provider requests retried after a 429, 5xx or connection error",
+                        value=attributes["retries"], span=s["name"])
+        if attributes.get("response_bytes"):
+            metrics.inc("response_bytes_total", "Bytes returned by upstream APIs",
+                        value=attributes["response_bytes"], span=s["name"])
+        if s["status"] == "error":
+            metrics.inc("span_errors_total", "Spans that ended with an exception", span=s["name"])
@@ -0,0 +1,169 @@
+"""
+Warm pool of news gatherer agents behind a bounded request queue
+"""
+from typing import Any, Dict, List, Optional
+import asyncio
+import logging
+import time
+
+from agents.news_gatherer import NewsGathererAgent
+from schemas.state_schemas import NewsGathererState
+from service.metrics import Metrics, record_spans
+
+logger = logging.getLogger(__name__)
+
+
+class PoolOverloaded(Exception):
+    """The request queue is full; the caller should retry later"""
+
+
+class AgentPool:
+    """
+    Fixed set of pre-built agents serving curation requests from a queue
+
+    Every agent is constructed (settings, prompts, compiled graph, shared LLM
+    clients) before the first request arrives. Requests wait in a bounded
+    queue for a free agent; once queue_size requests are waiting, submit()
+    fails fast with PoolOverloaded instead of letting latency grow without
+    bound.
+    """
+
+    def __init__(self, size: int = 4, queue_size: int = 16, metrics: Optional[Metrics] = None):
+        """
+        Args:
+            size: Agents, i.e. workflows executed concurrently
+            queue_size: Requests allowed to wait for a free agent
+            metrics: Registry for queue depth and per-stage latency (default: a new one)
+        """
+        self.size = size
+        self.queue_size = queue_size
+        self.metrics = metrics or Metrics()
+
+        self._agents: List[NewsGathererAgent] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self.busy = 0
+
+        self.metrics.gauge("queue_depth", self.queue_depth, "Requests waiting for a free agent")
+        self.metrics.gauge("agents_busy", lambda: self.busy, "Agents currently running a workflow")
+        self.metrics.gauge("agents_total", lambda: len(self._workers), "Agents in the pool")
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def started(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Build the agents and start one worker per agent on the running loop"""
+        if self.started:
+            return
+
+        started = time.perf_counter()
+        # Graph compilation and prompt loading are blocking work
+        self._agents = await asyncio.to_thread(lambda: [NewsGathererAgent() for _ in range(self.size)])
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._workers = [
+            asyncio.create_task(self._work(agent), name=f"agent-worker-{i}")
+            for i, agent in enumerate(self._agents)
+        ]
+        logger.info(f"Agent pool ready: {self.size} agents, queue of {self.queue_size} "
+                    f"({time.perf_counter() - started:.2f}s)")
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued requests fail with CancelledError"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while self._queue is not None and not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def submit(self, user_request: str, top_articles: Optional[int] = None,
+                     thread_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run one curation request on the next free agent
+
+        Args:
+            user_request: Natural language description of news to fetch
+            top_articles: Number of articles to select (default: from settings)
+            thread_id: Checkpoint thread, to resume an interrupted run of the request
+
+        Returns:
+            The final state plus per-stage timings (queue wait and each graph node)
+
+        Raises:
+            PoolOverloaded: If queue_size requests are already waiting
+        """
+        if not self.started:
+            raise RuntimeError("Agent pool is not started")
+
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((user_request, top_articles, thread_id, time.perf_counter(), future))
+        except asyncio.QueueFull:
+            self.metrics.inc("requests_total", "Curation requests by outcome", status="rejected")
+            raise PoolOverloaded(f"{self.queue_size} requests already queued")
+        return await future
+
+    async def _work(self, agent: NewsGathererAgent) -> None:
+        while True:
+            user_request, top_articles, thread_id, enqueued, future = await self._queue.get()
+            if future.cancelled():
+                continue
+
+            self.busy += 1
+            try:
+                queued = time.perf_counter() - enqueued
+                self._observe_stage("queue", queued)
+                result = await self._run(agent, user_request, top_articles, thread_id)
+                result["timings"].insert(0, {"stage": "queue", "seconds": queued})
+                status = result["state"]["status"]
+                record_spans(self.metrics, result["state"].get("spans", []))
+                if not future.cancelled():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                logger.error(f"Error serving request: {str(e)}")
+                status = "error"
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.busy -= 1
+
+            if future.cancelled():
+                # The caller gave up (504) and has counted the request already
+                continue
+            self.metrics.inc("requests_total", "Curation requests by outcome", status=status)
+            self.metrics.observe("request_seconds", time.perf_counter() - enqueued,
+                                 "End-to-end request latency including queueing")
+
+    async def _run(self, agent: NewsGathererAgent, user_request: str,
+                   top_articles: Optional[int], thread_id: Optional[str]) -> Dict[str, Any]:
+        """Stream the workflow to time every node it passes through"""
+        timings: List[Dict[str, Any]] = []
+        state: Optional[NewsGathererState] = None
+        stage, stage_started = None, time.perf_counter()
+
+        async for event in agent.astream(user_request, top_articles, thread_id):
+            if event["type"] not in ("node", "done"):
+                continue
+            now = time.perf_counter()
+            if stage is not None:
+                timings.append({"stage": stage, "seconds": now - stage_started})
+                self._observe_stage(stage, now - stage_started)
+            stage, stage_started = event.get("node"), now
+            if event["type"] == "done":
+                state = event["state"]
+
+        return {"state": state, "timings": timings}
+
+    def _observe_stage(self, stage: str, seconds: float) -> None:
+        self.metrics.observe("stage_seconds", seconds, "Time spent per stage (queue and each graph node)", stage=stage)
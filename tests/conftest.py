@@ -0,0 +1,8 @@
+"""
+Shared test setup: settings that do not depend on a local .env or network access
+"""
+import os
+
+os.environ.setdefault("NEWSDATA_API_KEY", "test-key")
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
@@ -0,0 +1,129 @@
+"""
+Tests for the SQLite checkpoint store
+"""
+import operator
+from typing import Annotated, List, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+from agents.news_gatherer import NewsGathererAgent
+from benchmarks.stubs import GroqStub, NewsDataStub
+from clients.checkpoint import SQLiteCheckpointSaver
+from clients.llm import LLMClientRegistry
+from config.settings import settings
+
+
+class _State(TypedDict):
+    steps: Annotated[List[str], operator.add]
+    articles: List[dict]
+
+
+def _graph(saver):
+    workflow = StateGraph(_State)
+    workflow.add_node("agent", lambda state: {"steps": ["agent"]})
+    workflow.add_node("tools", lambda state: {"steps": ["tools"]})
+    workflow.set_entry_point("agent")
+    workflow.add_edge("agent", "tools")
+    workflow.add_edge("tools", END)
+    return workflow.compile(checkpointer=saver)
+
+
+def _config(thread_id):
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def test_saved_state_round_trips(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite3")
+    saver = SQLiteCheckpointSaver(path=path)
+    _graph(saver).invoke({"steps": ["start"]}, _config("run-1"))
+
+    saved = saver.get_tuple(_config("run-1"))
+    assert saved.checkpoint["channel_values"]["steps"] == ["start", "agent", "tools"]
+    assert saver.get_tuple(_config("run-2")) is None
+
+    # Reopening the file finds the same state
+    reopened = SQLiteCheckpointSaver(path=path)
+    assert reopened.get_tuple(_config("run-1")).checkpoint == saved.checkpoint
+    assert _graph(reopened).get_state(_config("run-1")).values == {"steps": ["start", "agent", "tools"]}
+
+
+def test_threads_keep_only_their_newest_checkpoints(tmp_path):
+    saver = SQLiteCheckpointSaver(path=str(tmp_path / "checkpoints.sqlite3"), keep_per_thread=2)
+    graph = _graph(saver)
+    graph.invoke({"steps": ["a"]}, _config("run-1"))
+    graph.invoke({"steps": ["b"]}, _config("run-2"))
+
+    kept = list(saver.list(_config("run-1")))
+    assert len(kept) == 2
+    assert kept[0].checkpoint["channel_values"]["steps"] == ["a", "agent", "tools"]
+    assert saver.stats()["threads"] == 2
+
+    saver.delete_thread("run-1")
+    assert saver.get_tuple(_config("run-1")) is None
+    assert saver.get_tuple(_config("run-2")) is not None
+
+
+def test_pruning_keeps_values_of_kept_checkpoints(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite3")
+    saver = SQLiteCheckpointSaver(path=path, keep_per_thread=1, sweep_interval=0)
+    articles = [{"id": f"id{i}", "content": "Long article text. " * 50} for i in range(20)]
+    graph = _graph(saver)
+    graph.invoke({"steps": ["start"], "articles": articles}, _config("run-1"))
+
+    # articles was written by the first checkpoint only; the one kept still refers to it
+    assert len(list(saver.list(_config("run-1")))) == 1
+    stats = saver.stats()
+    assert stats["stored_checkpoints"] == 1
+    assert stats["blobs_dropped"] > 0
+
+    saver.sweep()
+    reopened = SQLiteCheckpointSaver(path=path)
+    values = _graph(reopened).get_state(_config("run-1")).values
+    assert values == {"steps": ["start", "agent", "tools"], "articles": articles}
+
+
+class _Crash(Exception):
+    """Stands in for the process dying"""
+
+
+@pytest.fixture
+def stubbed_apis(monkeypatch):
+    """The agent wired to local Groq and NewsData stubs, with response caches off"""
+    with GroqStub() as groq, NewsDataStub(articles=10) as news:
+        monkeypatch.setenv("GROQ_API_BASE", groq.base_url)
+        monkeypatch.setattr(settings, "NEWSDATA_API_BASE", news.api_base)
+        monkeypatch.setattr(settings, "NEWS_CACHE_ENABLED", False)
+        monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+        yield groq, news
+
+
+def test_interrupted_run_resumes_after_tools(tmp_path, monkeypatch, stubbed_apis):
+    groq, news = stubbed_apis
+    path = str(tmp_path / "checkpoints.sqlite3")
+    request = "Latest news on artificial intelligence"
+
+    def crash(state):
+        raise _Crash()
+
+    agent = NewsGathererAgent(llm_clients=LLMClientRegistry(), checkpointer=SQLiteCheckpointSaver(path=path))
+    with monkeypatch.context() as patch:
+        # The run dies in rank, right after tools completed
+        patch.setattr(agent, "_latest_tool_messages", crash)
+        with pytest.raises(_Crash):
+            agent.run(request, top_articles=2, thread_id="run-1")
+    assert (groq.requests, news.requests) == (1, 1)
+
+    # A fresh process on the same store picks up at rank: tools are not run again
+    resumed = NewsGathererAgent(llm_clients=LLMClientRegistry(), checkpointer=SQLiteCheckpointSaver(path=path))
+    assert resumed.graph.get_state(_config("run-1")).next == ("rank",)
+    state = resumed.run(request, top_articles=2, thread_id="run-1")
+
+    assert state["status"] == "completed"
+    assert len(state["final_articles"]) == 2
+    assert state["tool_calls_count"] == 1
+    assert (groq.requests, news.requests) == (2, 1)
+
+    # The finished run is returned as is
+    assert resumed.run(request, top_articles=2, thread_id="run-1")["final_articles"] == state["final_articles"]
+    assert groq.requests == 2
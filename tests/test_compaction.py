@@ -0,0 +1,92 @@
+"""
+Tests for compaction of the conversation sent to the LLM
+"""
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from agents.compaction import ConversationCompactor, message_tokens
+from tools.dedup import article_id
+from tools.payload import PayloadProjector
+
+# PAYLOAD_FIELDS without link: ids cannot be recomputed from the projected cells
+PROJECTOR = PayloadProjector(fields=["id", "title", "description"], fmt="tsv")
+
+
+def _articles(prefix, count):
+    articles = [{"title": f"{prefix} story {i}", "link": f"https://x.com/{prefix}/{i}",
+                 "description": "A description long enough to cost a few dozen tokens per article row. " * 2}
+                for i in range(count)]
+    return [{"id": article_id(article), **article} for article in articles]
+
+
+def _round(call_id, query, articles):
+    call = AIMessage(content="", tool_calls=[{"name": "fetch_news", "args": {"query": query}, "id": call_id}])
+    result = ToolMessage(content=PROJECTOR.render(articles, {"q": query}), tool_call_id=call_id, name="fetch_news")
+    return [call, result]
+
+
+def _conversation():
+    return [
+        SystemMessage(content="You curate news."),
+        HumanMessage(content="Latest AI news"),
+        *_round("call-1", "ai", _articles("first", 10)),
+        *_round("call-2", "ai chips", _articles("second", 30)),
+    ]
+
+
+def test_superseded_result_becomes_id_summary():
+    messages = _conversation()
+    stats = ConversationCompactor().compact(messages)
+
+    summary = json.loads(messages[3].content)
+    assert summary["superseded"] is True
+    assert summary["count"] == 10
+    assert summary["query_params"] == {"q": "ai"}
+    # The ids the agent was shown, not ones recomputed without the link
+    fetched = _articles("first", 10)
+    assert [a["id"] for a in summary["articles"]] == [a["id"] for a in fetched]
+    assert summary["articles"][0]["id"] != article_id({"title": "first story 0"})
+    assert summary["articles"][0]["title"] == "first story 0"
+
+    # The latest round is kept in full without a budget
+    latest = json.loads(messages[5].content)
+    assert latest["count"] == 30 and "superseded" not in latest
+    assert stats["superseded"] == 1 and stats["trimmed"] == 0
+
+    # Summaries are left alone on the next step
+    again = ConversationCompactor().compact(messages)
+    assert again["superseded"] == 0
+
+
+def test_latest_result_is_trimmed_to_budget():
+    untrimmed = _conversation()
+    ConversationCompactor().compact(untrimmed)
+    full = sum(message_tokens(m) for m in untrimmed)
+
+    budget = full - 300
+    messages = _conversation()
+    stats = ConversationCompactor(token_budget=budget).compact(messages)
+
+    assert stats["trimmed"] == 1
+    assert stats["tokens_after"] <= budget
+    assert sum(message_tokens(m) for m in messages) == stats["tokens_after"]
+
+    latest = json.loads(messages[5].content)
+    rows = latest["articles"].split("\n")
+    # Lowest-ranked articles go first, the best ones stay
+    assert 0 < latest["count"] == len(rows) < 30
+    assert latest["omitted"] == 30 - len(rows)
+    ids = [a["id"] for a in _articles("second", 30)]
+    assert [row.split("\t")[0] for row in rows] == ids[:len(rows)]
+
+
+def test_superseded_error_text_is_shortened():
+    messages = [
+        HumanMessage(content="Latest AI news"),
+        AIMessage(content="", tool_calls=[{"name": "fetch_news", "args": {}, "id": "call-1"}]),
+        ToolMessage(content="upstream failure " * 100, tool_call_id="call-1", name="fetch_news"),
+        *_round("call-2", "ai", _articles("second", 2)),
+    ]
+    ConversationCompactor().compact(messages)
+    assert len(messages[2].content) == 300
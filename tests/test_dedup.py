@@ -0,0 +1,59 @@
+"""
+Tests for collapsing syndicated and near-duplicate articles
+"""
+from tools.dedup import ArticleDeduplicator, article_id, normalize_link
+
+
+def _article(title, description="", link="", source="", content=""):
+    return {"title": title, "description": description, "link": link, "source_name": source, "content": content}
+
+
+def test_links_normalize_to_the_same_id():
+    links = [
+        "https://www.example.com/ai/story/",
+        "http://example.com/ai/story?utm_source=feed",
+        "https://EXAMPLE.com/ai/story#comments",
+    ]
+    assert {normalize_link(link) for link in links} == {"example.com/ai/story"}
+    assert len({article_id({"link": link}) for link in links}) == 1
+    # Without a link the title identifies the article
+    assert article_id({"title": " Big News "}) == article_id({"title": "big news"})
+
+
+def test_syndicated_copies_collapse_into_the_richest():
+    articles = [
+        _article("OpenAI releases new model", "A short blurb", "https://a.com/1", "Outlet A", "short"),
+        _article("OpenAI releases new model", "A short blurb", "https://b.com/2", "Outlet B", "much longer " * 20),
+        _article("Stock markets rally on rate cut hopes", "Markets rose", "https://c.com/3", "Outlet C"),
+    ]
+    unique = ArticleDeduplicator().deduplicate(articles)
+
+    assert [a["title"] for a in unique] == ["OpenAI releases new model", "Stock markets rally on rate cut hopes"]
+    assert unique[0]["source_name"] == "Outlet B"
+    assert unique[0]["duplicate_sources"] == ["Outlet A"]
+    assert "duplicate_sources" not in unique[1]
+
+
+def test_near_duplicates_cluster_and_distinct_stories_do_not():
+    description = "The company unveiled a faster chip for training large language models on Tuesday"
+    articles = [
+        _article("Nvidia unveils faster AI training chip", description, "https://a.com/x"),
+        _article("Nvidia unveils a faster AI training chip", description + " in San Jose", "https://b.com/y"),
+        _article("Local council approves new bike lanes", "Cycling routes expand downtown", "https://c.com/z"),
+    ]
+    assert ArticleDeduplicator(min_similarity=0.5).cluster(articles) == [[0, 1], [2]]
+
+
+def test_incremental_adds_match_a_single_pass():
+    articles = [
+        _article(f"Story {i % 4} about topic {i % 4}", f"Details of topic {i % 4}", f"https://site{i}.com/{i % 4}")
+        for i in range(12)
+    ]
+    batch = ArticleDeduplicator()
+    expected = batch.cluster(articles)
+
+    incremental = ArticleDeduplicator()
+    for start in range(0, len(articles), 5):
+        incremental.add(articles[start:start + 5])
+    assert incremental.clusters() == expected
+    assert incremental.unique_count == len(expected) == 4
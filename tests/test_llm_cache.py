@@ -0,0 +1,101 @@
+"""
+Tests for the LLM response cache
+"""
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+from clients import tracing
+from clients.llm import LLMClientRegistry
+from clients.llm_cache import LLMResponseCache
+
+LLM_STRING = '{"lc": 1, "type": "constructor", "id": ["ChatGroq"], "kwargs": {"model_name": "m", "temperature": 0.0}}---[("stop", None)]'
+
+
+def _prompt(**ai_fields):
+    return dumps([HumanMessage(content="AI news"), AIMessage(content="Fetching", **ai_fields)])
+
+
+def _answer(text="Done"):
+    return [ChatGeneration(message=AIMessage(content=text))]
+
+
+def test_key_ignores_volatile_message_fields_and_http_clients(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"))
+    cache.update(_prompt(id="run-1", usage_metadata={"input_tokens": 10, "output_tokens": 2, "total_tokens": 12}),
+                 LLM_STRING, _answer())
+
+    other_ids = _prompt(id="run-2", usage_metadata={"input_tokens": 11, "output_tokens": 3, "total_tokens": 14},
+                        response_metadata={"model_name": "m"})
+    other_client = LLM_STRING.replace('"temperature": 0.0}', '"temperature": 0.0, "http_client": "<client 0x1>"}')
+    hit = cache.lookup(other_ids, other_client)
+    assert hit is not None and hit[0].message.content == "Done"
+
+    # A different conversation or sampling setting is a different entry
+    assert cache.lookup(dumps([HumanMessage(content="Climate news")]), LLM_STRING) is None
+    assert cache.lookup(other_ids, LLM_STRING.replace("0.0", "0.5")) is None
+
+
+def test_entries_expire_after_ttl(tmp_path, monkeypatch):
+    import tools.news_cache
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(tools.news_cache.time, "time", lambda: now[0])
+    cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"), ttl_seconds=60)
+    cache.update(_prompt(), LLM_STRING, _answer())
+
+    now[0] += 59
+    assert cache.lookup(_prompt(), LLM_STRING) is not None
+    now[0] += 2
+    assert cache.lookup(_prompt(), LLM_STRING) is None
+    assert cache.stats()["expired"] >= 1
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = LLMResponseCache(max_memory_entries=2)
+    prompts = [dumps([HumanMessage(content=f"topic {i}")]) for i in range(3)]
+    cache.update(prompts[0], LLM_STRING, _answer("0"))
+    cache.update(prompts[1], LLM_STRING, _answer("1"))
+    cache.lookup(prompts[0], LLM_STRING)  # 0 is now the most recent
+    cache.update(prompts[2], LLM_STRING, _answer("2"))
+
+    assert cache.lookup(prompts[1], LLM_STRING) is None
+    assert cache.lookup(prompts[0], LLM_STRING)[0].text == "0"
+    assert cache.lookup(prompts[2], LLM_STRING)[0].text == "2"
+
+
+def test_disk_tier_stays_within_its_size_budget(tmp_path):
+    cache = LLMResponseCache(path=str(tmp_path / "llm.sqlite3"), max_memory_entries=1, max_disk_bytes=2000)
+    for i in range(20):
+        cache.update(dumps([HumanMessage(content=f"topic {i}")]), LLM_STRING, _answer("x" * 200))
+
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= 2000
+    assert stats["evictions"] > 0
+    # The newest entry survives eviction
+    assert cache.lookup(dumps([HumanMessage(content="topic 19")]), LLM_STRING) is not None
+
+
+def test_sampled_clients_skip_the_cache():
+    cache = LLMResponseCache()
+    registry = LLMClientRegistry(cache=cache)
+
+    assert registry._response_cache(0.0) is cache
+    assert registry._response_cache(0.7) is None
+    assert registry.get_llm(model="m", temperature=0.7, max_tokens=16).cache is False
+    assert registry.get_llm(model="m", temperature=0.0, max_tokens=16).cache is cache
+
+
+def test_hit_is_reported_on_the_current_span():
+    cache = LLMResponseCache()
+    cache.update(_prompt(), LLM_STRING, _answer())
+
+    spans = []
+    with tracing.trace(spans, tracing.new_trace_id()):
+        with tracing.span("llm.chat", kind="llm"):
+            cache.lookup(_prompt(), LLM_STRING)
+        with tracing.span("llm.chat", kind="llm"):
+            cache.lookup(dumps([HumanMessage(content="uncached")]), LLM_STRING)
+
+    assert spans[0]["attributes"].get("cache_hit") is True
+    assert "cache_hit" not in spans[1]["attributes"]
@@ -0,0 +1,53 @@
+"""
+Tests for projecting fetched articles into the payload sent to the LLM
+"""
+import json
+
+import pytest
+
+from tools.payload import PayloadProjector, estimate_tokens
+
+ARTICLES = [
+    {"id": f"id{i}", "title": f"Title {i}", "link": f"https://x.com/{i}", "keywords": ["ai", "chips"],
+     "content": "First sentence. Second sentence. Third sentence.", "image_url": "https://x.com/i.png"}
+    for i in range(5)
+]
+
+
+def test_projection_whitelists_fields_and_truncates_content():
+    projector = PayloadProjector(fields=["id", "title", "content"], content_max_sentences=1)
+    projected = projector.project(ARTICLES[0])
+    assert list(projected) == ["id", "title", "content"]
+    assert projected["content"] == "First sentence.…"
+
+    by_chars = PayloadProjector(content_max_chars=20)
+    assert by_chars.truncate("Several words that run past the limit") == "Several words that…"
+    assert by_chars.truncate("Short") == "Short"
+
+
+def test_tsv_rows_line_up_with_columns():
+    projector = PayloadProjector(fields=["id", "title", "keywords"], fmt="tsv")
+    payload = json.loads(projector.render(ARTICLES[:2], {"q": "ai"}))
+
+    assert payload["status"] == "success" and payload["count"] == 2
+    assert payload["columns"] == ["id", "title", "keywords"]
+    rows = [dict(zip(payload["columns"], row.split("\t"))) for row in payload["articles"].split("\n")]
+    assert rows[1] == {"id": "id1", "title": "Title 1", "keywords": "ai,chips"}
+
+
+@pytest.mark.parametrize("fmt", ["json", "compact", "tsv"])
+def test_token_budget_omits_trailing_articles(fmt):
+    unlimited = PayloadProjector(fields=["id", "title", "content"], fmt=fmt).render(ARTICLES, {"q": "ai"})
+    budget = estimate_tokens(unlimited) // 2
+    payload = json.loads(PayloadProjector(fields=["id", "title", "content"], fmt=fmt, token_budget=budget)
+                         .render(ARTICLES, {"q": "ai"}, candidates=20, previously_seen=3))
+
+    assert 0 < payload["count"] < len(ARTICLES)
+    assert payload["omitted"] == len(ARTICLES) - payload["count"]
+    assert payload["candidates"] == 20
+    assert payload["previously_seen"] == 3
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        PayloadProjector(fmt="xml")
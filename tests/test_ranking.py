@@ -0,0 +1,50 @@
+"""
+Tests for deterministic pre-ranking of fetched articles
+"""
+from datetime import datetime, timedelta, timezone
+
+from tools.ranking import PAID_CONTENT_PLACEHOLDER, ArticleRanker, tokenize
+
+
+def test_tokenize_drops_stopwords():
+    assert tokenize("Get the latest news on Quantum Computing!") == ["quantum", "computing"]
+
+
+def test_bm25_prefers_documents_matching_rarer_terms():
+    ranker = ArticleRanker()
+    documents = [
+        tokenize("quantum computing breakthrough at the lab"),
+        tokenize("computing prices fall"),
+        tokenize("football results"),
+    ]
+    scores = ranker.relevance(documents, tokenize("quantum computing"))
+    assert scores[0] == 1.0
+    assert scores[0] > scores[1] > scores[2] == 0.0
+    assert ranker.relevance(documents, []) == [0.0, 0.0, 0.0]
+
+
+def test_recency_halves_every_half_life():
+    ranker = ArticleRanker(recency_half_life_hours=24)
+    now = datetime(2025, 1, 2, 12, 0, tzinfo=timezone.utc)
+    day_old = (now - timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
+    assert abs(ranker.recency(day_old, now) - 0.5) < 1e-9
+    assert ranker.recency(now.strftime("%Y-%m-%d %H:%M:%S"), now) == 1.0
+    assert ranker.recency("not a date", now) == 0.0
+
+
+def test_paid_placeholder_counts_as_no_content():
+    placeholder = {"content": PAID_CONTENT_PLACEHOLDER}
+    assert ArticleRanker.richness(placeholder) == ArticleRanker.richness({})
+    assert ArticleRanker.richness({"content": "x" * 4000, "description": "d", "image_url": "i", "keywords": ["k"]}) == 1.0
+
+
+def test_rank_keeps_top_k_best_first_and_ties_in_input_order():
+    ranker = ArticleRanker(weights={"relevance": 1.0, "richness": 0.0, "credibility": 0.0, "recency": 0.0})
+    articles = [
+        {"title": "Football roundup"},
+        {"title": "Quantum computing milestone"},
+        {"title": "Gardening tips"},
+        {"title": "Cooking tips"},
+    ]
+    ranked = ranker.rank(articles, "quantum computing", top_k=3)
+    assert [a["title"] for a in ranked] == ["Quantum computing milestone", "Football roundup", "Gardening tips"]
@@ -0,0 +1,120 @@
+"""
+Tests for client-side scheduling of provider requests
+"""
+import time
+
+from agents.batch import BatchRun
+from clients import rate_limit
+from clients.rate_limit import ProviderScheduler, TokenBucket
+
+
+def test_scoped_quota_applies_only_inside_the_block():
+    scheduler = ProviderScheduler("groq")
+    bucket = TokenBucket(rate_per_second=10.0, capacity=1.0)
+
+    with rate_limit.scoped_quota({"groq": bucket}):
+        assert scheduler.acquire() < 0.01
+        assert scheduler.acquire() >= 0.05
+
+    # Outside the block only the (unlimited) shared scheduler applies
+    started = time.monotonic()
+    for _ in range(5):
+        scheduler.acquire()
+    assert time.monotonic() - started < 0.05
+    assert scheduler.bucket is None
+
+
+class _Agent:
+    """Stands in for NewsGathererAgent: one Groq request per run"""
+
+    def __init__(self):
+        self.waits = []
+
+    def run(self, user_request, top_articles=None, edition=None):
+        self.waits.append(rate_limit.get_scheduler("groq").acquire())
+        return {"status": "completed", "error": None}
+
+
+def test_batch_rate_limit_leaves_shared_quota_alone():
+    shared = rate_limit.get_scheduler("groq")
+    bucket_before, rate_before = shared.bucket, shared.rate_per_second
+
+    agent = _Agent()
+    batch = BatchRun(agent, ["a", "b", "c"], max_concurrency=1, rate_limit={"groq": 600})
+    # A bucket of one minute's burst: shrink it so the third run has to wait
+    batch.quota["groq"] = TokenBucket(rate_per_second=10.0, capacity=2.0)
+    assert [r["error"] for r in batch] == [None, None, None]
+    assert max(agent.waits) >= 0.05
+
+    assert shared.bucket is bucket_before
+    assert shared.rate_per_second == rate_before
+
+
+def test_bucket_bursts_to_capacity_then_waits_at_its_rate():
+    bucket = TokenBucket(rate_per_second=10.0, capacity=3.0)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Reservations go into debt and are served in arrival order
+    assert abs(bucket.reserve() - 0.1) < 0.01
+    assert abs(bucket.reserve() - 0.2) < 0.01
+
+
+def test_take_never_goes_into_debt_or_below_its_floor():
+    bucket = TokenBucket(rate_per_second=10.0, capacity=5.0)
+    assert bucket.take(floor=3.0) == 0.0
+    assert bucket.take(floor=3.0) == 0.0
+    wait = bucket.take(floor=3.0)
+    assert 0.05 < wait <= 0.1
+    # The refused take left the balance for reserve()
+    assert bucket.reserve() == 0.0
+
+
+def test_circuit_opens_after_threshold_and_closes_after_a_good_probe(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    breaker = rate_limit.CircuitBreaker(failure_threshold=3, reset_seconds=30)
+
+    assert [breaker.record_failure() for _ in range(3)] == [False, False, True]
+    assert breaker.state == "open"
+    assert breaker.allow() == 30.0
+
+    now[0] += 30
+    assert breaker.state == "half_open"
+    assert breaker.allow() == 0.0
+    # Only one probe at a time
+    assert breaker.allow() > 0
+
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.allow() == 0.0
+
+
+def test_failed_probe_reopens_the_circuit(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    breaker = rate_limit.CircuitBreaker(failure_threshold=1, reset_seconds=10)
+    breaker.record_failure()
+
+    now[0] += 10
+    assert breaker.allow() == 0.0
+    assert breaker.record_failure() is True
+    assert breaker.state == "open"
+
+
+def test_open_circuit_rejects_requests():
+    scheduler = ProviderScheduler("newsdata", breaker=rate_limit.CircuitBreaker(failure_threshold=1))
+    scheduler.breaker.record_failure()
+    try:
+        scheduler.acquire()
+    except rate_limit.CircuitOpenError as e:
+        assert e.provider == "newsdata" and e.retry_in > 0
+    else:
+        raise AssertionError("acquire() admitted a request while the circuit was open")
+
+
+def test_parse_wait_reads_seconds_durations_and_dates():
+    assert rate_limit.parse_wait("2") == 2.0
+    assert rate_limit.parse_wait("1m30s") == 90.0
+    assert rate_limit.parse_wait("120ms") == 0.12
+    assert rate_limit.parse_wait(str(time.time() + 5)) <= 5.0
+    assert rate_limit.parse_wait("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert rate_limit.parse_wait("soon") is None
+    assert rate_limit.parse_wait(None) is None
@@ -0,0 +1,60 @@
+"""
+Tests for the index of articles covered by earlier editions
+"""
+import time
+
+from tools.seen_index import SeenArticleIndex, article_keys
+
+FIRST = {"title": "Chip maker beats forecasts", "description": "Quarterly revenue rose", "link": "https://a.com/chips"}
+SECOND = {"title": "Rain expected this weekend", "description": "Forecasters warn of storms", "link": "https://b.com/rain"}
+
+
+def test_republished_story_keeps_its_text_key():
+    moved = dict(FIRST, link="https://mirror.example.com/chips-story")
+    assert set(article_keys(FIRST)) & set(article_keys(moved))
+    assert not set(article_keys(FIRST)) & set(article_keys(SECOND))
+
+
+def test_recorded_articles_are_skipped_per_edition(tmp_path):
+    index = SeenArticleIndex(path=str(tmp_path / "seen.sqlite3"))
+    assert index.last_run("hourly-ai") is None
+
+    started = time.time()
+    index.record("hourly-ai", started, [FIRST])
+    assert index.last_run("hourly-ai") == started
+    assert index.unseen("hourly-ai", [FIRST, SECOND]) == [SECOND]
+    assert index.unseen("hourly-ai", [dict(FIRST, link="https://mirror.example.com/x")]) == []
+    # Other editions are unaffected
+    assert index.unseen("daily-weather", [FIRST, SECOND]) == [FIRST, SECOND]
+
+    index.forget("hourly-ai")
+    assert index.unseen("hourly-ai", [FIRST]) == [FIRST]
+    assert index.last_run("hourly-ai") is None
+
+
+def test_index_survives_reopening(tmp_path):
+    path = str(tmp_path / "seen.sqlite3")
+    SeenArticleIndex(path=path).record("hourly-ai", time.time(), [FIRST])
+    assert SeenArticleIndex(path=path).unseen("hourly-ai", [FIRST, SECOND]) == [SECOND]
+
+
+def test_entries_are_evicted_by_age_and_count(tmp_path, monkeypatch):
+    import tools.seen_index
+
+    now = [time.time()]
+    monkeypatch.setattr(tools.seen_index.time, "time", lambda: now[0])
+    index = SeenArticleIndex(path=str(tmp_path / "seen.sqlite3"), max_age_seconds=3600, max_entries=3)
+
+    index.record("e", now[0], [FIRST])
+    now[0] += 10
+    index.record("e", now[0], [SECOND])
+    # Two keys per article: the oldest beyond max_entries goes first, and
+    # FIRST is still recognized by its other key
+    assert index.stats()["entries"] == 3
+    assert index.stats()["evictions"] == 1
+    assert index.unseen("e", [FIRST, SECOND]) == []
+
+    now[0] += 7200
+    index.record("other", now[0], [])
+    assert index.stats()["entries"] == 0
+    assert index.last_run("e") is None
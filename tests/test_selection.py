@@ -0,0 +1,87 @@
+"""
+Tests for parsing the agent's select_articles call and linking it to fetched articles
+"""
+import json
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from agents.news_gatherer import NewsGathererAgent
+from agents.selection import SELECT_TOOL, SelectionStream, link_selection
+
+FETCHED = {f"id{i}": {"id": f"id{i}", "title": f"Story {i}", "link": f"https://x.com/{i}"} for i in range(4)}
+
+
+def _pick(article_id, reason="Relevant"):
+    return {"id": article_id, "reason": reason}
+
+
+def test_unknown_and_repeated_ids_are_dropped():
+    args = {"articles": [_pick("id2"), _pick("made-up"), _pick("id0"), _pick("id2"), _pick("id1")]}
+    linked = link_selection(args, FETCHED)
+    assert [a["id"] for a in linked] == ["id2", "id0", "id1"]
+    assert [a["rank"] for a in linked] == [1, 2, 3]
+    assert linked[0]["title"] == "Story 2" and linked[0]["reason"] == "Relevant"
+
+    # The limit counts linked articles, not unknown ids
+    assert [a["id"] for a in link_selection(args, FETCHED, limit=2)] == ["id2", "id0"]
+
+
+@pytest.mark.parametrize("args, expected", [
+    # Items that fail the schema on their own are skipped, the rest are kept
+    ({"articles": [{"id": "id1"}, _pick("id3"), {"reason": "No id"}, "id0"]}, ["id3"]),
+    # A call that fails the schema as a whole still links its valid items
+    ({"articles": [_pick("id1")], "notes": {"not": "a string"}}, ["id1"]),
+    ({"articles": "id1, id2"}, []),
+    ({}, []),
+])
+def test_malformed_selection_links_valid_items(args, expected):
+    assert [a["id"] for a in link_selection(args, FETCHED)] == expected
+
+
+def test_stream_links_items_as_they_complete():
+    stream = SelectionStream(FETCHED, limit=2)
+    text = json.dumps({"articles": [_pick("id3"), _pick("nope"), _pick("id1"), _pick("id0")]})
+
+    linked = stream.feed([{"name": SELECT_TOOL, "index": 0, "args": ""}])
+    for i in range(0, len(text), 7):
+        linked += stream.feed([{"index": 0, "args": text[i:i + 7]}])
+    linked += stream.finish(json.loads(text))
+    assert [a["id"] for a in linked] == ["id3", "id1"]
+
+
+def test_stream_ignores_invalid_json_and_other_calls():
+    stream = SelectionStream(FETCHED)
+    assert stream.feed([{"name": "fetch_news", "index": 0, "args": '{"query": "ai"}'}]) == []
+    assert stream.feed([{"name": SELECT_TOOL, "index": 1, "args": '{"articles": [}}'}]) == []
+    assert stream.feed([{"index": 1, "args": "]"}]) == []
+    # The finished call is linked from its parsed arguments
+    assert [a["id"] for a in stream.finish({"articles": [_pick("id0")]})] == ["id0"]
+    assert stream.finish({"articles": "garbage"}) == []
+
+
+def _call(name, args, call_id):
+    return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": call_id}])
+
+
+def test_selection_call_is_not_a_tool_step():
+    agent = NewsGathererAgent(checkpointer=None)
+    state = {"messages": [HumanMessage(content="Latest AI news")], "tool_calls_count": 0,
+             "fetched_articles": FETCHED, "top_articles_count": 3, "status": "running", "edition": None}
+
+    agent._record_response(state, _call("fetch_news", {"query": "ai"}, "call-1"))
+    assert agent._should_continue(state) == "tools"
+    state["messages"].append(ToolMessage(content="{}", tool_call_id="call-1", name="fetch_news"))
+    agent._record_response(state, _call("fetch_news", {"query": "ai chips"}, "call-2"))
+    assert agent._should_continue(state) == "tools"
+    state["messages"].append(ToolMessage(content="{}", tool_call_id="call-2", name="fetch_news"))
+
+    # A malformed selection after both lookups ends the run without counting as a third step
+    rejected = {"articles": [_pick("id1"), _pick("unknown"), {"id": "id2"}], "notes": 42}
+    agent._record_response(state, _call(SELECT_TOOL, rejected, "call-3"))
+    assert state["tool_calls_count"] == 2
+    assert agent._should_continue(state) == "end"
+
+    agent._extract_results(state)
+    assert state["status"] == "completed"
+    assert [a["id"] for a in state["final_articles"]] == ["id1"]
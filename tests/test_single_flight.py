@@ -0,0 +1,52 @@
+"""
+Tests for coalescing of concurrent identical upstream requests
+"""
+import asyncio
+
+import pytest
+
+from tools.single_flight import SingleFlight
+
+
+def test_followers_share_leader_result():
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "articles"
+
+    async def main():
+        return await asyncio.gather(*(flight.ado("key", fetch) for _ in range(3)))
+
+    assert asyncio.run(main()) == ["articles"] * 3
+    assert calls == 1
+
+
+def test_cancelled_leader_does_not_cancel_follower():
+    flight = SingleFlight("test")
+
+    async def slow():
+        await asyncio.sleep(10)
+
+    async def main():
+        leader = asyncio.create_task(asyncio.wait_for(flight.ado("key", slow), timeout=0.05))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.ado("key", slow))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await leader
+        # The follower sees an ordinary error for its call, not a cancellation
+        with pytest.raises(RuntimeError, match="cancelled"):
+            await follower
+        assert not follower.cancelled()
+
+        # The key is free again for the next caller
+        async def quick():
+            return "fresh"
+
+        assert await flight.ado("key", quick) == "fresh"
+
+    asyncio.run(main())
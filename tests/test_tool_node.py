@@ -0,0 +1,49 @@
+"""
+Tests for concurrent execution of an agent message's tool calls
+"""
+from concurrent.futures import ThreadPoolExecutor
+import json
+import time
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+
+from agents.tool_node import ParallelToolNode
+
+
+@tool
+def sleepy(seconds: float) -> str:
+    """Sleep, then report how long"""
+    time.sleep(seconds)
+    return json.dumps({"status": "success", "slept": seconds})
+
+
+def _state(*durations):
+    calls = [{"name": "sleepy", "args": {"seconds": d}, "id": f"call-{i}"} for i, d in enumerate(durations)]
+    return {"messages": [AIMessage(content="", tool_calls=calls)]}
+
+
+def test_results_keep_call_order_and_timeouts_are_per_call():
+    node = ParallelToolNode([sleepy], max_workers=4, timeout=0.2)
+    state = node.invoke(_state(0.05, 0.5, 0.0))
+
+    statuses = [t["status"] for t in state["tool_timings"]]
+    assert statuses == ["success", "timeout", "success"]
+    assert [m.tool_call_id for m in state["messages"][1:]] == ["call-0", "call-1", "call-2"]
+    assert json.loads(state["messages"][2].content)["error_type"] == "TimeoutError"
+
+
+def test_queued_calls_do_not_spend_their_timeout_waiting():
+    # One worker, three calls of 0.1s: each fits its own 0.15s timeout
+    node = ParallelToolNode([sleepy], max_workers=1, timeout=0.15)
+    state = node.invoke(_state(0.1, 0.1, 0.1))
+    assert [t["status"] for t in state["tool_timings"]] == ["success"] * 3
+
+
+def test_concurrent_runs_do_not_share_workers():
+    node = ParallelToolNode([sleepy], max_workers=1, timeout=1.0)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        states = list(pool.map(lambda _: node.invoke(_state(0.2)), range(4)))
+    assert time.perf_counter() - started < 0.6
+    assert all(s["tool_timings"][0]["status"] == "success" for s in states)
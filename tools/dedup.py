@@ -0,0 +1,214 @@
+"""
+Collapsing of syndicated and near-duplicate articles
+"""
+from array import array
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+import hashlib
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+MINHASH_PERMUTATIONS = 64
+LSH_ROWS_PER_BAND = 3
+
+_MAX_HASH = (1 << 32) - 1
+_DIGEST_BYTES = MINHASH_PERMUTATIONS * 4
+
+
+def normalize_link(link: str) -> str:
+    """Link without scheme, query string, fragment, "www." or trailing slash"""
+    parts = urlsplit((link or "").strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parts.path.rstrip('/')}"
+
+
+def article_id(article: Dict[str, Any]) -> str:
+    """Stable short identifier of an article derived from its link (or title without a link)"""
+    basis = normalize_link(article.get("link", "")) or (article.get("title") or "").strip().lower()
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()[:12]
+
+
+def shingles(text: str) -> Set[str]:
+    """Word unigrams and bigrams of a text"""
+    words = _WORD.findall((text or "").lower())
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(features: Set[str]) -> List[int]:
+    """
+    MinHash signature of a shingle set
+
+    Each shingle is expanded by SHAKE-128 into MINHASH_PERMUTATIONS independent
+    32-bit hashes, and the signature keeps the minimum of every position.
+    """
+    if not features:
+        return [_MAX_HASH] * MINHASH_PERMUTATIONS
+    hashes = array("I", b"".join(
+        hashlib.shake_128(feature.encode("utf-8")).digest(_DIGEST_BYTES) for feature in features
+    ))
+    return [min(hashes[i::MINHASH_PERMUTATIONS]) for i in range(MINHASH_PERMUTATIONS)]
+
+
+class ArticleDeduplicator:
+    """
+    Groups duplicate articles and keeps one representative per group
+
+    Exact duplicates share a normalized link or title. Near duplicates have a
+    Jaccard similarity of title + description shingles of at least
+    min_similarity. Candidate pairs come from MinHash-LSH (21 bands of 3
+    rows, which finds pairs at similarity 0.5 about 94% of the time), so only
+    articles colliding in a band are compared and the work stays close to
+    linear in the number of articles.
+    """
+
+    def __init__(self, min_similarity: float = 0.5):
+        """
+        Args:
+            min_similarity: Jaccard similarity at which two articles count as the same story
+        """
+        self.min_similarity = min_similarity
+        self.bands = MINHASH_PERMUTATIONS // LSH_ROWS_PER_BAND
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every article seen so far"""
+        self._articles: List[Dict[str, Any]] = []
+        self._parent: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._buckets: Dict[tuple, List[int]] = defaultdict(list)
+        self._features: List[Set[str]] = []
+        self.unique_count = 0
+
+    def _band_keys(self, signature: List[int]) -> List[tuple]:
+        rows = LSH_ROWS_PER_BAND
+        return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, i: int, j: int) -> None:
+        ri, rj = self._find(i), self._find(j)
+        if ri != rj:
+            self._parent[max(ri, rj)] = min(ri, rj)
+            self.unique_count -= 1
+
+    def add(self, articles: List[Dict[str, Any]]) -> None:
+        """
+        Cluster more articles against everything added so far
+
+        Articles can arrive in batches (e.g. one per result page); the
+        clustering is the same as adding them all at once.
+
+        Args:
+            articles: Structured articles
+        """
+        for article in articles:
+            i = len(self._articles)
+            self._articles.append(article)
+            self._parent.append(i)
+            self.unique_count += 1
+
+            for key in (normalize_link(article.get("link", "")),
+                        " ".join(_WORD.findall((article.get("title") or "").lower()))):
+                if not key:
+                    continue
+                if key in self._exact:
+                    self._union(i, self._exact[key])
+                else:
+                    self._exact[key] = i
+
+            features = shingles(f"{article.get('title') or ''} {article.get('description') or ''}")
+            self._features.append(features)
+            if not features:
+                continue
+
+            compared = set()
+            for band_key in self._band_keys(minhash(features)):
+                for j in self._buckets[band_key]:
+                    if j in compared:
+                        continue
+                    compared.add(j)
+                    if jaccard(features, self._features[j]) >= self.min_similarity:
+                        self._union(i, j)
+                self._buckets[band_key].append(i)
+
+    def clusters(self) -> List[List[int]]:
+        """Indices of the added articles grouped into duplicate clusters, in first-seen order"""
+        clusters: Dict[int, List[int]] = {}
+        for i in range(len(self._articles)):
+            clusters.setdefault(self._find(i), []).append(i)
+        return list(clusters.values())
+
+    def representatives(self) -> List[Dict[str, Any]]:
+        """
+        One article per cluster: the richest member
+
+        The representative keeps its cluster's position of first appearance
+        and lists the other outlets that carried the story under
+        duplicate_sources.
+        """
+        articles = self._articles
+        representatives = []
+        for members in self.clusters():
+            best = max(members, key=lambda i: (len(articles[i].get("content") or ""), -i))
+            representative = dict(articles[best])
+            others = {
+                articles[i].get("source_name") or articles[i].get("source_id") or ""
+                for i in members if i != best
+            }
+            # Articles that are themselves representatives bring their clusters along
+            for i in members:
+                others.update(articles[i].get("duplicate_sources") or [])
+            others = sorted(others - {"", representative.get("source_name")})
+            if len(members) > 1:
+                representative["duplicate_sources"] = others
+            representatives.append(representative)
+
+        if len(representatives) < len(articles):
+            logger.info(f"Collapsed {len(articles)} articles into {len(representatives)} unique stories")
+        return representatives
+
+    def cluster(self, articles: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Indices of articles grouped into duplicate clusters, in first-seen order
+
+        Args:
+            articles: Structured articles
+
+        Returns:
+            One list of article indices per cluster
+        """
+        self.reset()
+        self.add(articles)
+        return self.clusters()
+
+    def deduplicate(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse each cluster of articles into its richest member
+
+        Args:
+            articles: Structured articles
+
+        Returns:
+            One article per cluster
+        """
+        self.reset()
+        self.add(articles)
+        return self.representatives()
@@ -0,0 +1,281 @@
+"""
+Two-tier response cache for NewsData requests
+"""
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+# NewsData query operators keep their case, everything else is compared case-insensitively
+QUERY_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize NewsData request parameters so equivalent requests share a key
+
+    Args:
+        params: Raw request parameters (q, country, category, language)
+
+    Returns:
+        New dict without empty values, with collapsed whitespace and lower-cased codes
+    """
+    normalized = {}
+    for name, value in params.items():
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = " ".join(value.split())
+            if name != "q":
+                value = value.lower()
+        normalized[name] = value
+    return normalized
+
+
+def request_key(params: Dict[str, Any]) -> str:
+    """
+    Content-addressed identity of a NewsData request
+
+    Queries that differ only in case or whitespace map to the same key.
+
+    Args:
+        params: Request parameters (raw or normalized)
+
+    Returns:
+        SHA-256 hex digest of the canonical parameters
+    """
+    canonical = normalize_params(params)
+    if "q" in canonical:
+        canonical["q"] = " ".join(
+            term if term in QUERY_OPERATORS else term.casefold()
+            for term in canonical["q"].split(" ")
+        )
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class NewsCache:
+    """In-memory LRU tier in front of a SQLite tier, both with per-entry TTL"""
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            ttl_seconds: int = 900,
+            max_memory_entries: int = 256,
+            max_disk_bytes: int = 64 * 1024 * 1024,
+            mmap_bytes: int = 0
+    ):
+        """
+        Initialize the cache
+
+        The disk tier is safe to share between processes: every process that
+        opens the same file sees the others' entries, and with mmap_bytes set
+        reads are served from the OS page cache all of them map, instead of
+        being copied into each process.
+
+        Args:
+            path: SQLite file for the disk tier (None keeps the cache in memory only)
+            ttl_seconds: Default freshness window for new entries
+            max_memory_entries: Number of entries kept in the LRU tier
+            max_disk_bytes: Total payload size kept in the disk tier before eviction
+            mmap_bytes: Size of the file mapped into memory for reads (0 uses plain reads)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "evictions": 0,
+            "expired": 0,
+        }
+
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            self.path = Path(path)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(f"PRAGMA mmap_size={int(mmap_bytes)}")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+            self._purge_expired()
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """Content-addressed key for a set of request parameters"""
+        return request_key(params)
+
+    def get(self, params: Dict[str, Any]) -> Optional[Any]:
+        """
+        Look up a cached response
+
+        Args:
+            params: Request parameters the response was stored under
+
+        Returns:
+            The cached response, or None on a miss or an expired entry
+        """
+        key = self.make_key(params)
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expired"] += 1
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    raw, expires_at = row
+                    if expires_at > now:
+                        self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                        value = json.loads(raw)
+                        self._remember(key, value, expires_at)
+                        self._stats["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._stats["expired"] += 1
+
+            self._stats["misses"] += 1
+            return None
+
+    def set(self, params: Dict[str, Any], value: Any, ttl_seconds: Optional[int] = None) -> None:
+        """
+        Store a response in both tiers
+
+        Args:
+            params: Request parameters the response belongs to
+            value: JSON-serializable response
+            ttl_seconds: Override for the default freshness window
+        """
+        key = self.make_key(params)
+        now = time.time()
+        expires_at = now + (self.ttl_seconds if ttl_seconds is None else ttl_seconds)
+
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self._stats["writes"] += 1
+
+            if self._db is not None:
+                raw = json.dumps(value, separators=(",", ":"))
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, raw, len(raw), expires_at, now)
+                )
+                self._evict_disk()
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current tier sizes"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["hits"] = stats["memory_hits"] + stats["disk_hits"]
+            stats["memory_entries"] = len(self._memory)
+            if self._db is not None:
+                count, size = self._db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+                stats["disk_entries"] = count
+                stats["disk_bytes"] = size
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert into the LRU tier (caller holds the lock)"""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _evict_disk(self) -> None:
+        """Drop least recently used rows until the disk tier fits its budget (caller holds the lock)"""
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_disk_bytes:
+            return
+
+        self._purge_expired()
+        rows = self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        for key, size in rows:
+            if total <= self.max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def _purge_expired(self) -> None:
+        """Delete expired rows from the disk tier"""
+        cursor = self._db.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        if cursor.rowcount:
+            self._stats["expired"] += cursor.rowcount
+
+
+_news_cache: Optional[NewsCache] = None
+_news_cache_lock = threading.Lock()
+
+
+def get_news_cache() -> NewsCache:
+    """Process-wide cache built from settings on first use"""
+    global _news_cache
+
+    if _news_cache is None:
+        with _news_cache_lock:
+            if _news_cache is None:
+                from config.settings import settings
+
+                path = None
+                if settings.NEWS_CACHE_PATH:
+                    path = Path(settings.NEWS_CACHE_PATH)
+                    if not path.is_absolute():
+                        path = PROJECT_ROOT / path
+
+                _news_cache = NewsCache(
+                    path=str(path) if path else None,
+                    ttl_seconds=settings.NEWS_CACHE_TTL_SECONDS,
+                    max_memory_entries=settings.NEWS_CACHE_MEMORY_ENTRIES,
+                    max_disk_bytes=settings.NEWS_CACHE_DISK_MAX_MB * 1024 * 1024,
+                    mmap_bytes=settings.CACHE_MMAP_MB * 1024 * 1024
+                )
+                logger.info(f"News cache ready (path={path}, ttl={settings.NEWS_CACHE_TTL_SECONDS}s)")
+    return _news_cache
@@ -1,90 +1,478 @@
-from langchain_core.tools import tool
-from newsdataapi import NewsDataApiClient
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, closing, contextmanager
+from contextvars import ContextVar
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel, Field
+from typing import Any, Dict, Iterator, List, Optional
+import asyncio
+import contextvars
 import json
 import logging
+import math
+import time
+
+from clients import tracing
+from clients.newsdata import AsyncNewsDataClient, NewsPager, get_newsdata_client
+from schemas.output_schemas import ArticleSelection
+from tools.dedup import ArticleDeduplicator, article_id
+from tools.news_cache import get_news_cache, normalize_params, request_key
+from tools.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Concurrent fetches with the same normalized parameters share one NewsData call
+news_requests = SingleFlight("NewsData")
 
-class NewsTools:
-    """Collection of news-related tools"""
+# Longest window NewsData's timeframe parameter accepts (48 hours)
+MAX_TIMEFRAME_MINUTES = 48 * 60
 
-    @staticmethod
-    @tool
-    def fetch_news(
-            query: str,
-            country: Optional[str] = None,
-            category: Optional[str] = None,
-            language: str = "en"
-    ) -> str:
-        """
-        Fetch news articles from NewsDataAPI based on search criteria.
+# Earliest publication time fetches should return, set while an incremental edition runs its tools
+_published_since: ContextVar[Optional[float]] = ContextVar("news_published_since", default=None)
+
+
+@contextmanager
+def published_since(timestamp: Optional[float]) -> Iterator[None]:
+    """
+    Limit fetches made inside the block to articles published after timestamp
+
+    Args:
+        timestamp: Unix timestamp (None leaves fetches unrestricted)
+    """
+    token = _published_since.set(timestamp)
+    try:
+        yield
+    finally:
+        _published_since.reset(token)
+
+
+def _timeframe() -> Optional[str]:
+    """NewsData timeframe covering the current time window, in minutes"""
+    since = _published_since.get()
+    if since is None:
+        return None
+    minutes = max(1, math.ceil((time.time() - since) / 60))
+    # Older windows cannot be expressed; the seen-article index filters those results instead
+    return f"{minutes}m" if minutes <= MAX_TIMEFRAME_MINUTES else None
+
+
+def _build_params(query: str, country: Optional[str], category: Optional[str], language: str) -> Dict[str, Any]:
+    """Build normalized NewsData request parameters"""
+    return normalize_params({
+        "q": query,
+        "language": language,
+        "country": country,
+        "category": category,
+        "timeframe": _timeframe()
+    })
+
+
+def _structure_articles(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract and structure articles from a NewsData response"""
+    articles = []
+    for article in response.get("results", []):
+        structured_article = {
+            "title": article.get("title", ""),
+            "description": article.get("description", ""),
+            "content": article.get("content", ""),
+            "link": article.get("link", ""),
+            "source_id": article.get("source_id", ""),
+            "source_name": article.get("source_name", ""),
+            "pub_date": article.get("pubDate", ""),
+            "image_url": article.get("image_url", ""),
+            "keywords": article.get("keywords", []),
+            "category": article.get("category", []),
+        }
+        structured_article["id"] = article_id(structured_article)
+        articles.append(structured_article)
+    return articles
 
+
+class _ArticleCollector:
+    """Structures and deduplicates result pages as they arrive"""
+
+    def __init__(self, limit: int, deduplicator: Optional[ArticleDeduplicator] = None):
+        """
         Args:
-            query: Search query for news (e.g., "artificial intelligence", "climate change")
-            country: ISO country code (e.g., "us", "gb", "in"). Optional.
-            category: News category (e.g., "business", "technology", "science", "sports"). Optional.
-            language: Language code (default: "en")
+            limit: Unique articles wanted
+            deduplicator: Clusters duplicates across pages (None keeps every article)
+        """
+        self.limit = limit
+        self.deduplicator = deduplicator
+        self.articles: List[Dict[str, Any]] = []
+        self.fetched = 0
+
+    @classmethod
+    def from_settings(cls) -> "_ArticleCollector":
+        from config.settings import settings
+
+        deduplicator = None
+        if settings.DEDUP_ENABLED:
+            deduplicator = ArticleDeduplicator(min_similarity=settings.DEDUP_MIN_SIMILARITY)
+        return cls(settings.MAX_ARTICLES_PER_FETCH, deduplicator)
+
+    def add_page(self, page: Dict[str, Any]) -> bool:
+        """
+        Take in one NewsData response page
 
         Returns:
-            JSON string containing news articles with title, description, content, link, source, etc.
+            True once enough unique articles have been collected
         """
-        from config.settings import settings
+        articles = _structure_articles(page)
+        self.fetched += len(articles)
+        if self.deduplicator is not None:
+            self.deduplicator.add(articles)
+            return self.deduplicator.unique_count >= self.limit
+
+        self.articles.extend(articles)
+        return len(self.articles) >= self.limit
+
+    def result(self) -> Dict[str, Any]:
+        """Collected articles (cut to the limit) and how many duplicates were dropped"""
+        articles = self.articles
+        if self.deduplicator is not None:
+            articles = self.deduplicator.representatives()
+        return {
+            "articles": articles[:self.limit],
+            "fetched": self.fetched,
+            "duplicates_removed": self.fetched - len(articles)
+        }
+
+
+def _pager() -> NewsPager:
+    from config.settings import settings
+
+    return NewsPager(
+        max_pages=settings.NEWS_MAX_PAGES,
+        time_budget=settings.NEWS_FETCH_TIME_BUDGET_SECONDS,
+        article_budget=settings.MAX_ARTICLES_PER_FETCH
+    )
+
+
+def _success_payload(collected: Dict[str, Any], params: Dict[str, Any]) -> str:
+    """
+    Serialize collected articles into the tool result
+
+    The payload carries every candidate in full; the graph's rank node
+    shortlists and projects it before the agent reads it.
+    """
+    articles = collected["articles"]
+    logger.info(f"Successfully fetched {len(articles)} articles")
+
+    payload = {
+        "status": "success",
+        "count": len(articles),
+        "articles": articles,
+        "query_params": params
+    }
+    if collected.get("duplicates_removed"):
+        payload["duplicates_removed"] = collected["duplicates_removed"]
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _error_payload(e: Exception) -> str:
+    """Serialize a fetch failure into the tool result returned to the agent"""
+    logger.error(f"Error fetching news: {str(e)}")
+    return json.dumps({
+        "status": "error",
+        "error": str(e),
+        "error_type": type(e).__name__
+    })
+
+
+def _collect(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Collected articles for one request, from cache or NewsData"""
+    from config.settings import settings
+
+    with tracing.span("news.collect", q=params.get("q")) as attrs:
+        # Serve from cache when the same request is still fresh
+        cache = get_news_cache() if settings.NEWS_CACHE_ENABLED else None
+        collected = cache.get(params) if cache else None
+        attrs["cache_hit"] = collected is not None
+        if collected is not None:
+            logger.info("Serving news from cache")
+            return collected
+
+        def load() -> Dict[str, Any]:
+            # Shared API client
+            api = get_newsdata_client()
+
+            def fetch_page(cursor: Optional[str]) -> Dict[str, Any]:
+                # The shared pool waits for the NewsData quota and retries transient failures
+                with tracing.span("newsdata.page", kind="http", page=cursor):
+                    return api.news_api(**params, page=cursor)
+
+            # Process each page while the next one is being fetched
+            collector = _ArticleCollector.from_settings()
+            with closing(_pager().pages(fetch_page)) as pages:
+                for page in pages:
+                    if collector.add_page(page):
+                        break
+
+            result = collector.result()
+            if cache:
+                cache.set(params, result)
+            return result
+
+        # Identical requests already in flight share one upstream call
+        return news_requests.do(request_key(params), load)
+
+
+async def _acollect(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Async variant of _collect using the event loop's HTTP pool"""
+    from config.settings import settings
+
+    with tracing.span("news.collect", q=params.get("q")) as attrs:
+        cache = get_news_cache() if settings.NEWS_CACHE_ENABLED else None
+        collected = cache.get(params) if cache else None
+        attrs["cache_hit"] = collected is not None
+        if collected is not None:
+            logger.info("Serving news from cache")
+            return collected
+
+        async def load() -> Dict[str, Any]:
+            api = AsyncNewsDataClient(apikey=settings.NEWSDATA_API_KEY, base_url=settings.NEWSDATA_API_BASE)
+
+            async def fetch_page(cursor: Optional[str]) -> Dict[str, Any]:
+                with tracing.span("newsdata.page", kind="http", page=cursor):
+                    return await api.news_api(**params, page=cursor)
+
+            collector = _ArticleCollector.from_settings()
+            async with aclosing(_pager().apages(fetch_page)) as pages:
+                async for page in pages:
+                    if collector.add_page(page):
+                        break
+
+            result = collector.result()
+            if cache:
+                cache.set(params, result)
+            return result
+
+        return await news_requests.ado(request_key(params), load)
+
+
+def _fetch_news(
+        query: str,
+        country: Optional[str] = None,
+        category: Optional[str] = None,
+        language: str = "en"
+) -> str:
+    """
+    Fetch news articles from NewsDataAPI based on search criteria.
+
+    Args:
+        query: Search query for news (e.g., "artificial intelligence", "climate change")
+        country: ISO country code (e.g., "us", "gb", "in"). Optional.
+        category: News category (e.g., "business", "technology", "science", "sports"). Optional.
+        language: Language code (default: "en")
+
+    Returns:
+        JSON string containing news articles with title, description, content, link, source, etc.
+    """
+    try:
+        logger.info(f"Fetching news: query='{query}', country={country}, category={category}")
+
+        # Build request parameters
+        params = _build_params(query, country, category, language)
+        return _success_payload(_collect(params), params)
+
+    except Exception as e:
+        return _error_payload(e)
+
+
+async def _afetch_news(
+        query: str,
+        country: Optional[str] = None,
+        category: Optional[str] = None,
+        language: str = "en"
+) -> str:
+    """Non-blocking fetch_news for the async workflow, using the event loop's HTTP pool"""
+    try:
+        logger.info(f"Fetching news (async): query='{query}', country={country}, category={category}")
+
+        params = _build_params(query, country, category, language)
+        return _success_payload(await _acollect(params), params)
+
+    except Exception as e:
+        return _error_payload(e)
+
+
+class NewsQuery(BaseModel):
+    """One query variant of a fetch_news_multi call"""
+
+    query: str = Field(description="Search query for news (e.g., \"artificial intelligence\")")
+    country: Optional[str] = Field(default=None, description="ISO country code (e.g., \"us\", \"gb\", \"in\")")
+    category: Optional[str] = Field(default=None, description="News category (e.g., \"business\", \"technology\")")
+    language: str = Field(default="en", description="Language code")
+
+
+def _variant_params(queries: List[Any]) -> List[Dict[str, Any]]:
+    """Normalized request parameters of each distinct variant, in order"""
+    from config.settings import settings
+
+    variants, seen = [], set()
+    for variant in queries:
+        if isinstance(variant, dict):
+            variant = NewsQuery(**variant)
+        params = _build_params(variant.query, variant.country, variant.category, variant.language)
+        key = request_key(params)
+        if key not in seen:
+            seen.add(key)
+            variants.append(params)
+
+    if len(variants) > settings.NEWS_MULTI_MAX_QUERIES:
+        logger.warning(f"Keeping the first {settings.NEWS_MULTI_MAX_QUERIES} of {len(variants)} query variants")
+    return variants[:settings.NEWS_MULTI_MAX_QUERIES]
+
+
+def _merge_collected(variants: List[Dict[str, Any]], outcomes: List[Any]) -> str:
+    """
+    Combine per-variant results into one fetch_news_multi payload
+
+    Articles are interleaved round-robin across variants so every variant is
+    represented near the top, then collapsed by link (and by content when
+    deduplication is enabled).
+    """
+    from config.settings import settings
+
+    results, errors = [], []
+    for params, outcome in zip(variants, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(f"Query variant {params.get('q')!r} failed: {str(outcome)}")
+            errors.append({"query_params": params, "error": str(outcome)})
+        else:
+            results.append(outcome)
+
+    if not results:
+        return _error_payload(Exception("; ".join(e["error"] for e in errors)))
+
+    interleaved = [
+        collected["articles"][i]
+        for i in range(max(len(collected["articles"]) for collected in results))
+        for collected in results if i < len(collected["articles"])
+    ]
+
+    seen, articles = set(), []
+    for article in interleaved:
+        if article["id"] not in seen:
+            seen.add(article["id"])
+            articles.append(article)
+
+    if settings.DEDUP_ENABLED:
+        articles = ArticleDeduplicator(min_similarity=settings.DEDUP_MIN_SIMILARITY).deduplicate(articles)
+
+    duplicates = sum(collected.get("duplicates_removed", 0) for collected in results)
+    duplicates += len(interleaved) - len(articles)
+    logger.info(f"Merged {len(interleaved)} articles from {len(results)} query variants into {len(articles)}")
+
+    payload = {
+        "status": "success",
+        "count": len(articles),
+        "articles": articles,
+        "query_params": variants
+    }
+    if duplicates:
+        payload["duplicates_removed"] = duplicates
+    if errors:
+        payload["errors"] = errors
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+
+def _fetch_news_multi(queries: List[NewsQuery]) -> str:
+    """
+    Fetch several query variants at once and merge them into one deduplicated result.
+
+    Use this instead of separate fetch_news calls to broaden recall in a single step,
+    e.g. synonyms of the topic or the same topic across several countries or categories.
+
+    Args:
+        queries: Query variants, each with query and optional country, category and language
+
+    Returns:
+        JSON string containing the merged articles of every variant
+    """
+    from config.settings import settings
+
+    try:
+        variants = _variant_params(queries)
+        logger.info(f"Fetching news for {len(variants)} query variants: {[v.get('q') for v in variants]}")
+
+        def collect(params: Dict[str, Any]) -> Any:
+            try:
+                return _collect(params)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(len(variants), settings.NEWS_MULTI_MAX_CONCURRENCY))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news-multi") as executor:
+            # Each variant runs in a copy of the caller's context, keeping its span and time window
+            futures = [executor.submit(contextvars.copy_context().run, collect, params) for params in variants]
+            outcomes = [future.result() for future in futures]
+
+        return _merge_collected(variants, outcomes)
+
+    except Exception as e:
+        return _error_payload(e)
+
+
+async def _afetch_news_multi(queries: List[NewsQuery]) -> str:
+    """Non-blocking fetch_news_multi for the async workflow"""
+    from config.settings import settings
+
+    try:
+        variants = _variant_params(queries)
+        logger.info(f"Fetching news (async) for {len(variants)} query variants: {[v.get('q') for v in variants]}")
+
+        semaphore = asyncio.Semaphore(max(1, settings.NEWS_MULTI_MAX_CONCURRENCY))
+
+        async def collect(params: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await _acollect(params)
+
+        outcomes = await asyncio.gather(*(collect(params) for params in variants), return_exceptions=True)
+        return _merge_collected(variants, outcomes)
+
+    except Exception as e:
+        return _error_payload(e)
+
+
+def _select_articles(articles: List[Any], notes: Optional[str] = None) -> str:
+    """
+    Submit the final curated selection, best article first. Call this once as your final
+    step instead of writing the selection out: refer to each article by its id from the
+    fetch results and give a short reason. Titles, links, sources and dates are attached
+    from the fetched articles automatically.
+
+    Args:
+        articles: Selected articles, each with id and reason
+        notes: Optional remarks for the newsletter editor
+
+    Returns:
+        JSON string confirming how many articles were selected
+    """
+    # The workflow ends on this call and reads the selection from its arguments
+    return json.dumps({"status": "success", "selected": len(articles)})
+
+
+class NewsTools:
+    """Collection of news-related tools"""
 
-        try:
-            logger.info(f"Fetching news: query='{query}', country={country}, category={category}")
-            
-            # import pdb;pdb.set_trace()
-            # Initialize API client
-            api = NewsDataApiClient(apikey=settings.NEWSDATA_API_KEY)
-
-            # Build request parameters
-            params = {
-                "q": query,
-                "language": language
-            }
-
-            if country:
-                params["country"] = country
-            if category:
-                params["category"] = category
-
-            # Fetch news
-            response = api.news_api(**params)
-
-            # Extract and structure articles
-            articles = []
-            for article in response.get("results", [])[:settings.MAX_ARTICLES_PER_FETCH]:
-                structured_article = {
-                    "title": article.get("title", ""),
-                    "description": article.get("description", ""),
-                    "content": article.get("content", ""),
-                    "link": article.get("link", ""),
-                    "source_id": article.get("source_id", ""),
-                    "source_name": article.get("source_name", ""),
-                    "pub_date": article.get("pubDate", ""),
-                    "image_url": article.get("image_url", ""),
-                    "keywords": article.get("keywords", []),
-                    "category": article.get("category", []),
-                }
-                articles.append(structured_article)
-
-            logger.info(f"Successfully fetched {len(articles)} articles")
-
-            return json.dumps({
-                "status": "success",
-                "count": len(articles),
-                "articles": articles,
-                "query_params": params
-            }, indent=2)
-
-        except Exception as e:
-            logger.error(f"Error fetching news: {str(e)}")
-            return json.dumps({
-                "status": "error",
-                "error": str(e),
-                "error_type": type(e).__name__
-            })
+    # Sync graph runs call _fetch_news, async runs (ainvoke/astream) call _afetch_news
+    fetch_news = StructuredTool.from_function(
+        func=_fetch_news,
+        coroutine=_afetch_news,
+        name="fetch_news"
+    )
 
+    # Parallel fan-out over several query variants, merged into one result
+    fetch_news_multi = StructuredTool.from_function(
+        func=_fetch_news_multi,
+        coroutine=_afetch_news_multi,
+        name="fetch_news_multi"
+    )
 
+    # Final answer of the agent: the selection as ids into the fetched articles
+    select_articles = StructuredTool.from_function(
+        func=_select_articles,
+        name="select_articles",
+        args_schema=ArticleSelection
+    )
@@ -0,0 +1,160 @@
+"""
+Projection of fetched articles into the compact payload sent back to the LLM
+"""
+from typing import Any, Dict, List, Optional, Sequence, Union
+import json
+import math
+import re
+
+FORMATS = ("json", "compact", "tsv")
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count for Llama-family tokenizers (about four characters per token)"""
+    return math.ceil(len(text) / 4)
+
+
+class PayloadProjector:
+    """Whitelists, truncates and encodes articles to keep prompt tokens down"""
+
+    def __init__(
+            self,
+            fields: Optional[Sequence[str]] = None,
+            content_max_chars: int = 0,
+            content_max_sentences: int = 0,
+            fmt: str = "json",
+            token_budget: int = 0
+    ):
+        """
+        Args:
+            fields: Article fields to keep, in output order (None keeps all)
+            content_max_chars: Truncate content to this many characters (0 = no limit)
+            content_max_sentences: Truncate content to this many sentences (0 = no limit)
+            fmt: "json" (indented), "compact" (minified JSON) or "tsv" (one row per article)
+            token_budget: Pack only as many articles as fit in this many tokens (0 = no limit)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown payload format: {fmt} (expected one of {FORMATS})")
+
+        self.fields = list(fields) if fields else None
+        self.content_max_chars = content_max_chars
+        self.content_max_sentences = content_max_sentences
+        self.fmt = fmt
+        self.token_budget = token_budget
+
+    @classmethod
+    def from_settings(cls) -> "PayloadProjector":
+        """Projector configured from the PAYLOAD_* settings"""
+        from config.settings import settings
+
+        fields = [f.strip() for f in settings.PAYLOAD_FIELDS.split(",") if f.strip()]
+        if fields and "id" not in fields:
+            # The agent selects articles by id
+            fields.insert(0, "id")
+        return cls(
+            fields=fields or None,
+            content_max_chars=settings.PAYLOAD_CONTENT_MAX_CHARS,
+            content_max_sentences=settings.PAYLOAD_CONTENT_MAX_SENTENCES,
+            fmt=settings.PAYLOAD_FORMAT,
+            token_budget=settings.PAYLOAD_TOKEN_BUDGET
+        )
+
+    def truncate(self, text: str) -> str:
+        """Shorten article content to the configured sentence and character limits"""
+        if not text:
+            return text
+
+        truncated = text
+        if self.content_max_sentences:
+            sentences = _SENTENCE_END.split(truncated)
+            truncated = " ".join(sentences[:self.content_max_sentences])
+        if self.content_max_chars and len(truncated) > self.content_max_chars:
+            cut = truncated[:self.content_max_chars]
+            # Prefer ending on a word boundary
+            if " " in cut:
+                cut = cut.rsplit(" ", 1)[0]
+            truncated = cut
+        return truncated + "…" if len(truncated) < len(text) else truncated
+
+    def project(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep only the whitelisted fields of one article, with content truncated"""
+        fields = self.fields or list(article.keys())
+        projected = {name: article.get(name) for name in fields if name in article}
+        if projected.get("content"):
+            projected["content"] = self.truncate(projected["content"])
+        return projected
+
+    def _encode_row(self, article: Dict[str, Any], columns: List[str]) -> str:
+        """One TSV row; lists are comma-joined and tabs/newlines flattened"""
+        cells = []
+        for column in columns:
+            value = article.get(column)
+            if isinstance(value, list):
+                value = ",".join(str(v) for v in value)
+            cells.append(" ".join(str(value if value is not None else "").split()))
+        return "\t".join(cells)
+
+    def render(
+            self,
+            articles: List[Dict[str, Any]],
+            params: Union[Dict[str, Any], List[Dict[str, Any]]],
+            candidates: Optional[int] = None,
+            previously_seen: int = 0
+    ) -> str:
+        """
+        Serialize the fetch_news success payload
+
+        Args:
+            articles: Structured articles, most important first
+            params: NewsData request parameters (one set per variant for fetch_news_multi)
+            candidates: Number of articles fetched before shortlisting, if any were dropped
+            previously_seen: Fetched articles left out because an earlier edition covered them
+
+        Returns:
+            JSON envelope with status, count and the encoded articles
+        """
+        projected = [self.project(article) for article in articles]
+        columns = self.fields or (list(projected[0].keys()) if projected else [])
+
+        if self.fmt == "tsv":
+            encoded = [self._encode_row(article, columns) for article in projected]
+        elif self.fmt == "compact":
+            encoded = [json.dumps(article, separators=(",", ":"), ensure_ascii=False) for article in projected]
+        else:
+            encoded = projected
+
+        # Pack articles in order until the token budget is spent
+        kept = len(encoded)
+        if self.token_budget:
+            spent = estimate_tokens("\t".join(columns)) + 32
+            for i, item in enumerate(encoded):
+                text = item if isinstance(item, str) else json.dumps(item, indent=2)
+                spent += estimate_tokens(text)
+                if spent > self.token_budget:
+                    kept = i
+                    break
+
+        payload = {
+            "status": "success",
+            "count": kept,
+            "query_params": params,
+        }
+        if candidates and candidates > kept:
+            payload["candidates"] = candidates
+        if previously_seen:
+            payload["previously_seen"] = previously_seen
+        if kept < len(articles):
+            payload["omitted"] = len(articles) - kept
+
+        if self.fmt == "tsv":
+            payload["columns"] = columns
+            payload["articles"] = "\n".join(encoded[:kept])
+            return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+        if self.fmt == "compact":
+            payload["articles"] = projected[:kept]
+            return json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+        payload["articles"] = projected[:kept]
+        return json.dumps(payload, indent=2)
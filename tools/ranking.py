@@ -0,0 +1,174 @@
+"""
+Deterministic pre-ranking of fetched articles before LLM analysis
+"""
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+import math
+import re
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+STOPWORDS = {
+    "a", "about", "an", "and", "are", "as", "at", "be", "by", "find", "focus", "for", "from",
+    "get", "have", "i", "in", "into", "is", "it", "latest", "major", "me", "most", "news",
+    "of", "on", "or", "recent", "stories", "that", "the", "their", "this", "to", "want",
+    "what", "with",
+}
+
+# NewsData returns this placeholder instead of content on free plans
+PAID_CONTENT_PLACEHOLDER = "ONLY AVAILABLE IN PAID PLANS"
+
+# Credibility by NewsData source_id (unlisted sources score DEFAULT_CREDIBILITY)
+SOURCE_CREDIBILITY = {
+    "reuters": 1.0,
+    "apnews": 1.0,
+    "bbc": 0.95,
+    "nytimes": 0.95,
+    "theguardian": 0.9,
+    "washingtonpost": 0.9,
+    "wsj": 0.9,
+    "ft": 0.9,
+    "bloomberg": 0.9,
+    "npr": 0.9,
+    "economist": 0.9,
+    "nature": 0.95,
+    "sciencemag": 0.95,
+    "cnbc": 0.85,
+    "cnn": 0.8,
+    "techcrunch": 0.8,
+    "theverge": 0.8,
+    "wired": 0.8,
+    "arstechnica": 0.8,
+    "axios": 0.8,
+    "espn": 0.8,
+}
+DEFAULT_CREDIBILITY = 0.5
+
+DEFAULT_WEIGHTS = {
+    "relevance": 0.45,
+    "richness": 0.2,
+    "credibility": 0.2,
+    "recency": 0.15,
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric terms without stopwords"""
+    return [t for t in _TOKEN.findall((text or "").lower()) if t not in STOPWORDS]
+
+
+def _article_text(article: Dict[str, Any]) -> str:
+    """Searchable text of an article, with the title counted twice"""
+    content = article.get("content") or ""
+    if content.strip() == PAID_CONTENT_PLACEHOLDER:
+        content = ""
+    keywords = " ".join(article.get("keywords") or [])
+    title = article.get("title") or ""
+    return " ".join([title, title, article.get("description") or "", keywords, content])
+
+
+class ArticleRanker:
+    """Scores candidates on relevance (BM25), recency, richness and source credibility"""
+
+    def __init__(
+            self,
+            weights: Optional[Dict[str, float]] = None,
+            recency_half_life_hours: float = 48.0,
+            credibility: Optional[Dict[str, float]] = None,
+            k1: float = 1.5,
+            b: float = 0.75
+    ):
+        """
+        Args:
+            weights: Weight per signal (relevance, richness, credibility, recency)
+            recency_half_life_hours: Age at which the recency score halves
+            credibility: Credibility by source_id (default: SOURCE_CREDIBILITY)
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization
+        """
+        self.weights = weights or DEFAULT_WEIGHTS
+        self.recency_half_life_hours = recency_half_life_hours
+        self.credibility = SOURCE_CREDIBILITY if credibility is None else credibility
+        self.k1 = k1
+        self.b = b
+
+    def relevance(self, documents: List[List[str]], query: List[str]) -> List[float]:
+        """BM25 score of each tokenized document, scaled so the best match is 1.0"""
+        if not documents or not query:
+            return [0.0] * len(documents)
+
+        n = len(documents)
+        avg_len = sum(len(d) for d in documents) / n or 1.0
+        doc_freq = Counter(term for d in documents for term in set(d))
+        idf = {
+            term: math.log(1 + (n - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            for term in set(query)
+        }
+
+        scores = []
+        for doc in documents:
+            tf = Counter(doc)
+            norm = self.k1 * (1 - self.b + self.b * len(doc) / avg_len)
+            scores.append(sum(
+                idf[term] * tf[term] * (self.k1 + 1) / (tf[term] + norm)
+                for term in idf if tf[term]
+            ))
+
+        best = max(scores)
+        return [s / best if best else 0.0 for s in scores]
+
+    def recency(self, pub_date: str, now: datetime) -> float:
+        """Exponential decay by article age (NewsData dates are UTC)"""
+        try:
+            published = datetime.strptime(pub_date, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+        except (TypeError, ValueError):
+            return 0.0
+        age_hours = max(0.0, (now - published).total_seconds() / 3600)
+        return 0.5 ** (age_hours / self.recency_half_life_hours)
+
+    @staticmethod
+    def richness(article: Dict[str, Any]) -> float:
+        """Content depth plus presence of description, image and keywords"""
+        content = article.get("content") or ""
+        if content.strip() == PAID_CONTENT_PLACEHOLDER:
+            content = ""
+        return (
+            0.6 * min(len(content) / 2000.0, 1.0)
+            + 0.15 * bool(article.get("description"))
+            + 0.15 * bool(article.get("image_url"))
+            + 0.1 * bool(article.get("keywords"))
+        )
+
+    def score(self, articles: Sequence[Dict[str, Any]], query: str) -> List[float]:
+        """
+        Combined score of every candidate
+
+        Args:
+            articles: Structured articles from fetch_news
+            query: Text the articles should be relevant to
+
+        Returns:
+            One score in [0, 1] per article, in input order
+        """
+        now = datetime.now(timezone.utc)
+        relevance = self.relevance([tokenize(_article_text(a)) for a in articles], tokenize(query))
+        w = self.weights
+
+        return [
+            w["relevance"] * relevance[i]
+            + w["recency"] * self.recency(article.get("pub_date"), now)
+            + w["richness"] * self.richness(article)
+            + w["credibility"] * self.credibility.get(article.get("source_id") or "", DEFAULT_CREDIBILITY)
+            for i, article in enumerate(articles)
+        ]
+
+    def rank(self, articles: Sequence[Dict[str, Any]], query: str, top_k: int) -> List[Dict[str, Any]]:
+        """
+        Best top_k candidates, highest score first
+
+        Ties keep the order NewsData returned them in.
+        """
+        scores = self.score(articles, query)
+        order = sorted(range(len(articles)), key=lambda i: -scores[i])
+        return [articles[i] for i in order[:top_k]]
@@ -0,0 +1,220 @@
+"""
+Index of articles that earlier editions of a recurring topic have covered
+"""
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from tools.dedup import normalize_link
+from tools.news_cache import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+_SCHEMA = (
+    # One row per article key: editions and keys are 64-bit hashes, so a row is a few dozen bytes
+    "CREATE TABLE IF NOT EXISTS seen ("
+    " edition INTEGER NOT NULL,"
+    " key INTEGER NOT NULL,"
+    " seen_at REAL NOT NULL,"
+    " PRIMARY KEY (edition, key)) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS seen_age ON seen (seen_at)",
+    "CREATE TABLE IF NOT EXISTS editions ("
+    " name TEXT PRIMARY KEY,"
+    " last_run REAL NOT NULL)",
+)
+
+
+def _hash64(text: str) -> int:
+    """Signed 64-bit hash, the widest integer SQLite stores natively"""
+    return int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def article_keys(article: Dict[str, Any]) -> List[int]:
+    """
+    Keys an article is recognized by
+
+    One for its normalized link and one for the words of its title and
+    description, so a story republished under a new URL still matches.
+    """
+    keys = []
+    link = normalize_link(article.get("link", ""))
+    if link:
+        keys.append(_hash64(f"link:{link}"))
+    words = _WORD.findall(f"{article.get('title') or ''} {article.get('description') or ''}".lower())
+    if words:
+        keys.append(_hash64(f"text:{' '.join(words)}"))
+    return keys
+
+
+class SeenArticleIndex:
+    """
+    Per-edition record of covered articles, backed by SQLite
+
+    An edition is a named recurring run (e.g. "hourly-ai"). Articles are
+    remembered per edition together with the time of its last completed run,
+    which bounds the NewsData time window of the next one. Entries older than
+    max_age_seconds are evicted, and the oldest beyond max_entries with them.
+    """
+
+    def __init__(
+            self,
+            path: Optional[str] = None,
+            max_age_seconds: float = 14 * 86400,
+            max_entries: int = 200_000
+    ):
+        """
+        Initialize the index
+
+        Args:
+            path: SQLite file (None keeps the index in memory for the life of the process)
+            max_age_seconds: Time after an article was last covered at which it is forgotten
+            max_entries: Article keys kept; the least recently covered beyond it are evicted
+        """
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._stats = {"lookups": 0, "skipped": 0, "recorded": 0, "evictions": 0}
+
+        self.path = Path(path) if path else None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path or ":memory:"), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        with self._lock:
+            self._evict()
+
+    def last_run(self, edition: str) -> Optional[float]:
+        """Start time of the edition's last completed run, as a Unix timestamp"""
+        with self._lock:
+            row = self._db.execute("SELECT last_run FROM editions WHERE name = ?", (edition,)).fetchone()
+        return row[0] if row else None
+
+    def unseen(self, edition: str, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Articles the edition has not covered yet, in their original order
+
+        Args:
+            edition: Edition name
+            articles: Structured articles
+
+        Returns:
+            The articles none of whose keys are in the index
+        """
+        keys = {key for article in articles for key in article_keys(article)}
+        if not keys:
+            return list(articles)
+
+        edition_key = _hash64(edition)
+        with self._lock:
+            seen = set()
+            # Stay below SQLite's bound parameter limit
+            ordered = list(keys)
+            for start in range(0, len(ordered), 500):
+                chunk = ordered[start:start + 500]
+                seen.update(key for (key,) in self._db.execute(
+                    f"SELECT key FROM seen WHERE edition = ? AND key IN ({','.join('?' * len(chunk))})",
+                    (edition_key, *chunk)
+                ))
+
+            fresh = [article for article in articles if not seen.intersection(article_keys(article))]
+            self._stats["lookups"] += len(articles)
+            self._stats["skipped"] += len(articles) - len(fresh)
+        return fresh
+
+    def record(self, edition: str, started_at: float, articles: Iterable[Dict[str, Any]]) -> None:
+        """
+        Remember a completed run of an edition
+
+        Args:
+            edition: Edition name
+            started_at: Start of the run; the next run's time window begins here
+            articles: Articles the run covered
+        """
+        edition_key = _hash64(edition)
+        now = time.time()
+        rows = [(edition_key, key, now) for article in articles for key in article_keys(article)]
+
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany("INSERT OR REPLACE INTO seen (edition, key, seen_at) VALUES (?, ?, ?)", rows)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO editions (name, last_run) VALUES (?, ?)", (edition, started_at)
+                )
+                self._evict()
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._stats["recorded"] += len(rows)
+
+    def forget(self, edition: str) -> None:
+        """Drop an edition's history, so its next run starts from scratch"""
+        with self._lock:
+            self._db.execute("DELETE FROM seen WHERE edition = ?", (_hash64(edition),))
+            self._db.execute("DELETE FROM editions WHERE name = ?", (edition,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup counters and current index size"""
+        with self._lock:
+            stats = dict(self._stats)
+            (stats["entries"],) = self._db.execute("SELECT COUNT(*) FROM seen").fetchone()
+            (stats["editions"],) = self._db.execute("SELECT COUNT(*) FROM editions").fetchone()
+        return stats
+
+    def _evict(self) -> None:
+        """Drop entries past the age limit, then the oldest beyond max_entries (caller holds the lock)"""
+        cutoff = time.time() - self.max_age_seconds
+        evicted = self._db.execute("DELETE FROM seen WHERE seen_at < ?", (cutoff,)).rowcount
+        # An edition not run for that long starts over without a time window
+        self._db.execute("DELETE FROM editions WHERE last_run < ?", (cutoff,))
+
+        (count,) = self._db.execute("SELECT COUNT(*) FROM seen").fetchone()
+        if count > self.max_entries:
+            evicted += self._db.execute(
+                "DELETE FROM seen WHERE (edition, key) IN"
+                " (SELECT edition, key FROM seen ORDER BY seen_at ASC LIMIT ?)",
+                (count - self.max_entries,)
+            ).rowcount
+        if evicted:
+            self._stats["evictions"] += evicted
+            logger.debug(f"Evicted {evicted} seen-article entries")
+
+
+_seen_index: Optional[SeenArticleIndex] = None
+_seen_index_lock = threading.Lock()
+
+
+def get_seen_index() -> SeenArticleIndex:
+    """Process-wide seen-article index built from settings on first use"""
+    global _seen_index
+
+    if _seen_index is None:
+        with _seen_index_lock:
+            if _seen_index is None:
+                from config.settings import settings
+
+                path = None
+                if settings.SEEN_INDEX_PATH:
+                    path = Path(settings.SEEN_INDEX_PATH)
+                    if not path.is_absolute():
+                        path = PROJECT_ROOT / path
+
+                _seen_index = SeenArticleIndex(
+                    path=str(path) if path else None,
+                    max_age_seconds=settings.SEEN_INDEX_MAX_AGE_DAYS * 86400,
+                    max_entries=settings.SEEN_INDEX_MAX_ENTRIES
+                )
+                logger.info(f"Seen-article index ready (path={path}, max age={settings.SEEN_INDEX_MAX_AGE_DAYS}d)")
+    return _seen_index
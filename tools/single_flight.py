@@ -0,0 +1,143 @@
+"""
+Coalescing of concurrent identical upstream requests
+"""
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+import logging
+import threading
+import weakref
+
+from clients.tracing import annotate
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """An upstream call in flight, awaited by its followers"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Runs one upstream call per key at a time and fans the outcome out to every caller
+
+    Threads share one table of in-flight calls; coroutines share a table per
+    event loop. Whatever the leader returns or raises is handed to all
+    callers that arrived while it was running; if the leader is cancelled,
+    they get a RuntimeError rather than being cancelled with it.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Label used in log messages
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._loop_calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = {"calls": 0, "upstream_calls": 0, "coalesced": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Call fn unless an identical call is already running, then share its result
+
+        Args:
+            key: Identity of the request
+            fn: Performs the upstream request
+
+        Returns:
+            The result of the leader's call
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["upstream_calls"] += 1
+                leader = True
+
+        if not leader:
+            logger.info(f"Joined in-flight {self.name} request")
+            annotate(coalesced=True)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async variant of do() for coroutines on the same event loop
+
+        Args:
+            key: Identity of the request
+            fn: Coroutine function performing the upstream request
+
+        Returns:
+            The result of the leader's call
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            calls = self._loop_calls.setdefault(loop, {})
+            self._stats["calls"] += 1
+            future = calls.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                future = loop.create_future()
+                calls[key] = future
+                self._stats["upstream_calls"] += 1
+                leader = True
+
+        if not leader:
+            logger.info(f"Joined in-flight {self.name} request")
+            annotate(coalesced=True)
+            return await asyncio.shield(future)
+
+        try:
+            result = await fn()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # The leader's own timeout or disconnect: followers get an ordinary
+            # error for this call instead of a cancellation of their whole task
+            future.set_exception(RuntimeError(f"Coalesced {self.name} request cancelled"))
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so a leader-only failure does not log "never retrieved"
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Calls received, calls sent upstream and upstream calls saved by coalescing"""
+        with self._lock:
+            return dict(self._stats)
@@ -0,0 +1,51 @@
+"""
+Entry point for running many news gathering requests on a pool of worker processes
+"""
+from agents.workers import WorkerPool
+import argparse
+import json
+
+
+def parse_request(text):
+    """A request given as plain text or as a JSON object"""
+    return json.loads(text) if text.startswith("{") else text
+
+
+def read_requests(args):
+    """Requests from the command line, then one per line of --file"""
+    requests = [parse_request(text.strip()) for text in args.requests]
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            requests.extend(parse_request(line.strip()) for line in f if line.strip())
+    return requests
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run news gathering requests on worker processes")
+    parser.add_argument("requests", nargs="*", help="User requests")
+    parser.add_argument("--file", help="File with one request per line, as text or JSON objects")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: WORKER_PROCESSES or CPU cores)")
+    parser.add_argument("--threads", type=int, help="Concurrent runs per worker (default: WORKER_THREADS)")
+    parser.add_argument("--verbose", action="store_true", help="Print each run's full results")
+    args = parser.parse_args()
+
+    requests = read_requests(args)
+    if not requests:
+        parser.error("no requests given")
+
+    # Fork before anything opens clients in this process
+    with WorkerPool(workers=args.workers, threads=args.threads) as pool:
+        print(f"🚀 Running {len(requests)} request(s) on {pool.workers} worker(s) x {pool.threads} thread(s)\n")
+        batch = pool.run_batch(requests)
+        for result in batch:
+            if result["error"]:
+                print(f"❌ #{result['index']} {result['user_request']}: {result['error']}")
+            else:
+                count = len(result["state"].get("final_articles") or [])
+                print(f"✅ #{result['index']} {result['user_request']}: {count} articles "
+                      f"in {result['latency_seconds']:.2f}s")
+            if args.verbose and result["state"]:
+                from main import print_results
+                print_results(result["state"])
+
+        print(f"\n{json.dumps(batch.report(), indent=2)}")